@@ -19,6 +19,8 @@ class LabelCleaner:
     ordered_class_labels = None
     ordered_class_labels_transformed = None
     problem_type_transform = None
+    _class_labels_array = None  # original class labels indexed by internal label, computed on first use
+    _class_labels_uncleaned_array = None
 
     @staticmethod
     def construct(problem_type: str, y: Union[Series, np.ndarray, list], y_uncleaned: Union[Series, np.ndarray, list] = None, positive_class=None):
@@ -44,9 +46,40 @@ class LabelCleaner:
         y = self._convert_to_valid_series(y)
         return self._transform(y)
 
-    def inverse_transform(self, y: Union[Series, np.ndarray, list]) -> Series:
+    def inverse_transform(self, y: Union[Series, np.ndarray, list], as_pandas=True) -> Union[Series, np.ndarray]:
+        """
+        Converts the internal labels y to the original labels.
+        If `as_pandas=False`, returns a numpy array and, if y is a numpy array of valid internal labels, avoids constructing any pandas object.
+        """
+        if isinstance(y, np.ndarray):
+            y_inverse = self._inverse_transform_array(y)
+            if y_inverse is not None:
+                return y_inverse if not as_pandas else Series(y_inverse)
+        elif isinstance(y, Series):
+            y_inverse = self._inverse_transform_array(y.to_numpy())
+            if y_inverse is not None:
+                return Series(y_inverse, index=y.index, name=y.name) if as_pandas else y_inverse
         y = self._convert_to_valid_series(y)
-        return self._inverse_transform(y)
+        y = self._inverse_transform(y)
+        return y if as_pandas else y.to_numpy()
+
+    def _inverse_transform_array(self, y: np.ndarray) -> Union[np.ndarray, None]:
+        """ Converts the integer internal labels y to the original labels with a `take` from the class label array, returns None if y contains values other than valid internal labels. """
+        class_labels = self._get_class_labels_array()
+        if class_labels is None or y.dtype.kind not in 'iu' or len(y) == 0:
+            return None
+        if y.min() < 0 or y.max() >= len(class_labels):
+            return None
+        return class_labels.take(y)
+
+    def _get_class_labels_array(self) -> Union[np.ndarray, None]:
+        """ Returns an array of the original class labels indexed by their internal label, with the dtype `Series.map` would produce. Returns None if labels are not classes. """
+        if self._class_labels_array is None:
+            cat_mappings = getattr(self, 'cat_mappings_dependent_var', None)
+            if cat_mappings is None or set(cat_mappings.keys()) != set(range(len(cat_mappings))):
+                return None
+            self._class_labels_array = Series([cat_mappings[i] for i in range(len(cat_mappings))]).to_numpy()
+        return self._class_labels_array
 
     def _transform(self, y: Series) -> Series:
         raise NotImplementedError
@@ -127,14 +160,19 @@ class LabelCleanerMulticlass(LabelCleaner):
             y_transformed = y
         if as_pred:
             y_transformed = get_pred_from_proba(y_pred_proba=y_transformed, problem_type=MULTICLASS)
-            y_transformed = self._convert_to_valid_series(y_transformed)
-            y_transformed = y_transformed.map(self.cat_mappings_dependent_var_uncleaned)
-            if y_index is not None:
-                y_transformed.index = y_index
+            y_transformed = self._get_class_labels_uncleaned_array().take(y_transformed)
+            y_transformed = Series(y_transformed, index=y_index)
         if as_pandas and not as_pred:
             y_transformed = DataFrame(data=y_transformed, index=y_index, columns=self.ordered_class_labels, dtype=np.float32)
         return y_transformed
 
+    def _get_class_labels_uncleaned_array(self) -> np.ndarray:
+        """ Returns an array of the original class labels indexed by their position in `ordered_class_labels`. """
+        if self._class_labels_uncleaned_array is None:
+            cat_mappings = self.cat_mappings_dependent_var_uncleaned
+            self._class_labels_uncleaned_array = Series([cat_mappings[i] for i in range(len(cat_mappings))]).to_numpy()
+        return self._class_labels_uncleaned_array
+
     @staticmethod
     def _generate_categorical_mapping(y: Series) -> dict:
         categories = y.astype('category')
@@ -198,9 +236,7 @@ class LabelCleanerBinary(LabelCleaner):
                 y_index = y.index
                 y = y.to_numpy()
             y = get_pred_from_proba(y_pred_proba=y, problem_type=self.problem_type_transform)
-            y = self._convert_to_valid_series(y)
-            y = y.map(self.cat_mappings_dependent_var)
-            y = y.to_numpy()
+            y = self._get_class_labels_array().take(y)
             if as_pandas:
                 y = Series(data=y, index=y_index)
         return y
@@ -254,6 +290,9 @@ class LabelCleanerDummy(LabelCleaner):
     def __init__(self, problem_type=REGRESSION):
         self.problem_type_transform = problem_type
 
+    def _inverse_transform_array(self, y: np.ndarray) -> np.ndarray:
+        return y
+
     def _transform(self, y: Series) -> Series:
         return y
 
@@ -18,10 +18,14 @@ from ...features.feature_metadata import FeatureMetadata
 from ...features.types import R_CATEGORY, R_OBJECT, R_FLOAT, R_INT
 from ...scheduler import FIFOScheduler
 from ...task.base import BasePredictor
-from ...utils import get_cpu_count, get_pred_from_proba, normalize_pred_probas, infer_eval_metric, compute_permutation_feature_importance, compute_weighted_metric
+from ...utils import get_pred_from_proba, normalize_pred_probas, infer_eval_metric, compute_permutation_feature_importance, compute_weighted_metric
 from ...utils.exceptions import TimeLimitExceeded, NoValidFeatures
 from ...utils.loaders import load_pkl
+from ...utils.async_saver import get_async_saver
+from ...utils.model_cache import get_model_cache
 from ...utils.savers import save_json, save_pkl
+from ...utils.files import get_directory_size
+from ...utils.thread_utils import get_num_cpus_budget, limit_num_threads
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +78,12 @@ class AbstractModel:
     model_file_name = 'model.pkl'
     model_info_name = 'info.pkl'
     model_info_json_name = 'info.json'
+    # Name of the hyperparameter which controls the number of threads used by the underlying library of the model (such as 'n_jobs'), if any.
+    # If the user did not specify it, it is set to the model's CPU budget during fit via `_set_num_threads_param`.
+    _num_threads_param_name = None
+    # Set to True if the output of `preprocess` for a row does not depend on the data the model is fit on (beyond feature dtypes and metadata).
+    # Bagged ensembles of such models preprocess the full training data once and fit every fold model on row slices of it, see `_get_shared_fit_data`.
+    _fold_invariant_preprocess = False
 
     def __init__(self,
                  path: str,
@@ -402,7 +412,8 @@ class AbstractModel:
         """
         kwargs = self._preprocess_fit_args(**kwargs)
         if 'time_limit' not in kwargs or kwargs['time_limit'] is None or kwargs['time_limit'] > 0:
-            self._fit(**kwargs)
+            with limit_num_threads(kwargs.get('num_cpus', None)):
+                self._fit(**kwargs)
         else:
             logger.warning(f'\tWarning: Model has no time left to train, skipping model... (Time Left = {round(kwargs["time_limit"], 1)}s)')
             raise TimeLimitExceeded
@@ -455,10 +466,12 @@ class AbstractModel:
         """
         if normalize is None:
             normalize = self.normalize_pred_probas
-        y_pred_proba = self._predict_proba(X=X, **kwargs)
+        with limit_num_threads(self._get_num_cpus_infer()):
+            y_pred_proba = self._predict_proba(X=X, **kwargs)
         if normalize:
-            y_pred_proba = normalize_pred_probas(y_pred_proba, self.problem_type)
-        y_pred_proba = y_pred_proba.astype(np.float32)
+            # The output of _predict_proba is not shared with anything else, so it can be normalized in place
+            y_pred_proba = normalize_pred_probas(y_pred_proba, self.problem_type, inplace=True)
+        y_pred_proba = y_pred_proba.astype(np.float32, copy=False)
         return y_pred_proba
 
     def _predict_proba(self, X, **kwargs):
@@ -531,6 +544,7 @@ class AbstractModel:
             path = self.path
         file_path = path + self.model_file_name
         save_pkl.save(path=file_path, object=self, verbose=verbose)
+        get_model_cache().pop(file_path)
         return path
 
     @classmethod
@@ -794,11 +808,7 @@ class AbstractModel:
     #  Does not work if model is located in S3
     #  Does not work if called before model was saved to disk (Will output 0)
     def get_disk_size(self) -> int:
-        # Taken from https://stackoverflow.com/a/1392549
-        from pathlib import Path
-        model_path = Path(self.path)
-        model_disk_size = sum(f.stat().st_size for f in model_path.glob('**/*') if f.is_file())
-        return model_disk_size
+        return get_directory_size(self.path)
 
     # TODO: This results in a doubling of memory usage of the model to calculate its size.
     #  If the model takes ~40%+ of memory, this may result in an OOM error.
@@ -808,6 +818,14 @@ class AbstractModel:
         gc.collect()  # Try to avoid OOM error
         return sys.getsizeof(pickle.dumps(self, protocol=4))
 
+    def get_cache_size(self) -> int:
+        """
+        Returns the estimated size in bytes of the loaded model, used by the model cache (`autogluon.core.utils.ModelCache`).
+        This is the total size of the files in the model directory, as many models (such as neural networks) save their weights to files other than the model file.
+        Unlike `get_memory_size`, this does not require pickling the model.
+        """
+        return self.get_disk_size()
+
     # Removes non-essential objects from the model to reduce memory and disk footprint.
     # If `remove_fit=True`, enables the removal of variables which are required for fitting the model. If the model is already fully trained, then it is safe to remove these.
     # If `remove_info=True`, enables the removal of variables which are used during model.get_info(). The values will be None when calling model.get_info().
@@ -834,8 +852,12 @@ class AbstractModel:
         from pathlib import Path
         import shutil
         model_path = Path(self.path)
+        async_saver = get_async_saver()
+        if async_saver is not None:
+            async_saver.flush()  # Otherwise pending writes could recreate files of the model after it was deleted
         # TODO: Report errors?
         shutil.rmtree(path=model_path, ignore_errors=True)
+        get_model_cache().pop_dir(self.path)
 
     def get_info(self) -> dict:
         """
@@ -889,10 +911,46 @@ class AbstractModel:
 
         Models may want to override this if they depend heavily on GPUs, as the default sets num_gpus to 0.
         """
-        num_cpus = get_cpu_count()
+        num_cpus = get_num_cpus_budget()
         num_gpus = 0
         return num_cpus, num_gpus
 
+    def _get_num_cpus_infer(self) -> int:
+        """
+        Returns the number of CPUs the model is allowed to use during inference.
+        Equal to the `num_cpus` specified in `ag_args_fit` if specified, otherwise the process-wide CPU budget (refer to `autogluon.core.utils.set_num_cpus_budget`).
+        """
+        num_cpus = self.params_aux.get('num_cpus', 'auto')
+        if num_cpus == 'auto' or num_cpus is None:
+            num_cpus = get_num_cpus_budget()
+        return num_cpus
+
+    def _set_num_threads_param(self, params: dict, num_cpus) -> dict:
+        """
+        Sets the thread count hyperparameter of the underlying library (`self._num_threads_param_name`) in params to num_cpus,
+        unless the user explicitly specified a value for it. Should be called by models within `_fit` on the params used to construct the inner model.
+        """
+        if self._num_threads_param_name is None or num_cpus is None or num_cpus == 'auto':
+            return params
+        if self._num_threads_param_name not in self.nondefault_params:
+            params[self._num_threads_param_name] = num_cpus
+        return params
+
+    def _get_shared_fit_data(self, X, y, sample_weight=None):
+        """
+        Returns a model-specific data object built once from the full training data of a bagged ensemble, or None if the model does not support it.
+        When not None, the bagged ensemble passes it to the `_fit` of each fold model as the `shared_fit_data` kwarg
+        together with the `train_index` and `val_index` kwargs, so the model can slice the training and validation data of the fold from it
+        instead of recomputing it from X and X_val (for example a CatBoost Pool).
+
+        If `_fold_invariant_preprocess=True`, returns the output of `preprocess` on X by default. Any state `preprocess` sets is kept by the fold models, which are copies of this model.
+        The fold models are then fit with X=None and X_val=None, and must take their data from `shared_fit_data[train_index]` and `shared_fit_data[val_index]`.
+        Their out-of-fold predictions are computed from `shared_fit_data[val_index]` without preprocessing it again.
+        """
+        if self._fold_invariant_preprocess:
+            return self.preprocess(X)
+        return None
+
     # TODO: v0.1 Add reference link to all valid keys and their usage or keep full docs here and reference elsewhere?
     @classmethod
     def _get_default_ag_args(cls) -> dict:
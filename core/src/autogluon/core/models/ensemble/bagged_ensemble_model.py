@@ -9,8 +9,10 @@ import numpy as np
 import pandas as pd
 
 from ...constants import MULTICLASS, REGRESSION, SOFTCLASS, REFIT_FULL_SUFFIX
+from ...utils.async_saver import get_async_saver
 from ...utils.exceptions import TimeLimitExceeded
 from ...utils.loaders import load_pkl
+from ...utils.model_cache import get_model_cache
 from ...utils.savers import save_pkl
 from ...utils.utils import generate_kfold, _compute_fi_with_stddev
 
@@ -169,13 +171,16 @@ class BaggedEnsembleModel(AbstractModel):
             self._add_child_times_to_bag(model=model_base)
             return
 
-        # TODO: Preprocess data here instead of repeatedly
         kfolds = generate_kfold(X=X, y=y, n_splits=k_fold, stratified=self.is_stratified(), random_state=self._random_state, n_repeats=n_repeats)
+        shared_fit_data = model_base._get_shared_fit_data(X=X, y=y, sample_weight=sample_weight)
+        # If True, shared_fit_data is the preprocessed X and the fold models are fit and predict on row slices of it
+        fit_on_preprocessed = shared_fit_data is not None and model_base._fold_invariant_preprocess
 
         oof_pred_proba, oof_pred_model_repeats = self._construct_empty_oof(X=X, y=y)
 
         models = []
         folds_to_fit = fold_end - fold_start
+        time_fit_folds = 0  # Time spent in the fit calls of the finished folds, the rest of the elapsed time is per-fold overhead
         for j in range(n_repeat_start, n_repeats):  # For each n_repeat
             cur_repeat_count = j - n_repeat_start
             fold_start_n_repeat = fold_start + cur_repeat_count * k_fold
@@ -189,8 +194,12 @@ class BaggedEnsembleModel(AbstractModel):
                 time_elapsed = time.time() - time_start
                 if time_limit is not None:
                     time_left = time_limit - time_elapsed
-                    required_time_per_fold = time_left / folds_left
-                    time_limit_fold = required_time_per_fold * 0.8
+                    if folds_finished > 0:
+                        # Reserve the overhead observed on the finished folds (copying, out-of-fold prediction, saving) for each fold left
+                        time_overhead_per_fold = (time_elapsed - time_fit_folds) / folds_finished
+                        time_limit_fold = (time_left - time_overhead_per_fold * folds_left) / folds_left
+                    else:
+                        time_limit_fold = time_left / folds_left * 0.8
                     if folds_finished > 0:
                         expected_time_required = time_elapsed * folds_to_fit / folds_finished
                         expected_remaining_time_required = expected_time_required * folds_left / folds_to_fit
@@ -203,7 +212,10 @@ class BaggedEnsembleModel(AbstractModel):
 
                 time_start_fold = time.time()
                 train_index, val_index = fold
-                X_fold, X_val_fold = X.iloc[train_index, :], X.iloc[val_index, :]
+                if fit_on_preprocessed:
+                    X_fold, X_val_fold = None, None
+                else:
+                    X_fold, X_val_fold = X.iloc[train_index, :], X.iloc[val_index, :]
                 y_fold, y_val_fold = y.iloc[train_index], y.iloc[val_index]
                 fold_model = copy.deepcopy(model_base)
                 fold_model.name = f'{fold_model.name}S{j+1}F{fold_num_in_repeat+1}'  # S5F3 = 3rd fold of the 5th repeat set
@@ -212,6 +224,10 @@ class BaggedEnsembleModel(AbstractModel):
                 if sample_weight is not None:
                     kwargs_fold['sample_weight'] = sample_weight[train_index]
                     kwargs_fold['sample_weight_val'] = sample_weight[val_index]
+                if shared_fit_data is not None:
+                    kwargs_fold['shared_fit_data'] = shared_fit_data
+                    kwargs_fold['train_index'] = train_index
+                    kwargs_fold['val_index'] = val_index
                 fold_model.fit(X=X_fold, y=y_fold, X_val=X_val_fold, y_val=y_val_fold, time_limit=time_limit_fold, **kwargs_fold)
                 time_train_end_fold = time.time()
                 if time_limit is not None:  # Check to avoid unnecessarily predicting and saving a model when an Exception is going to be raised later
@@ -222,9 +238,13 @@ class BaggedEnsembleModel(AbstractModel):
                         expected_remaining_time_required = expected_time_required * (folds_left - 1) / folds_to_fit
                         if expected_remaining_time_required > time_left:
                             raise TimeLimitExceeded
-                pred_proba = fold_model.predict_proba(X_val_fold)
+                if fit_on_preprocessed:
+                    pred_proba = fold_model.predict_proba(shared_fit_data[val_index], preprocess_nonadaptive=False, preprocess_stateful=False)
+                else:
+                    pred_proba = fold_model.predict_proba(X_val_fold)
                 time_predict_end_fold = time.time()
                 fold_model.fit_time = time_train_end_fold - time_start_fold
+                time_fit_folds += fold_model.fit_time
                 fold_model.predict_time = time_predict_end_fold - time_train_end_fold
                 fold_model.val_score = fold_model.score_with_y_pred_proba(y=y_val_fold, y_pred_proba=pred_proba)
                 fold_model.reduce_memory_size(remove_fit=True, remove_info=False, requires_save=True)
@@ -268,7 +288,7 @@ class BaggedEnsembleModel(AbstractModel):
         for model in self.models[1:]:
             model = self.load_child(model)
             pred_proba += model.predict_proba(X=X, preprocess_nonadaptive=False, normalize=normalize)
-        pred_proba = pred_proba / len(self.models)
+        pred_proba /= len(self.models)
 
         return pred_proba
 
@@ -358,15 +378,19 @@ class BaggedEnsembleModel(AbstractModel):
 
         return fi_df
 
-    def load_child(self, model, verbose=False) -> AbstractModel:
+    def load_child(self, model, verbose=False, use_cache=True) -> AbstractModel:
+        """Loads the child model `model` if it is a name. If `use_cache=False`, the child is loaded from disk instead of shared through the model cache, which is required if it will be modified."""
         if isinstance(model, str):
             child_path = self.create_contexts(self.path + model + os.path.sep)
-            return self._child_type.load(path=child_path, verbose=verbose)
+            load_fn = lambda: self._child_type.load(path=child_path, verbose=verbose)
+            if not use_cache:
+                return load_fn()
+            return get_model_cache().load(child_path + self._child_type.model_file_name, load_fn, size_fn=lambda child: child.get_cache_size())
         else:
             return model
 
     def save_child(self, model, verbose=False):
-        child = self.load_child(model)
+        child = self.load_child(model, use_cache=False)
         child.set_contexts(self.path + child.name + os.path.sep)
         child.save(verbose=verbose)
 
@@ -496,7 +520,7 @@ class BaggedEnsembleModel(AbstractModel):
         if save_children:
             model_names = []
             for child in self.models:
-                child = self.load_child(child)
+                child = self.load_child(child, use_cache=False)
                 child.set_contexts(path + child.name + os.path.sep)
                 child.save(verbose=False)
                 model_names.append(child.name)
@@ -517,6 +541,9 @@ class BaggedEnsembleModel(AbstractModel):
     def reduce_memory_size(self, remove_fit_stack=False, remove_fit=True, remove_info=False, requires_save=True, reduce_children=False, **kwargs):
         super().reduce_memory_size(remove_fit=remove_fit, remove_info=remove_info, requires_save=requires_save, **kwargs)
         if remove_fit_stack:
+            async_saver = get_async_saver()
+            if async_saver is not None:
+                async_saver.flush()  # Pending writes of the files removed below would otherwise recreate them
             try:
                 os.remove(self.path + 'utils' + os.path.sep + self._oof_filename)
             except FileNotFoundError:
@@ -536,7 +563,7 @@ class BaggedEnsembleModel(AbstractModel):
                 pass
         if reduce_children:
             for model in self.models:
-                model = self.load_child(model)
+                model = self.load_child(model, use_cache=False)
                 model.reduce_memory_size(remove_fit=remove_fit, remove_info=remove_info, requires_save=requires_save, **kwargs)
                 if requires_save and self.low_memory:
                     self.save_child(model=model)
@@ -593,6 +620,12 @@ class BaggedEnsembleModel(AbstractModel):
 
         return info
 
+    def get_cache_size(self) -> int:
+        if self.models and isinstance(self.models[0], str):
+            # The children are not held by the bag, they are loaded separately through the model cache by `load_child`
+            return os.path.getsize(self.path + self.model_file_name)
+        return super().get_cache_size()
+
     def get_memory_size(self):
         models = self.models
         self.models = None
@@ -1,6 +1,7 @@
 import logging
 import time
 from collections import Counter
+from typing import List, Tuple
 
 import numpy as np
 
@@ -21,6 +22,7 @@ class EnsembleSelection:
             bagging: bool = False,
             tie_breaker: str = 'random',
             random_state: np.random.RandomState = None,
+            constraints: List[Tuple[List[dict], float]] = None,
     ):
         self.ensemble_size = ensemble_size
         self.problem_type = problem_type
@@ -35,6 +37,10 @@ class EnsembleSelection:
             self.random_state = random_state
         else:
             self.random_state = np.random.RandomState(seed=0)
+        # Optional budgets such as inference time or memory, as a list of (model_costs, max_cost) tuples.
+        # model_costs[i] is a dict of model name -> cost for every model required to compute predictions[i], including itself.
+        # The cost of an ensemble is the summed cost of the union of the models required by its members, so models shared by several members are counted once.
+        self.constraints = constraints
 
     def fit(self, predictions, labels, time_limit=None, identifiers=None, sample_weight=None):
         self.ensemble_size = int(self.ensemble_size)
@@ -72,9 +78,11 @@ class EnsembleSelection:
         #         trajectory.append(ensemble_performance)
         #     ensemble_size -= n_best
 
+        required_costs = [dict() for _ in (self.constraints or [])]  # For each constraint, the cost of each model required by the current ensemble
         time_start = time.time()
         for i in range(ensemble_size):
-            scores = np.zeros((len(predictions)))
+            candidates = self._get_feasible_candidates(num_models=len(predictions), required_costs=required_costs)
+            scores = np.full((len(predictions)), np.inf)
             s = len(ensemble)
             if s == 0:
                 weighted_ensemble_prediction = np.zeros(predictions[0].shape)
@@ -87,8 +95,8 @@ class EnsembleSelection:
 
                 weighted_ensemble_prediction = (s / float(s + 1)) * ensemble_prediction
             fant_ensemble_prediction = np.zeros(weighted_ensemble_prediction.shape)
-            for j, pred in enumerate(predictions):
-                fant_ensemble_prediction[:] = weighted_ensemble_prediction + (1. / float(s + 1)) * pred
+            for j in candidates:
+                fant_ensemble_prediction[:] = weighted_ensemble_prediction + (1. / float(s + 1)) * predictions[j]
                 scores[j] = self._calculate_regret(y_true=labels, y_pred_proba=fant_ensemble_prediction, metric=self.metric, sample_weight=sample_weight)
 
             all_best = np.argwhere(scores == np.nanmin(scores)).flatten()
@@ -110,6 +118,8 @@ class EnsembleSelection:
                         all_best = [index_map[index] for index in all_best_tiebreak]
 
             best = self.random_state.choice(all_best)
+            for (model_costs, _), costs in zip(self.constraints or [], required_costs):
+                costs.update(model_costs[best])
 
             ensemble.append(predictions[best])
             trajectory.append(scores[best])
@@ -141,6 +151,37 @@ class EnsembleSelection:
             self.train_score_ = trajectory[-1]
 
         logger.debug("Ensemble indices: "+str(self.indices_))
+        if self.constraints:
+            for k, (model_costs, max_cost) in enumerate(self.constraints):
+                costs = dict()
+                for index in self.indices_:
+                    costs.update(model_costs[index])
+                logger.log(15, f'Ensemble cost for constraint {k}: {sum(costs.values())} (max_cost={max_cost})')
+
+    def _get_feasible_candidates(self, num_models: int, required_costs: List[dict]) -> List[int]:
+        """
+        Returns the indices of the models which can be added to the current ensemble without exceeding any constraint.
+        If no model fits in the budget of an empty ensemble, returns the model with the smallest cost relative to the budgets so that an ensemble is always produced.
+        Afterwards, only models which do not increase the cost further can be added to such an ensemble.
+        """
+        if not self.constraints:
+            return list(range(num_models))
+        candidates = []
+        for j in range(num_models):
+            is_feasible = True
+            for (model_costs, max_cost), costs in zip(self.constraints, required_costs):
+                cost_new = sum({**costs, **model_costs[j]}.values())
+                if cost_new > max(max_cost, sum(costs.values())):
+                    is_feasible = False
+                    break
+            if is_feasible:
+                candidates.append(j)
+        if not candidates and not required_costs[0]:
+            cost_ratios = [max(sum(model_costs[j].values()) / max_cost if max_cost > 0 else np.inf for model_costs, max_cost in self.constraints) for j in range(num_models)]
+            cheapest = int(np.argmin(cost_ratios))
+            logger.warning(f'Warning: No model satisfies the ensemble cost constraints, using the model with the lowest cost relative to the constraints (index {cheapest}).')
+            candidates = [cheapest]
+        return candidates
 
     def _calculate_regret(self, y_true, y_pred_proba, metric, sample_weight=None):
         if metric.needs_pred:
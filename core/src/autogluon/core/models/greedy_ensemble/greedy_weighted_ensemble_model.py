@@ -20,7 +20,13 @@ class GreedyWeightedEnsembleModel(AbstractModel):
         self.weights_ = None
 
     def _set_default_params(self):
-        default_params = {'ensemble_size': 100}
+        default_params = {
+            'ensemble_size': 100,
+            # List of budgets the ensemble must satisfy, each a dict with keys 'name', 'max_cost' and 'base_model_costs'.
+            # 'base_model_costs' maps each base model name to a dict of model name -> cost for every model required to predict with the base model.
+            # Trainer.generate_weighted_ensemble sets this for inference time and memory budgets.
+            'cost_constraints': None,
+        }
         for param, val in default_params.items():
             self._set_default_param_value(param, val)
 
@@ -44,7 +50,11 @@ class GreedyWeightedEnsembleModel(AbstractModel):
             self.features = self._set_stack_columns(base_model_names=self.base_model_names)
         X = self.preprocess(X)
 
-        self.model = self.model_base(ensemble_size=self.params['ensemble_size'], problem_type=self.problem_type, metric=self.stopping_metric)
+        constraints = None
+        if self.params['cost_constraints']:
+            constraints = [([cost_constraint['base_model_costs'][base_model] for base_model in self.base_model_names], cost_constraint['max_cost'])
+                           for cost_constraint in self.params['cost_constraints']]
+        self.model = self.model_base(ensemble_size=self.params['ensemble_size'], problem_type=self.problem_type, metric=self.stopping_metric, constraints=constraints)
         self.model = self.model.fit(X, y, time_limit=time_limit, sample_weight=sample_weight)
         self.base_model_names, self.model.weights_ = self.remove_zero_weight_models(self.base_model_names, self.model.weights_)
         self.features = self._set_stack_columns(base_model_names=self.base_model_names)
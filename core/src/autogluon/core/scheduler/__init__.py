@@ -1,4 +1,5 @@
-from .import remote, resource
+# `remote` is not imported here as it depends on dask `distributed`, which is slow to import and only needed to run schedulers
+from . import resource
 from .resource import get_cpu_count, get_gpu_count
 
 # schedulers
@@ -1,6 +1,5 @@
 import multiprocessing as mp
 
-from autogluon.core.scheduler.remote import RemoteManager
 from autogluon.core.scheduler.resource import DistributedResourceManager
 
 
@@ -20,6 +19,7 @@ class TaskManagers(object):
     @property
     def remote_manager(self):
         if self._remote_manager is None:
+            from autogluon.core.scheduler.remote import RemoteManager
             self._remote_manager = RemoteManager()
         return self._remote_manager
 
@@ -6,9 +6,6 @@ import threading
 import numpy as np
 import multiprocessing as mp
 from ..utils import save, load, AutoGluonEarlyStop
-import distributed
-from distributed import Queue, Variable
-from distributed.comm.core import CommClosedError
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +34,7 @@ class DistStatusReporter(object):
     """
 
     def __init__(self, remote=None):
+        from distributed import Queue, Variable
         self._queue = Queue(client=remote)
         self._stop = Variable(client=remote)
         self._stop.set(False)
@@ -69,6 +67,7 @@ class DistStatusReporter(object):
             raise AutoGluonEarlyStop('Stopping!')
 
     def fetch(self, block=True):
+        from distributed.comm.core import CommClosedError
         try:
             kwargs = self._queue.get()
         except CommClosedError:
@@ -275,14 +274,16 @@ class Communicator(threading.Thread):
 
 class DistSemaphore(object):
     def __init__(self, value, remote=None):
+        from distributed import Queue
         self._queue = Queue(client=remote)
         for i in range(value):
             self._queue.put(1)
 
     def acquire(self):
+        from distributed.comm.core import CommClosedError
         try:
             _ = self._queue.get()
-        except distributed.comm.core.CommClosedError:
+        except CommClosedError:
             pass
 
     def release(self):
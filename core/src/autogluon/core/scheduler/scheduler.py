@@ -5,8 +5,6 @@ import sys
 from collections import OrderedDict
 from warnings import warn
 
-import distributed
-
 from .jobs import DistributedJobRunner
 from .managers import TaskManagers
 from .. import Task
@@ -119,6 +117,7 @@ class TaskScheduler(object):
     def join_jobs(self, timeout=None):
         """Wait all scheduled jobs to finish
         """
+        import distributed
         self._cleaning_tasks()
         for task_dict in self.scheduled_tasks:
             try:
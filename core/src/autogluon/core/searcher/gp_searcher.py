@@ -1,9 +1,6 @@
 import ConfigSpace as CS
 import multiprocessing as mp
 
-from .bayesopt.autogluon.searcher_factory import gp_fifo_searcher_factory, \
-    gp_multifidelity_searcher_factory, gp_fifo_searcher_defaults, \
-    gp_multifidelity_searcher_defaults
 from .searcher import BaseSearcher
 from ..utils.default_arguments import check_and_merge_defaults
 
@@ -118,6 +115,8 @@ class GPFIFOSearcher(BaseSearcher):
     def __init__(self, configspace, **kwargs):
         _gp_searcher = kwargs.get('_gp_searcher')
         if _gp_searcher is None:
+            # Imported here as the GP code depends on autograd, which is only needed once a GP searcher is used
+            from .bayesopt.autogluon.searcher_factory import gp_fifo_searcher_factory, gp_fifo_searcher_defaults
             kwargs['configspace'] = configspace
             _kwargs = check_and_merge_defaults(
                 kwargs, *gp_fifo_searcher_defaults(),
@@ -318,6 +317,8 @@ class GPMultiFidelitySearcher(BaseSearcher):
     def __init__(self, configspace, **kwargs):
         _gp_searcher = kwargs.get('_gp_searcher')
         if _gp_searcher is None:
+            # Imported here as the GP code depends on autograd, which is only needed once a GP searcher is used
+            from .bayesopt.autogluon.searcher_factory import gp_multifidelity_searcher_factory, gp_multifidelity_searcher_defaults
             kwargs['configspace'] = configspace
             _kwargs = check_and_merge_defaults(
                 kwargs, *gp_multifidelity_searcher_defaults(),
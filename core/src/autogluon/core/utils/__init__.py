@@ -15,3 +15,8 @@ from .custom_process import CustomProcess
 from .utils import *
 from .file_helper import *
 from .mo_hbo_utils import *
+from .thread_utils import *
+from .time_budget import *
+from .model_cache import *
+from .async_saver import *
+from .model_prefetcher import *
@@ -0,0 +1,174 @@
+import logging
+import os
+import pickle
+import queue
+import threading
+from contextlib import contextmanager
+
+from . import compression_utils
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    'AsyncSaver',
+    'async_saving',
+    'get_async_saver',
+    'set_async_save_options',
+]
+
+AG_ASYNC_SAVE_ENV_VAR = 'AG_ASYNC_SAVE'
+
+_async_save_options = dict(
+    enabled=os.environ.get(AG_ASYNC_SAVE_ENV_VAR, '1') != '0',
+    max_pending_bytes=2 ** 28,
+    compression_fn=None,
+)
+_async_saver = None  # AsyncSaver of the active `async_saving` context, None if no context is active
+
+
+class AsyncSaver:
+    """
+    Writes pickled objects to disk in a background thread, so that writing files overlaps with computation on the calling thread.
+
+    Objects are pickled on the calling thread when `save` is called, so they may be modified right after without affecting what is written.
+    Only the compression and the write to disk happen in the background, in the order of the `save` calls.
+    Files are written to a temporary file first and then renamed, so a file is either fully written or not present.
+
+    Parameters
+    ----------
+    max_pending_bytes : int, default = 2 ** 28
+        Maximum total size of the pickled objects waiting to be written. `save` blocks until enough pending writes have finished.
+    compression_fn : str, default = None
+        Compression to write the files with, one of [None, 'gzip', 'bz2', 'lzma']. The file name is not changed, `load_pkl.load` infers the compression when reading.
+    """
+    def __init__(self, max_pending_bytes: int = 2 ** 28, compression_fn: str = None):
+        if compression_fn not in compression_utils.get_compression_map():
+            raise ValueError(f'compression_fn={compression_fn} is not a valid compression_fn. Valid values: {list(compression_utils.get_compression_map().keys())}')
+        self.max_pending_bytes = max_pending_bytes
+        self.compression_fn = compression_fn
+        self._queue = queue.Queue()
+        self._pending = dict()  # path -> number of writes of path that have not finished
+        self._pending_bytes = 0
+        self._condition = threading.Condition()
+        self._error = None  # First exception raised by a background write, raised again on the calling thread
+        self._thread = threading.Thread(target=self._run, name='AsyncSaver', daemon=True)
+        self._thread.start()
+
+    def save(self, path: str, obj, verbose=True):
+        """Pickles `obj` and writes it to `path` in the background."""
+        self._raise_error()
+        if verbose:
+            logger.log(15, f'Saving {path} (async)')
+        data = pickle.dumps(obj, protocol=4)
+        with self._condition:
+            while self._pending_bytes > 0 and self._pending_bytes + len(data) > self.max_pending_bytes:
+                self._condition.wait()
+            self._pending[path] = self._pending.get(path, 0) + 1
+            self._pending_bytes += len(data)
+        self._queue.put((path, data))
+
+    def wait(self, path: str):
+        """Blocks until all pending writes of `path` are finished, so that it can be read."""
+        if path in self._pending:
+            with self._condition:
+                while path in self._pending:
+                    self._condition.wait()
+        self._raise_error()
+
+    def flush(self):
+        """Blocks until all pending writes are finished. Raises the exception of a failed write, if any."""
+        with self._condition:
+            while self._pending:
+                self._condition.wait()
+        self._raise_error()
+
+    def close(self):
+        """Finishes all pending writes and stops the background thread."""
+        try:
+            self.flush()
+        finally:
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            path, data = item
+            try:
+                self._write(path, data)
+            except Exception as err:
+                logger.error(f'Failed to save {path}: {err}')
+                if self._error is None:
+                    self._error = err
+            finally:
+                with self._condition:
+                    self._pending[path] -= 1
+                    if self._pending[path] == 0:
+                        del self._pending[path]
+                    self._pending_bytes -= len(data)
+                    self._condition.notify_all()
+
+    def _write(self, path: str, data: bytes):
+        path_dir = os.path.dirname(path)
+        if path_dir:
+            os.makedirs(path_dir, exist_ok=True)
+        path_tmp = path + '.tmp'
+        with compression_utils.get_compression_map()[self.compression_fn]['open'](path_tmp, 'wb') as f:
+            f.write(data)
+        os.replace(path_tmp, path)
+
+    def _raise_error(self):
+        if self._error is not None:
+            err = self._error
+            self._error = None
+            raise err
+
+
+def set_async_save_options(enabled: bool = None, max_pending_bytes: int = None, compression_fn: str = 'default'):
+    """
+    Sets the options of the `async_saving` contexts that are entered from now on, such as during `fit`.
+
+    Parameters
+    ----------
+    enabled : bool, default = None
+        Whether to write model files in the background during training. Enabled by default unless the `AG_ASYNC_SAVE` environment variable is '0'.
+        If None, the option is not changed.
+    max_pending_bytes : int, default = None
+        See `AsyncSaver`. If None, the option is not changed.
+    compression_fn : str, default = 'default'
+        See `AsyncSaver`. If 'default', the option is not changed.
+    """
+    if enabled is not None:
+        _async_save_options['enabled'] = enabled
+    if max_pending_bytes is not None:
+        _async_save_options['max_pending_bytes'] = max_pending_bytes
+    if compression_fn != 'default':
+        if compression_fn not in compression_utils.get_compression_map():
+            raise ValueError(f'compression_fn={compression_fn} is not a valid compression_fn. Valid values: {list(compression_utils.get_compression_map().keys())}')
+        _async_save_options['compression_fn'] = compression_fn
+
+
+def get_async_saver():
+    """Returns the AsyncSaver of the active `async_saving` context, or None if pickles are currently saved synchronously."""
+    return _async_saver
+
+
+@contextmanager
+def async_saving():
+    """
+    Context manager in which `save_pkl.save` writes local files in the background via an AsyncSaver, if enabled via `set_async_save_options`.
+    All writes are finished when the context exits. Entering the context while it is already active has no effect.
+    """
+    global _async_saver
+    if _async_saver is not None or not _async_save_options['enabled']:
+        yield
+        return
+    _async_saver = AsyncSaver(max_pending_bytes=_async_save_options['max_pending_bytes'], compression_fn=_async_save_options['compression_fn'])
+    try:
+        yield
+    finally:
+        saver = _async_saver
+        _async_saver = None
+        saver.close()
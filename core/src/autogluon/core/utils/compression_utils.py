@@ -22,6 +22,13 @@ compression_fn_map = {
     },
 }
 
+# First bytes of files written with each compression_fn
+compression_fn_magic_map = {
+    'gzip': b'\x1f\x8b',
+    'bz2': b'BZh',
+    'lzma': b'\xfd7zXZ\x00',
+}
+
 
 def get_validated_path(filename, compression_fn=None):
     if compression_fn is not None:
@@ -33,3 +40,13 @@ def get_validated_path(filename, compression_fn=None):
 
 def get_compression_map():
     return compression_fn_map
+
+
+def infer_compression_fn(path):
+    """Returns the compression_fn a file was written with based on its first bytes, or None if it is not compressed."""
+    with open(path, 'rb') as f:
+        header = f.read(6)
+    for compression_fn, magic in compression_fn_magic_map.items():
+        if header.startswith(magic):
+            return compression_fn
+    return None
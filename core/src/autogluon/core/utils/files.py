@@ -1,7 +1,6 @@
 import contextlib
 import os
 from pathlib import Path
-import requests
 import errno
 import shutil
 import hashlib
@@ -12,7 +11,7 @@ import tempfile
 
 logger = logging.getLogger(__name__)
 
-__all__ = ['unzip', 'download', 'mkdir', 'check_sha1', 'raise_num_file']
+__all__ = ['unzip', 'download', 'mkdir', 'check_sha1', 'raise_num_file', 'get_directory_size']
 
 def unzip(zip_file_path, root=os.path.expanduser('./')):
     """Unzips files located at `zip_file_path` into parent directory specified by `root`.
@@ -63,6 +62,7 @@ def download(url, path=None, overwrite=False, sha1_hash=None):
             os.makedirs(dirname)
 
         logger.info('Downloading %s from %s...'%(fname, url))
+        import requests
         r = requests.get(url, stream=True)
         if r.status_code != 200:
             raise RuntimeError("Failed downloading url %s"%url)
@@ -126,6 +126,12 @@ def mkdir(path):
             else:
                 raise
 
+def get_directory_size(path) -> int:
+    """Returns the total size in bytes of all files in the directory `path`, including its subdirectories.
+    """
+    # Taken from https://stackoverflow.com/a/1392549
+    return sum(f.stat().st_size for f in Path(path).glob('**/*') if f.is_file())
+
 def raise_num_file(nofile_atleast=4096):
     try:
         import resource as res
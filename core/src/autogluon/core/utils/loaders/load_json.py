@@ -0,0 +1,12 @@
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# TODO: Support S3 paths
+def load(path, verbose=True):
+    if verbose:
+        logger.log(15, 'Loading: %s' % path)
+    with open(path, 'r') as fp:
+        return json.load(fp)
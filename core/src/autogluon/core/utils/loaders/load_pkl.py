@@ -1,8 +1,9 @@
-import io, logging, pickle, boto3
+import io, logging, pickle
 
 from ..loaders import load_pointer
 from ...utils import s3_utils
 from ...utils import compression_utils
+from ...utils.async_saver import get_async_saver
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,7 @@ def load(path, format=None, verbose=True, **kwargs):
     elif format == 's3':
         if verbose: logger.log(15, 'Loading: %s' % path)
         s3_bucket, s3_prefix = s3_utils.s3_path_to_bucket_prefix(s3_path=path)
+        import boto3
         s3 = boto3.resource('s3')
         return pickle.loads(s3.Bucket(s3_bucket).Object(s3_prefix).get()['Body'].read())
 
@@ -30,6 +32,12 @@ def load(path, format=None, verbose=True, **kwargs):
 
     compression_fn_map = compression_utils.get_compression_map()
     validated_path = compression_utils.get_validated_path(path, compression_fn=compression_fn)
+    async_saver = get_async_saver()
+    if async_saver is not None:
+        async_saver.wait(validated_path)
+    if compression_fn is None:
+        # Files written by an AsyncSaver with compression keep their file name
+        compression_fn = compression_utils.infer_compression_fn(validated_path)
 
     if compression_fn_kwargs is None:
         compression_fn_kwargs = {}
@@ -56,6 +64,7 @@ def load_with_fn(path, pickle_fn, format=None, verbose=True):
     elif format == 's3':
         if verbose: logger.log(15, 'Loading: %s' % path)
         s3_bucket, s3_prefix = s3_utils.s3_path_to_bucket_prefix(s3_path=path)
+        import boto3
         s3 = boto3.resource('s3')
         # Has to be wrapped in IO buffer since s3 stream does not implement seek()
         buff = io.BytesIO(s3.Bucket(s3_bucket).Object(s3_prefix).get()['Body'].read())
@@ -1,4 +1,4 @@
-import boto3, os, pathlib, logging
+import os, pathlib, logging
 
 from . import load_pd
 from .. import s3_utils
@@ -8,6 +8,7 @@ logger = logging.getLogger(__name__)
 def list_bucket_s3(bucket):
     logger.log(15, 'Listing s3 bucket: '+str(bucket))
 
+    import boto3
     s3bucket = boto3.resource('s3')
     my_bucket = s3bucket.Bucket(bucket)
     files = []
@@ -21,6 +22,7 @@ def download(input_bucket, input_prefix, local_path):
     directory = os.path.dirname(local_path)
     pathlib.Path(directory).mkdir(parents=True, exist_ok=True)
 
+    import boto3
     s3 = boto3.resource('s3')
     s3.Bucket(input_bucket).download_file(input_prefix, local_path)
 
@@ -32,6 +34,7 @@ def list_bucket_prefix_s3(bucket, prefix):
 def list_bucket_prefix_suffix_s3(bucket, prefix, suffix=None, banned_suffixes=None):
     if banned_suffixes is None:
         banned_suffixes = []
+    import boto3
     s3 = boto3.resource('s3')
     my_bucket = s3.Bucket(bucket)
     prefix = prefix
@@ -52,6 +55,7 @@ def list_bucket_prefix_suffix_s3(bucket, prefix, suffix=None, banned_suffixes=No
 def list_bucket_prefix_suffix_contains_s3(bucket, prefix, suffix=None, banned_suffixes=None, contains=None):
     if banned_suffixes is None:
         banned_suffixes = []
+    import boto3
     s3 = boto3.resource('s3')
     my_bucket = s3.Bucket(bucket)
     prefix = prefix
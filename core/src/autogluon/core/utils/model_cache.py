@@ -0,0 +1,205 @@
+import logging
+import os
+import threading
+import time
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    'ModelCache',
+    'get_model_cache',
+    'set_model_cache_max_memory',
+]
+
+AG_MODEL_CACHE_MAX_MEMORY_ENV_VAR = 'AG_MODEL_CACHE_MAX_MEMORY'
+
+
+class ModelCache:
+    """
+    In-memory cache of models loaded from disk, shared by all predictors in a process.
+    Models are keyed by the path of their model file and are loaded through the cache by the Trainer (`load_model`) and by bagged ensembles (`load_child`),
+    so models that are not persisted are only unpickled from disk again if they were evicted.
+
+    The total size of the cached models is limited to `max_memory` bytes. The size of a model is estimated by `size_fn` (see `load`), by default the size of its model file.
+    Eviction uses the GreedyDual-Size policy: each model is prioritized by the time it took to load per byte, plus an offset which increases with each eviction,
+    so that models which were recently used or are slow to load relative to their size are kept, and large models which load quickly are evicted first.
+
+    The cache is meant for inference. Models returned by the cache are shared objects and must not be modified in place,
+    code which modifies a model (such as fitting it further) must load it without the cache.
+    Saving a model (`AbstractModel.save`) removes it from the cache.
+
+    Parameters
+    ----------
+    max_memory : int, default = 0
+        Maximum total size in bytes of the cached models. If 0, caching is disabled and every load reads from disk.
+    """
+    def __init__(self, max_memory: int = 0):
+        self.max_memory = max_memory
+        self._entries = dict()  # file path -> dict(model, size, load_time, priority, last_used)
+        self._memory_size = 0
+        self._num_uses = 0  # Counter to break ties between equal priorities in least recently used order
+        self._priority_offset = 0  # GreedyDual-Size "inflation" value: the priority of the last evicted model
+        self._lock = threading.Lock()
+        self._reset_stats()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_memory > 0
+
+    def load(self, file_path: str, load_fn: Callable, size_fn: Callable = None):
+        """
+        Returns the model saved at `file_path`, from the cache if present, else by calling `load_fn()` and caching the result.
+
+        Parameters
+        ----------
+        file_path : str
+            Path of the model file, used as the cache key.
+        load_fn : Callable
+            Function without arguments which loads the model from disk.
+        size_fn : Callable, default = None
+            Function which returns the estimated size in bytes of the loaded model passed to it, such as `AbstractModel.get_cache_size`.
+            Needed for models which keep part of their state in files other than `file_path`.
+            If None, the size of the file at `file_path` is used.
+        """
+        if not self.enabled:
+            return load_fn()
+        with self._lock:
+            entry = self._entries.get(file_path, None)
+            if entry is not None:
+                entry['priority'] = self._priority_offset + entry['load_time'] / entry['size']
+                entry['last_used'] = self._next_use()
+                self._hits += 1
+                self._load_time_saved += entry['load_time']
+                return entry['model']
+            self._misses += 1
+        time_start = time.time()
+        model = load_fn()
+        load_time = time.time() - time_start
+        try:
+            size = size_fn(model) if size_fn is not None else os.path.getsize(file_path)
+        except OSError:
+            return model
+        size = max(size, 1)
+        self._put(file_path, model=model, size=size, load_time=load_time)
+        return model
+
+    def pop(self, file_path: str):
+        """Removes the model saved at `file_path` from the cache, if present. Called whenever the model file is overwritten or deleted."""
+        if not self._entries:
+            return
+        with self._lock:
+            entry = self._entries.pop(file_path, None)
+            if entry is not None:
+                self._memory_size -= entry['size']
+
+    def pop_dir(self, path: str):
+        """Removes all models saved under the directory `path` from the cache, such as a bagged ensemble and its children."""
+        if not self._entries:
+            return
+        with self._lock:
+            for file_path in [file_path for file_path in self._entries if file_path.startswith(path)]:
+                self._memory_size -= self._entries.pop(file_path)['size']
+
+    def clear(self):
+        """Removes all models from the cache."""
+        with self._lock:
+            self._entries = dict()
+            self._memory_size = 0
+            self._priority_offset = 0
+
+    def set_max_memory(self, max_memory: int):
+        """Sets the maximum total size in bytes of the cached models, evicting models if the cache is now over budget. 0 disables caching."""
+        max_memory = int(max_memory)
+        if max_memory < 0:
+            raise ValueError(f'max_memory must be >= 0, but was {max_memory}')
+        with self._lock:
+            self.max_memory = max_memory
+            self._evict(size_required=0)
+
+    def get_stats(self) -> dict:
+        """
+        Returns statistics of the cache since it was created or `reset_stats` was last called:
+        hits, misses, evictions, the hit rate, the load time in seconds saved by hits, and the current number and total size in bytes of the cached models.
+        """
+        with self._lock:
+            num_loads = self._hits + self._misses
+            return dict(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                hit_rate=self._hits / num_loads if num_loads else None,
+                load_time_saved=self._load_time_saved,
+                num_models=len(self._entries),
+                memory_size=self._memory_size,
+                max_memory=self.max_memory,
+            )
+
+    def reset_stats(self):
+        with self._lock:
+            self._reset_stats()
+
+    def _reset_stats(self):
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._load_time_saved = 0
+
+    def _put(self, file_path: str, model, size: int, load_time: float):
+        with self._lock:
+            if size > self.max_memory:
+                return
+            entry_old = self._entries.pop(file_path, None)
+            if entry_old is not None:  # Loaded concurrently by another thread
+                self._memory_size -= entry_old['size']
+            self._evict(size_required=size)
+            self._entries[file_path] = dict(model=model, size=size, load_time=load_time, priority=self._priority_offset + load_time / size, last_used=self._next_use())
+            self._memory_size += size
+
+    def _next_use(self) -> int:
+        self._num_uses += 1
+        return self._num_uses
+
+    def _evict(self, size_required: int):
+        """Evicts models with the lowest priority until `size_required` more bytes fit in the cache. Must be called with the lock held."""
+        while self._entries and self._memory_size + size_required > self.max_memory:
+            file_path = min(self._entries, key=lambda key: (self._entries[key]['priority'], self._entries[key]['last_used']))
+            entry = self._entries.pop(file_path)
+            self._memory_size -= entry['size']
+            self._priority_offset = entry['priority']
+            self._evictions += 1
+            logger.log(15, f'Evicted model from cache: {file_path}')
+
+
+def _get_max_memory_env() -> int:
+    max_memory_env = os.environ.get(AG_MODEL_CACHE_MAX_MEMORY_ENV_VAR, None)
+    if max_memory_env:
+        try:
+            return max(0, int(max_memory_env))
+        except ValueError:
+            logger.warning(f'Warning: Ignoring invalid value for environment variable {AG_MODEL_CACHE_MAX_MEMORY_ENV_VAR}: {max_memory_env}')
+    return 0
+
+
+_model_cache = ModelCache(max_memory=_get_max_memory_env())
+
+
+def get_model_cache() -> ModelCache:
+    """Returns the process-wide model cache, see `ModelCache`."""
+    return _model_cache
+
+
+def set_model_cache_max_memory(max_memory: int = None):
+    """
+    Sets the maximum total size in bytes of the models kept in the process-wide model cache, shared by all predictors in this process.
+    Use this when a process serves several predictors whose models do not all fit in memory at once, instead of persisting all of them via `persist_models`.
+
+    Parameters
+    ----------
+    max_memory : int, default = None
+        Maximum size in bytes, or 0 to disable the cache.
+        If None, the limit is reset to the value of the `AG_MODEL_CACHE_MAX_MEMORY` environment variable if set, else 0.
+    """
+    if max_memory is None:
+        max_memory = _get_max_memory_env()
+    _model_cache.set_max_memory(max_memory)
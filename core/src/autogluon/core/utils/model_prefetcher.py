@@ -0,0 +1,68 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    'ModelPrefetcher',
+]
+
+
+class ModelPrefetcher:
+    """
+    Loads models in a background thread, so that loading the models required for inference overlaps with other work,
+    such as loading the rest of a predictor or preprocessing the first data to predict on.
+
+    Models are loaded in the order of `load_fns`, which should list the base models of a model before the model itself.
+    A model is returned by `pop`, which waits for the model if it is still being loaded.
+
+    Parameters
+    ----------
+    load_fns : Dict[str, Callable]
+        Ordered dictionary of model name -> function without arguments which loads the model.
+    """
+    def __init__(self, load_fns: Dict[str, Callable]):
+        self._load_fns = load_fns
+        self._models = dict()
+        self._load_times = dict()
+        self._pending = set(load_fns.keys())
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name='ModelPrefetcher', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        for name, load_fn in self._load_fns.items():
+            time_start = time.time()
+            try:
+                model = load_fn()
+            except Exception as err:
+                logger.log(15, f'Failed to prefetch model {name}, it will be loaded on demand instead: {err}')
+                model = None
+            with self._condition:
+                if model is not None:
+                    self._models[name] = model
+                self._load_times[name] = time.time() - time_start
+                self._pending.discard(name)
+                self._condition.notify_all()
+
+    def __contains__(self, name: str) -> bool:
+        with self._condition:
+            return name in self._pending or name in self._models
+
+    def pop(self, name: str):
+        """Returns the model `name`, waiting for it if it is still being loaded. Returns None if the model is not prefetched, failed to load or was already returned."""
+        with self._condition:
+            while name in self._pending:
+                self._condition.wait()
+            return self._models.pop(name, None)
+
+    def wait(self):
+        """Blocks until all models are loaded."""
+        self._thread.join()
+
+    def get_load_times(self) -> Dict[str, float]:
+        """Returns a dictionary of model name -> time in seconds it took to load the model, for the models loaded so far."""
+        with self._condition:
+            return dict(self._load_times)
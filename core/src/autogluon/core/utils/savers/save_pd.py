@@ -1,4 +1,4 @@
-import multiprocessing, os, boto3, json, logging
+import multiprocessing, os, json, logging
 from io import StringIO
 import numpy as np
 
@@ -44,6 +44,7 @@ def save(path, df, index=False, verbose=True, type=None, sep=',', compression='g
             buffer = StringIO()
             df.to_csv(buffer, index=index, sep=sep, header=header)
             bucket, prefix = s3_utils.s3_path_to_bucket_prefix(s3_path=path)
+            import boto3
             s3_resource = boto3.resource('s3')
             s3_resource.Object(bucket, prefix).put(Body=buffer.getvalue(), ACL='bucket-owner-full-control')
         if verbose:
@@ -1,8 +1,9 @@
 # TODO: Standardize / unify this code with ag.save()
-import os, pickle, tempfile, logging, boto3
+import os, pickle, tempfile, logging
 
 from ...utils import s3_utils
 from ...utils import compression_utils
+from ...utils.async_saver import get_async_saver
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,11 @@ def save(path, object, format=None, verbose=True, **kwargs):
     else:
         raise ValueError(f'compression_fn={compression_fn} is not a valid compression_fn. Valid values: {compression_fn_map.keys()}')
 
+    async_saver = get_async_saver()
+    if async_saver is not None and compression_fn is None and format is None and not s3_utils.is_s3_url(path):
+        async_saver.save(validated_path, object, verbose=verbose)
+        return
+
     pickle_fn = lambda o, buffer: pickle.dump(o, buffer, protocol=4)
     save_with_fn(validated_path, object, pickle_fn, format=format, verbose=verbose, compression_fn=compression_fn,
                  compression_fn_kwargs=compression_fn_kwargs)
@@ -47,6 +53,7 @@ def save_s3(path: str, obj, pickle_fn, verbose=True):
         f.seek(0)
 
         bucket, key = s3_utils.s3_path_to_bucket_prefix(path)
+        import boto3
         s3_client = boto3.client('s3')
         try:
             config = boto3.s3.transfer.TransferConfig()   # enable multipart uploading for files larger than 8MB
@@ -0,0 +1,141 @@
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    'get_available_cpu_count',
+    'get_num_cpus_budget',
+    'set_num_cpus_budget',
+    'limit_num_threads',
+]
+
+AG_NUM_CPUS_ENV_VAR = 'AG_NUM_CPUS'
+
+_num_cpus_budget = None  # Process-wide CPU budget set via set_num_cpus_budget(), None = not set
+# Thread pools are process-global, so the limits of all active limit_num_threads() calls (from any thread) are tracked together
+_thread_limit_lock = threading.Lock()
+_thread_limits_active = []  # Limits of all currently entered limit_num_threads() calls
+_thread_limit_applied = None  # Limit currently applied to the thread pools, None = original limits
+_thread_limit_originals = None  # Original limits to restore once no limit is active
+
+
+def get_available_cpu_count() -> int:
+    """Returns the number of CPUs this process is allowed to run on (respects CPU affinity / cgroup cpusets when available)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on all platforms (e.g. MacOS, Windows)
+        return multiprocessing.cpu_count()
+
+
+def set_num_cpus_budget(num_cpus=None):
+    """
+    Sets the number of CPUs that models in this process are allowed to use in total during fit and inference.
+    Each model hands this budget to its underlying library (LightGBM `num_threads`, XGBoost/scikit-learn `n_jobs`, CatBoost `thread_count`,
+    OpenMP/BLAS thread pools, PyTorch intra-op threads), so that several predictors on one host do not oversubscribe the CPUs.
+
+    Parameters
+    ----------
+    num_cpus : int, default = None
+        Number of CPUs to use. If None, the budget is reset to the value of the `AG_NUM_CPUS` environment variable if set, else all available CPUs.
+    """
+    global _num_cpus_budget
+    if num_cpus is not None:
+        num_cpus = int(num_cpus)
+        if num_cpus < 1:
+            raise ValueError(f'num_cpus must be >= 1, but was {num_cpus}')
+    _num_cpus_budget = num_cpus
+
+
+def get_num_cpus_budget() -> int:
+    """Returns the process-wide CPU budget, see `set_num_cpus_budget`."""
+    if _num_cpus_budget is not None:
+        return _num_cpus_budget
+    num_cpus_env = os.environ.get(AG_NUM_CPUS_ENV_VAR, None)
+    if num_cpus_env:
+        try:
+            return max(1, int(num_cpus_env))
+        except ValueError:
+            logger.warning(f'Warning: Ignoring invalid value for environment variable {AG_NUM_CPUS_ENV_VAR}: {num_cpus_env}')
+    return get_available_cpu_count()
+
+
+def _apply_thread_limit(num_threads):
+    """Applies `num_threads` to all native thread pools, or restores their original limits if None. Must be called while holding `_thread_limit_lock`."""
+    global _thread_limit_applied, _thread_limit_originals
+    if num_threads is None:
+        if _thread_limit_originals is not None:
+            for module_name, num_threads_og in _thread_limit_originals.items():
+                if module_name != 'threadpoolctl':
+                    _set_module_num_threads(module_name, num_threads_og)
+            if _thread_limit_originals['threadpoolctl'] is not None:
+                _thread_limit_originals['threadpoolctl'].restore_original_limits()
+        _thread_limit_originals = None
+        _thread_limit_applied = None
+        return
+
+    if num_threads != _thread_limit_applied:
+        try:
+            from threadpoolctl import threadpool_limits
+        except ImportError:
+            threadpool_limits = None
+        limiter = threadpool_limits(limits=num_threads) if threadpool_limits is not None else None
+        if _thread_limit_originals is None:
+            _thread_limit_originals = dict(threadpoolctl=limiter)
+    # Only adjust torch and faiss if they were already imported by a model, never import them here.
+    # They may be imported while a limit is already applied (e.g. by the model being fit), so they are checked on every call.
+    for module_name in ['torch', 'faiss']:
+        if module_name not in sys.modules:
+            continue
+        if module_name not in _thread_limit_originals:
+            _thread_limit_originals[module_name] = _get_module_num_threads(module_name)
+        elif num_threads == _thread_limit_applied:
+            continue
+        _set_module_num_threads(module_name, num_threads)
+    _thread_limit_applied = num_threads
+
+
+def _get_module_num_threads(module_name):
+    module = sys.modules[module_name]
+    return module.get_num_threads() if module_name == 'torch' else module.omp_get_max_threads()
+
+
+def _set_module_num_threads(module_name, num_threads):
+    module = sys.modules[module_name]
+    if module_name == 'torch':
+        module.set_num_threads(num_threads)
+    else:
+        module.omp_set_num_threads(num_threads)
+
+
+@contextmanager
+def limit_num_threads(num_threads):
+    """
+    Context manager which limits the threads used by native thread pools (OpenMP, BLAS, FAISS) and PyTorch intra-op parallelism to `num_threads`.
+    Original limits are restored once no call to `limit_num_threads` is active anymore.
+
+    These thread pools are shared by the whole process, so calls from different threads (e.g. models fit in parallel) are tracked together:
+    the strictest limit among all active calls is applied, and exiting a call re-applies the strictest of the remaining ones.
+    This is a no-op if `num_threads` is None or 'auto', or if it does not restrict the available CPUs, so it is cheap to nest.
+    """
+    if num_threads is None or num_threads == 'auto':
+        yield
+        return
+    num_threads = max(1, int(num_threads))
+    if num_threads >= get_available_cpu_count():
+        yield
+        return
+
+    with _thread_limit_lock:
+        _thread_limits_active.append(num_threads)
+        _apply_thread_limit(min(_thread_limits_active))
+    try:
+        yield
+    finally:
+        with _thread_limit_lock:
+            _thread_limits_active.remove(num_threads)
+            _apply_thread_limit(min(_thread_limits_active) if _thread_limits_active else None)
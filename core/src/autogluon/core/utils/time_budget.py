@@ -0,0 +1,126 @@
+import json
+import logging
+import math
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    'TimeBudgetPlanner',
+    'allocate_time_budget',
+]
+
+AG_FIT_COST_CACHE_ENV_VAR = 'AG_FIT_COST_CACHE_PATH'
+
+
+def allocate_time_budget(time_left: float, costs: List[Optional[float]], min_share: float = 0.5) -> float:
+    """
+    Returns the time limit of the first of `costs` (predicted costs in seconds), when `time_left` is split between all of `costs`.
+    Costs which are None (unknown) are assumed to be the median of the known costs, or all costs are treated as equal if none are known.
+    Calling this again with the actual time left after each item finished reallocates the time of items which finished early or late to the remaining items.
+
+    The share of `time_left` proportional to the predicted costs is only a soft target, as predicted costs can be far off and exceeding a time limit discards the item.
+    The first item gets at least the time left minus the predicted cost of the items after it, so that time the remaining items are not predicted to need is never held back,
+    and at least `min_share` of an equal split of `time_left`. The last item gets all of `time_left`.
+    """
+    costs_known = [cost for cost in costs if cost is not None]
+    if not costs_known:
+        return time_left / len(costs)
+    cost_default = float(np.median(costs_known))
+    costs = [cost if cost is not None else cost_default for cost in costs]
+    costs = [max(cost, 1e-6) for cost in costs]
+    time_share = time_left * costs[0] / sum(costs)
+    time_reserved = sum(costs[1:])
+    return min(time_left, max(time_share, time_left - time_reserved, time_left * min_share / len(costs)))
+
+
+class TimeBudgetPlanner:
+    """
+    Predicts the cost (fit + predict time) of training a model from the size of its training data, and splits time limits between models accordingly.
+
+    The cost of a model type is assumed to grow linearly with the number of cells (rows * columns) it is trained on.
+    The observed cost per million cells of each model type is recorded after every fit, and recent fits are weighted higher.
+    Model types which were never observed are predicted from `priors` (seconds per million cells),
+    rescaled by how much faster or slower the observed model types were compared to their priors, so that predictions from both are comparable on any hardware.
+
+    Parameters
+    ----------
+    path : str, default = None
+        Path of a JSON file to persist the observed costs in, so that future fits (of any predictor) can use them.
+        If None, the value of the `AG_FIT_COST_CACHE_PATH` environment variable is used if set, else costs are only kept in this object.
+    priors : dict, default = None
+        Dictionary of model type name -> expected seconds per million cells, used for model types without observations.
+    """
+    _max_weight_history = 4  # An observation is weighted at least 1 / (1 + _max_weight_history) in the recorded cost of its model type
+
+    def __init__(self, path: str = None, priors: Dict[str, float] = None):
+        if path is None:
+            path = os.environ.get(AG_FIT_COST_CACHE_ENV_VAR, None)
+        self.path = path
+        self.priors = priors if priors is not None else dict()
+        self._costs = dict()  # model type name -> dict(cost=seconds per million cells, count=number of observations)
+        if self.path is not None:
+            self._costs.update(self._load_costs(self.path))
+
+    def predict_cost(self, model_type: str, num_cells: float) -> Optional[float]:
+        """Returns the predicted cost in seconds of fitting a model of type `model_type` on `num_cells` cells, or None if unknown."""
+        if model_type in self._costs:
+            cost = self._costs[model_type]['cost']
+        elif model_type in self.priors:
+            cost = self.priors[model_type] * self._get_prior_scale()
+        else:
+            return None
+        return cost * num_cells / 1e6
+
+    def record(self, model_type: str, num_cells: float, time_taken: float):
+        """Records that fitting a model of type `model_type` on `num_cells` cells took `time_taken` seconds (fit + predict)."""
+        if not num_cells or time_taken is None or time_taken <= 0:
+            return
+        cost = time_taken / num_cells * 1e6
+        if model_type in self._costs:
+            cost_info = self._costs[model_type]
+            weight = min(cost_info['count'], self._max_weight_history)
+            # Average in log space, as costs of the same model type vary by orders of magnitude across datasets
+            cost = math.exp((math.log(cost_info['cost']) * weight + math.log(cost)) / (weight + 1))
+            count = cost_info['count'] + 1
+        else:
+            count = 1
+        self._costs[model_type] = dict(cost=cost, count=count)
+
+    def save(self):
+        """Persists the observed costs to `path`, merged with costs recorded in the meantime by other processes."""
+        if self.path is None:
+            return
+        costs = self._load_costs(self.path)
+        costs.update(self._costs)
+        path_tmp = f'{self.path}.{os.getpid()}.tmp'
+        try:
+            path_dir = os.path.dirname(self.path)
+            if path_dir:
+                os.makedirs(path_dir, exist_ok=True)
+            with open(path_tmp, 'w') as f:
+                json.dump(costs, f, indent=2)
+            os.replace(path_tmp, self.path)
+        except OSError as err:
+            logger.log(15, f'Failed to save fit cost cache to {self.path}: {err}')
+
+    def _get_prior_scale(self) -> float:
+        """Returns the median ratio of observed cost to prior cost over model types which have both."""
+        ratios = [self._costs[model_type]['cost'] / self.priors[model_type] for model_type in self._costs if self.priors.get(model_type, None)]
+        if not ratios:
+            return 1
+        return float(np.median(ratios))
+
+    @staticmethod
+    def _load_costs(path: str) -> dict:
+        if not os.path.exists(path):
+            return dict()
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as err:
+            logger.log(15, f'Ignoring invalid fit cost cache {path}: {err}')
+            return dict()
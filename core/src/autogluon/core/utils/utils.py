@@ -14,8 +14,6 @@ import pandas as pd
 import psutil
 import scipy.stats
 from pandas import DataFrame, Series
-from sklearn.model_selection import KFold, StratifiedKFold, RepeatedKFold, RepeatedStratifiedKFold
-from sklearn.model_selection import train_test_split
 
 from ..constants import BINARY, REGRESSION, MULTICLASS, SOFTCLASS
 from ..metrics import accuracy, root_mean_squared_error, Scorer
@@ -38,6 +36,7 @@ def get_gpu_count():
 
 
 def generate_kfold(X, y=None, n_splits=5, random_state=0, stratified=False, n_repeats=1):
+    from sklearn.model_selection import KFold, StratifiedKFold, RepeatedKFold, RepeatedStratifiedKFold
     # TODO: Add GroupKFold
     if stratified and (y is not None):
         if n_repeats > 1:
@@ -150,27 +149,36 @@ def shuffle_df_rows(X: DataFrame, seed=0, reset_index=True):
     return X_shuffled
 
 
-def normalize_binary_probas(y_predprob, eps):
-    """ Remaps the predicted probabilities to open interval (0,1) while maintaining rank order """
+def normalize_binary_probas(y_predprob, eps, inplace=False):
+    """ Remaps the predicted probabilities to open interval (0,1) while maintaining rank order. If `inplace=True`, float arrays are modified in place. """
     (pmin,pmax) = (eps, 1-eps)  # predicted probs outside this range will be remapped into (0,1)
     which_toobig = y_predprob > pmax
-    if np.sum(which_toobig) > 0:  # remap overly large probs
-        y_predprob = np.logical_not(which_toobig)*y_predprob + which_toobig*(1-(eps*np.exp(-(y_predprob-pmax))))
     which_toosmall = y_predprob < pmin
-    if np.sum(which_toosmall) > 0:  # remap overly small probs
-        y_predprob = np.logical_not(which_toosmall)*y_predprob + which_toosmall*eps*np.exp(-(pmin-y_predprob))
+    if not (which_toobig.any() or which_toosmall.any()):
+        return y_predprob
+    if y_predprob.dtype.kind != 'f':
+        y_predprob = y_predprob.astype(np.float64)
+    elif not inplace:
+        y_predprob = y_predprob.copy()
+    y_predprob[which_toobig] = 1 - (eps * np.exp(-(y_predprob[which_toobig] - pmax)))  # remap overly large probs
+    y_predprob[which_toosmall] = eps * np.exp(-(pmin - y_predprob[which_toosmall]))  # remap overly small probs
     return y_predprob
 
 
-def normalize_multi_probas(y_predprob, eps):
-    """ Remaps the predicted probabilities to lie in (0,1) where eps controls how far from 0 smallest class-probability lies """
+def normalize_multi_probas(y_predprob, eps, inplace=False):
+    """ Remaps the predicted probabilities to lie in (0,1) where eps controls how far from 0 smallest class-probability lies. If `inplace=True`, float arrays are modified in place. """
     min_predprob = np.min(y_predprob)
+    if min_predprob >= eps:
+        return y_predprob
+    if y_predprob.dtype.kind != 'f':
+        y_predprob = y_predprob.astype(np.float64)
+    elif not inplace:
+        y_predprob = y_predprob.copy()
     if min_predprob < 0:  # ensure nonnegative rows
         most_negative_rowvals = np.clip(np.min(y_predprob, axis=1), a_min=None, a_max=0)
-        y_predprob = y_predprob - most_negative_rowvals[:,None]
-    if min_predprob < eps:
-        y_predprob = np.clip(y_predprob, a_min=eps, a_max=None)  # ensure no entries < eps
-        y_predprob = y_predprob / y_predprob.sum(axis=1, keepdims=1)  # renormalize
+        y_predprob -= most_negative_rowvals[:, None]
+    np.clip(y_predprob, a_min=eps, a_max=None, out=y_predprob)  # ensure no entries < eps
+    y_predprob /= y_predprob.sum(axis=1, keepdims=True)  # renormalize
     return y_predprob
 
 
@@ -192,6 +200,8 @@ def default_holdout_frac(num_train_rows, hyperparameter_tune=False):
 def augment_rare_classes(X, label, threshold):
     """ Use this method when using certain eval_metrics like log_loss, for which no classes may be filtered out.
         This method will augment dataset with additional examples of rare classes.
+        Each rare class with n < threshold rows gets its first (threshold - n) % n rows followed by (threshold - n) // n copies of all its rows appended.
+        The rows to append are computed as positional indices from the label column alone, and X is indexed once with them.
     """
     class_counts = X[label].value_counts()
     class_counts_invalid = class_counts[class_counts < threshold]
@@ -199,38 +209,36 @@ def augment_rare_classes(X, label, threshold):
         logger.debug("augment_rare_classes did not need to duplicate any data from rare classes")
         return X
 
-    missing_classes = []
-    for clss, n_clss in class_counts_invalid.iteritems():
-        if n_clss == 0:
-            missing_classes.append(clss)
+    missing_classes = list(class_counts_invalid.index[class_counts_invalid == 0])
     if missing_classes:
         logger.warning(f'WARNING: Classes were found that have 0 training examples, and may lead to downstream issues. '
                        f'Consider either providing data for these classes or removing them from the class categories. '
                        f'These classes will be ignored: {missing_classes}')
-        class_counts_invalid = class_counts_invalid[~class_counts_invalid.index.isin(set(missing_classes))]
-
-    aug_df = None
-    for clss, n_clss in class_counts_invalid.iteritems():
-        n_toadd = threshold - n_clss
-        clss_df = X.loc[X[label] == clss]
-        if aug_df is None:
-            aug_df = clss_df[:0].copy()
-        duplicate_times = int(np.floor(n_toadd / n_clss))
-        remainder = n_toadd % n_clss
-        new_df = clss_df.copy()
-        new_df = new_df[:remainder]
-        while duplicate_times > 0:
-            logger.debug(f"Duplicating data from rare class: {clss}")
-            duplicate_times -= 1
-            new_df = new_df.append(clss_df.copy())
-        aug_df = aug_df.append(new_df.copy())
-
-    X = X.append(aug_df)
+        class_counts_invalid = class_counts_invalid[class_counts_invalid > 0]
+        if len(class_counts_invalid) == 0:
+            return X
+
+    # Positions of the rows of each rare class, grouped by class in the order of class_counts_invalid
+    row_rank = class_counts_invalid.index.get_indexer(X[label])
+    rare_rows = np.flatnonzero(row_rank >= 0)
+    rare_rows = rare_rows[np.argsort(row_rank[rare_rows], kind='stable')]
+
+    n_clss = class_counts_invalid.to_numpy()
+    n_toadd = threshold - n_clss
+    remainder = n_toadd % n_clss
+    clss_start = np.concatenate([[0], np.cumsum(n_clss)[:-1]])  # offset of each class in rare_rows
+    toadd_start = np.concatenate([[0], np.cumsum(n_toadd)[:-1]])  # offset of each class in the appended rows
+    # Position k of the rows appended for a class is its row k if k < remainder, else its row (k - remainder) % n_clss
+    k = np.arange(n_toadd.sum()) - np.repeat(toadd_start, n_toadd)
+    remainder_rep = np.repeat(remainder, n_toadd)
+    pos = np.where(k < remainder_rep, k, (k - remainder_rep) % np.repeat(n_clss, n_toadd))
+    aug_rows = rare_rows[np.repeat(clss_start, n_toadd) + pos]
+
+    X = X.iloc[np.concatenate([np.arange(len(X)), aug_rows])]
     class_counts = X[label].value_counts()
-    class_counts_invalid = class_counts[class_counts < threshold]
-    class_counts_invalid = class_counts_invalid[~class_counts_invalid.index.isin(set(missing_classes))]
+    class_counts_invalid = class_counts[(class_counts < threshold) & (class_counts > 0)]
     if len(class_counts_invalid) > 0:
-        raise RuntimeError("augment_rare_classes failed to produce enough data from rare classes")
+        raise AssertionError(f"augment_rare_classes failed to produce enough data from rare classes: {dict(class_counts_invalid)}")
     logger.log(15, "Replicated some data from rare classes in training set because eval_metric requires all classes")
     return X
 
@@ -246,7 +254,7 @@ def get_pred_from_proba_df(y_pred_proba, problem_type=BINARY):
 
 def get_pred_from_proba(y_pred_proba, problem_type=BINARY):
     if problem_type == BINARY:
-        y_pred = [1 if pred >= 0.5 else 0 for pred in y_pred_proba]
+        y_pred = (np.asarray(y_pred_proba) >= 0.5).astype(int)
     elif problem_type == REGRESSION:
         y_pred = y_pred_proba
     else:
@@ -255,6 +263,7 @@ def get_pred_from_proba(y_pred_proba, problem_type=BINARY):
 
 
 def generate_train_test_split(X: DataFrame, y: Series, problem_type: str, test_size: float = 0.1, random_state=0) -> (DataFrame, DataFrame, Series, Series):
+    from sklearn.model_selection import train_test_split
     if (test_size <= 0.0) or (test_size >= 1.0):
         raise ValueError("fraction of data to hold-out must be specified between 0 and 1")
 
@@ -277,13 +286,14 @@ def generate_train_test_split(X: DataFrame, y: Series, problem_type: str, test_s
     return X_train, X_test, y_train, y_test
 
 
-def normalize_pred_probas(y_predprob, problem_type, eps=1e-7):
+def normalize_pred_probas(y_predprob, problem_type, eps=1e-7, inplace=False):
     """ Remaps the predicted probabilities to ensure there are no zeros (needed for certain metrics like log-loss)
         and that no predicted probability exceeds [0,1] (eg. in distillation when classification is treated as regression).
         Args:
             y_predprob: 1D (for binary classification) or 2D (for multiclass) numpy array of predicted probabilities
             problem_type: We only consider normalization if the problem_type is one of: [BINARY, MULTICLASS, SOFTCLASS]
             eps: controls around how far from 0 remapped predicted probabilities should be (larger `eps` means predicted probabilities will lie further from 0).
+            inplace: if True, y_predprob is modified in place instead of copied when it is a float array that needs to be remapped.
     """
     if (problem_type == REGRESSION) and (len(y_predprob.shape) > 1) and (y_predprob.shape[1] > 1):
         problem_type = SOFTCLASS  # this was MULTICLASS problem converted to REGRESSION (as done in distillation)
@@ -291,12 +301,12 @@ def normalize_pred_probas(y_predprob, problem_type, eps=1e-7):
     if problem_type in [BINARY, REGRESSION]:
         if len(y_predprob.shape) > 1 and min(y_predprob.shape) > 1:
             raise ValueError(f"cannot call normalize_pred_probas with problem_type={problem_type} and y_predprob.shape=={y_predprob.shape}")
-        return normalize_binary_probas(y_predprob, eps)
+        return normalize_binary_probas(y_predprob, eps, inplace=inplace)
     elif problem_type in [MULTICLASS, SOFTCLASS]:  # clip all probs below at eps and then renormalize
         if len(y_predprob.shape) == 1:
-            return normalize_binary_probas(y_predprob, eps)
+            return normalize_binary_probas(y_predprob, eps, inplace=inplace)
         else:
-            return normalize_multi_probas(y_predprob, eps)
+            return normalize_multi_probas(y_predprob, eps, inplace=inplace)
     else:
         raise ValueError(f"Invalid problem_type")
 
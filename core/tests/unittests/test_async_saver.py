@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+from autogluon.core.utils import async_saver
+from autogluon.core.utils.loaders import load_pkl
+from autogluon.core.utils.savers import save_pkl
+
+
+def test_async_saving(tmp_path):
+    path = os.path.join(str(tmp_path), 'sub', 'obj.pkl')
+    obj = {'a': [1, 2, 3]}
+    with async_saver.async_saving():
+        saver = async_saver.get_async_saver()
+        assert saver is not None
+        save_pkl.save(path=path, object=obj)
+        obj['a'].append(4)  # Modifying the object after saving does not change what is written
+        assert load_pkl.load(path=path) == {'a': [1, 2, 3]}
+        save_pkl.save(path=path, object=obj)
+    assert async_saver.get_async_saver() is None
+    assert load_pkl.load(path=path) == {'a': [1, 2, 3, 4]}
+
+
+def test_async_saver_compression_and_errors(tmp_path):
+    path = os.path.join(str(tmp_path), 'obj.pkl')
+    saver = async_saver.AsyncSaver(max_pending_bytes=1, compression_fn='gzip')
+    try:
+        for i in range(5):
+            saver.save(path, i)
+        saver.flush()
+        assert load_pkl.load(path=path) == 4
+
+        path_invalid = os.path.join(path, 'obj.pkl')  # path is a file, so this can't be written
+        saver.save(path_invalid, 0)
+        with pytest.raises(OSError):
+            saver.flush()
+    finally:
+        saver.close()
+
+    with pytest.raises(ValueError):
+        async_saver.AsyncSaver(compression_fn='unknown')
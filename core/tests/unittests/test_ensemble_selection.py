@@ -0,0 +1,47 @@
+import numpy as np
+
+from autogluon.core.constants import REGRESSION
+from autogluon.core.metrics import mean_squared_error
+from autogluon.core.models.greedy_ensemble.ensemble_selection import EnsembleSelection
+
+
+def _get_predictions():
+    rng = np.random.RandomState(0)
+    labels = rng.normal(size=200)
+    # Model 0 is the most accurate, model 1 is less accurate, model 2 is the least accurate
+    predictions = [labels + rng.normal(scale=scale, size=200) for scale in [0.1, 0.5, 1.0]]
+    return predictions, labels
+
+
+def _fit(predictions, labels, constraints=None):
+    ensemble = EnsembleSelection(ensemble_size=20, problem_type=REGRESSION, metric=mean_squared_error, constraints=constraints)
+    return ensemble.fit(predictions=predictions, labels=labels)
+
+
+def test_ensemble_selection_without_constraints():
+    predictions, labels = _get_predictions()
+    ensemble = _fit(predictions, labels)
+    assert ensemble.weights_[0] == max(ensemble.weights_)
+
+
+def test_ensemble_selection_cost_constraint():
+    predictions, labels = _get_predictions()
+    # Model 0 is too expensive on its own
+    model_costs = [{'m0': 10}, {'m1': 2}, {'m2': 1}]
+    ensemble = _fit(predictions, labels, constraints=[(model_costs, 3)])
+    assert ensemble.weights_[0] == 0
+    assert ensemble.weights_[1] > 0
+
+    # Models 0 and 1 share base model 'base', which is only counted once
+    model_costs = [{'m0': 1, 'base': 5}, {'m1': 1, 'base': 5}, {'m2': 4}]
+    ensemble = _fit(predictions, labels, constraints=[(model_costs, 7)])
+    assert ensemble.weights_[2] == 0
+    assert ensemble.weights_[0] > 0
+
+
+def test_ensemble_selection_infeasible_constraint():
+    predictions, labels = _get_predictions()
+    # No model satisfies the budget, the cheapest model relative to the budget is used
+    model_costs = [{'m0': 10}, {'m1': 5}, {'m2': 8}]
+    ensemble = _fit(predictions, labels, constraints=[(model_costs, 1)])
+    assert list(ensemble.weights_) == [0, 1, 0]
@@ -0,0 +1,80 @@
+import os
+import time
+
+import pytest
+
+from autogluon.core.utils.model_cache import ModelCache
+
+
+def _write_file(path, size):
+    with open(path, 'wb') as f:
+        f.write(b'0' * size)
+    return path
+
+
+def test_model_cache_disabled(tmp_path):
+    cache = ModelCache(max_memory=0)
+    file_path = _write_file(os.path.join(str(tmp_path), 'a.pkl'), 10)
+    assert cache.load(file_path, lambda: object()) is not cache.load(file_path, lambda: object())
+    assert cache.get_stats()['num_models'] == 0
+
+
+def test_model_cache_hit_and_pop(tmp_path):
+    cache = ModelCache(max_memory=100)
+    file_path = _write_file(os.path.join(str(tmp_path), 'a.pkl'), 10)
+    model = cache.load(file_path, lambda: object())
+    assert cache.load(file_path, lambda: object()) is model
+    stats = cache.get_stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['memory_size'] == 10
+
+    cache.pop(file_path)
+    assert cache.load(file_path, lambda: object()) is not model
+    cache.pop_dir(str(tmp_path))
+    assert cache.get_stats()['num_models'] == 0
+
+
+def test_model_cache_eviction(tmp_path):
+    cache = ModelCache(max_memory=100)
+    path_a = _write_file(os.path.join(str(tmp_path), 'a.pkl'), 40)
+    path_b = _write_file(os.path.join(str(tmp_path), 'b.pkl'), 40)
+    path_c = _write_file(os.path.join(str(tmp_path), 'c.pkl'), 40)
+    path_large = _write_file(os.path.join(str(tmp_path), 'large.pkl'), 200)
+
+    def load_slow(value):
+        time.sleep(0.1)
+        return value
+
+    # b is evicted first as it is the fastest to reload
+    cache.load(path_a, lambda: load_slow('a'))
+    cache.load(path_b, lambda: 'b')
+    cache.load(path_c, lambda: load_slow('c'))
+    stats = cache.get_stats()
+    assert stats['evictions'] == 1
+    assert stats['memory_size'] == 80
+    assert cache.load(path_a, lambda: 'a2') == 'a'
+    assert cache.load(path_c, lambda: 'c2') == 'c'
+    assert cache.load(path_b, lambda: 'b2') == 'b2'
+
+    # Models larger than the budget are never cached
+    cache.load(path_large, lambda: 'large')
+    assert cache.get_stats()['memory_size'] <= 100
+
+    cache.set_max_memory(0)
+    assert cache.get_stats()['num_models'] == 0
+    with pytest.raises(ValueError):
+        cache.set_max_memory(-1)
+
+
+def test_model_cache_size_fn(tmp_path):
+    cache = ModelCache(max_memory=100)
+    # The model file is small, but the model keeps most of its state in other files
+    file_path = _write_file(os.path.join(str(tmp_path), 'a.pkl'), 10)
+    cache.load(file_path, lambda: 'a', size_fn=lambda model: 60)
+    assert cache.get_stats()['memory_size'] == 60
+
+    # Models whose estimated size exceeds the budget are not cached
+    file_path_b = _write_file(os.path.join(str(tmp_path), 'b.pkl'), 10)
+    cache.load(file_path_b, lambda: 'b', size_fn=lambda model: 200)
+    assert cache.get_stats()['num_models'] == 1
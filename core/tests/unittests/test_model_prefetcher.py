@@ -0,0 +1,27 @@
+import time
+
+from autogluon.core.utils import ModelPrefetcher
+
+
+def test_model_prefetcher():
+    def load_slow(value):
+        time.sleep(0.1)
+        return value
+
+    def load_error():
+        raise ValueError('missing model')
+
+    prefetcher = ModelPrefetcher(load_fns={
+        'a': lambda: load_slow('a'),
+        'b': load_error,
+        'c': lambda: load_slow('c'),
+    })
+    assert 'c' in prefetcher
+    assert prefetcher.pop('c') == 'c'  # Waits for the model to be loaded
+    assert 'c' not in prefetcher
+    assert prefetcher.pop('c') is None  # Models are only returned once
+    assert prefetcher.pop('b') is None  # Models which fail to load are loaded on demand by the caller
+    assert prefetcher.pop('unknown') is None
+    prefetcher.wait()
+    assert set(prefetcher.get_load_times()) == {'a', 'b', 'c'}
+    assert prefetcher.pop('a') == 'a'
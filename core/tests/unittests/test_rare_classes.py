@@ -0,0 +1,32 @@
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from autogluon.core.data.cleaner import CleanerMulticlass
+from autogluon.core.utils.utils import augment_rare_classes
+
+
+def _get_data():
+    label = pd.Series(['a', 'b', 'd', 'a', 'c', 'b', 'a', 'd', 'a', 'd', 'a'], dtype=pd.CategoricalDtype(['a', 'b', 'c', 'd', 'e']))
+    return pd.DataFrame({'label': label, 'x': range(11)}).set_axis([f'r{i}' for i in range(11)], axis=0)
+
+
+def test_augment_rare_classes():
+    X = _get_data()
+    X_aug = augment_rare_classes(X, label='label', threshold=5)
+    # 'a' already has 5 rows and 'e' has none, so neither is augmented.
+    # The rare classes are appended from the most to the least frequent, each with its first (5 - n) % n rows followed by (5 - n) // n copies of its rows.
+    rows_expected = list(range(11)) + [2, 7] + [1] + [1, 5] + [4, 4, 4, 4]
+    assert_frame_equal(X_aug, X.iloc[rows_expected])
+    assert X_aug['label'].value_counts().to_dict() == {'a': 5, 'b': 5, 'c': 5, 'd': 5, 'e': 0}
+
+
+def test_augment_rare_classes_none_rare():
+    X = _get_data()
+    assert_frame_equal(augment_rare_classes(X, label='label', threshold=1), X)
+
+
+def test_remove_classes():
+    X = _get_data()
+    X_valid = CleanerMulticlass.remove_classes(X, label='label', valid_classes=['a', 'd'])
+    assert_frame_equal(X_valid, X.iloc[[0, 2, 3, 6, 7, 8, 9, 10]])
+    assert CleanerMulticlass.remove_classes(X, label='label', valid_classes=['a', 'b', 'c', 'd']) is X
@@ -0,0 +1,73 @@
+import os
+import threading
+
+import pytest
+
+from autogluon.core.utils import thread_utils
+
+
+def test_num_cpus_budget():
+    try:
+        thread_utils.set_num_cpus_budget(3)
+        assert thread_utils.get_num_cpus_budget() == 3
+
+        thread_utils.set_num_cpus_budget(None)
+        os.environ[thread_utils.AG_NUM_CPUS_ENV_VAR] = '2'
+        assert thread_utils.get_num_cpus_budget() == 2
+        del os.environ[thread_utils.AG_NUM_CPUS_ENV_VAR]
+        assert thread_utils.get_num_cpus_budget() == thread_utils.get_available_cpu_count()
+
+        with pytest.raises(ValueError):
+            thread_utils.set_num_cpus_budget(0)
+    finally:
+        thread_utils.set_num_cpus_budget(None)
+        os.environ.pop(thread_utils.AG_NUM_CPUS_ENV_VAR, None)
+
+
+def test_limit_num_threads_nested(monkeypatch):
+    monkeypatch.setattr(thread_utils, 'get_available_cpu_count', lambda: 4)
+    with thread_utils.limit_num_threads(None):
+        assert thread_utils._thread_limit_applied is None
+    with thread_utils.limit_num_threads(2):
+        assert thread_utils._thread_limit_applied == 2
+        with thread_utils.limit_num_threads(1):
+            assert thread_utils._thread_limit_applied == 1
+        with thread_utils.limit_num_threads(4):
+            assert thread_utils._thread_limit_applied == 2
+        assert thread_utils._thread_limit_applied == 2
+    assert thread_utils._thread_limit_applied is None
+    assert thread_utils._thread_limit_originals is None
+
+
+def test_limit_num_threads_overlapping_threads(monkeypatch):
+    monkeypatch.setattr(thread_utils, 'get_available_cpu_count', lambda: 4)
+    entered_1 = threading.Event()
+    exit_1 = threading.Event()
+
+    def limit_1():
+        with thread_utils.limit_num_threads(1):
+            entered_1.set()
+            exit_1.wait()
+
+    thread = threading.Thread(target=limit_1)
+    with thread_utils.limit_num_threads(2):
+        thread.start()
+        entered_1.wait()
+        assert thread_utils._thread_limit_applied == 1
+    # The other thread's stricter limit stays applied even though the first call to be entered exited first
+    assert thread_utils._thread_limit_applied == 1
+    exit_1.set()
+    thread.join()
+    assert thread_utils._thread_limit_applied is None
+    assert thread_utils._thread_limits_active == []
+
+
+def test_limit_num_threads_module_imported_while_limited(monkeypatch):
+    monkeypatch.setattr(thread_utils, 'get_available_cpu_count', lambda: 4)
+    with thread_utils.limit_num_threads(1):
+        # Models import their backend (e.g. torch, faiss) inside the limit applied for their fit
+        torch = pytest.importorskip('torch')
+        num_threads_og = thread_utils._thread_limit_originals.get('torch', torch.get_num_threads())
+        with thread_utils.limit_num_threads(1):
+            assert torch.get_num_threads() == 1
+    assert torch.get_num_threads() == num_threads_og
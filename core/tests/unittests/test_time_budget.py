@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+from autogluon.core.utils import time_budget
+
+
+def test_allocate_time_budget():
+    # Split proportional to the predicted costs if they exceed the time left
+    assert time_budget.allocate_time_budget(100, [100, 300]) == pytest.approx(25)
+    assert time_budget.allocate_time_budget(100, [300]) == pytest.approx(100)
+    # Unknown costs are assumed to be the median of the known costs
+    assert time_budget.allocate_time_budget(100, [None, 200, 600]) == pytest.approx(100 * 400 / 1200)
+    # Without any known costs the time is split evenly
+    assert time_budget.allocate_time_budget(90, [None, None, None]) == pytest.approx(30)
+
+
+def test_allocate_time_budget_soft_target():
+    # Time the items after the first are not predicted to need is given to the first item, even if its predicted cost is tiny
+    assert time_budget.allocate_time_budget(15, [0.5, 2]) == pytest.approx(13)
+    # The first item gets at least min_share of an equal split
+    assert time_budget.allocate_time_budget(100, [1, 1000, 1000, 1000]) == pytest.approx(100 * 0.5 / 4)
+    assert time_budget.allocate_time_budget(100, [1, 1000], min_share=0) == pytest.approx(100 * 1 / 1001)
+    assert time_budget.allocate_time_budget(100, [10, 30]) == pytest.approx(70)
+    # Never more than the time left
+    assert time_budget.allocate_time_budget(10, [100, 1]) == pytest.approx(10 * 100 / 101)
+
+
+def test_time_budget_planner_predict_cost():
+    planner = time_budget.TimeBudgetPlanner(priors=dict(A=10, B=40))
+    assert planner.predict_cost('A', 2e6) == pytest.approx(20)
+    assert planner.predict_cost('C', 2e6) is None
+
+    # Observing A to be twice as slow as its prior also scales the prediction of B by 2
+    planner.record('A', 1e6, 20)
+    assert planner.predict_cost('A', 1e6) == pytest.approx(20)
+    assert planner.predict_cost('B', 1e6) == pytest.approx(80)
+
+    planner.record('C', 1e6, 5)
+    assert planner.predict_cost('C', 3e6) == pytest.approx(15)
+
+    # Repeated observations are averaged
+    planner.record('C', 1e6, 20)
+    assert 5 < planner.predict_cost('C', 1e6) < 20
+
+
+def test_time_budget_planner_save(tmp_path):
+    path = os.path.join(str(tmp_path), 'fit_cost.json')
+    planner = time_budget.TimeBudgetPlanner(path=path)
+    planner.record('A', 1e6, 20)
+    planner.save()
+
+    planner_other = time_budget.TimeBudgetPlanner(path=path)
+    assert planner_other.predict_cost('A', 1e6) == pytest.approx(20)
+    planner_other.record('B', 1e6, 5)
+    planner_other.save()
+
+    # Saving merges with the costs saved by other planners in the meantime
+    planner.save()
+    planner_loaded = time_budget.TimeBudgetPlanner(path=path)
+    assert planner_loaded.predict_cost('A', 1e6) == pytest.approx(20)
+    assert planner_loaded.predict_cost('B', 1e6) == pytest.approx(5)
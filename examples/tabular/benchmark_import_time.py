@@ -0,0 +1,77 @@
+""" Benchmarks the time it takes to import autogluon.tabular in a fresh interpreter, and which heavy dependencies the import loads """
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+# Dependencies which are only needed for specific features (S3 paths, distributed HPO, specific models) and should not be loaded by the import
+DEFERRED_MODULES = ['boto3', 'distributed', 'autograd', 'requests', 'mxnet', 'torch', 'fastai', 'lightgbm', 'catboost', 'xgboost', 'faiss']
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the import time of an AutoGluon module.')
+    parser.add_argument('--module', type=str, default='autogluon.tabular', help='module to import')
+    parser.add_argument('--repeats', type=int, default=5, help='number of fresh interpreters the import is timed in')
+    parser.add_argument('--top', type=int, default=15, help='number of top-level packages to show in the breakdown')
+    parser.add_argument('--max-seconds', type=float, default=None,
+                        help='if specified, exits with an error if the median import time exceeds this value or a deferred module is imported')
+    return parser.parse_args()
+
+
+def time_import(module):
+    """ Imports `module` in a fresh interpreter, returns the total import time in seconds, the self time in seconds per imported module and the set of imported modules """
+    code = f'import sys; import {module}; print(",".join(sys.modules))'
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    self_times = dict()
+    time_total = 0
+    for line in result.stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)', line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = int(match.group(1)), int(match.group(2)), match.group(3), match.group(4)
+        self_times[name] = self_us / 1e6
+        if len(indent) == 1:
+            time_total += cumulative_us / 1e6
+    modules = set(result.stdout.strip().split(','))
+    return time_total, self_times, modules
+
+
+def main():
+    args = parse_args()
+    times = []
+    self_times_per_package = defaultdict(list)
+    modules = set()
+    for _ in range(args.repeats):
+        time_total, self_times, modules = time_import(args.module)
+        times.append(time_total)
+        package_times = defaultdict(float)
+        for name, self_time in self_times.items():
+            package_times[name.split('.')[0]] += self_time
+        for package, package_time in package_times.items():
+            self_times_per_package[package].append(package_time)
+
+    time_median = statistics.median(times)
+    print(f'import {args.module}: median={time_median:.3f}s, min={min(times):.3f}s, max={max(times):.3f}s over {args.repeats} runs')
+    print(f'Top {args.top} top-level packages by median self time:')
+    package_medians = sorted(((statistics.median(t), p) for p, t in self_times_per_package.items()), reverse=True)
+    for package_time, package in package_medians[:args.top]:
+        print(f'\t{package_time:.3f}s\t{package}')
+
+    deferred_imported = [m for m in DEFERRED_MODULES if m in modules]
+    if deferred_imported:
+        print(f'WARNING: Deferred modules were imported: {deferred_imported}')
+    else:
+        print(f'No deferred modules were imported: {DEFERRED_MODULES}')
+
+    if args.max_seconds is not None:
+        if time_median > args.max_seconds:
+            sys.exit(f'Median import time {time_median:.3f}s exceeds --max-seconds={args.max_seconds}')
+        if deferred_imported:
+            sys.exit(f'Deferred modules were imported: {deferred_imported}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+""" Benchmarks the prediction latency of TabTransformerModel against the previous DataLoader based prediction path """
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from autogluon.core.constants import BINARY, REGRESSION
+from autogluon.tabular import TabularDataset, TabularPredictor
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark TabTransformer inference latency.')
+    parser.add_argument('--train-data', type=str, default='https://autogluon.s3.amazonaws.com/datasets/Inc/train.csv')
+    parser.add_argument('--test-data', type=str, default='https://autogluon.s3.amazonaws.com/datasets/Inc/test.csv')
+    parser.add_argument('--label', type=str, default='class')
+    parser.add_argument('--train-rows', type=int, default=5000, help='number of training rows used to fit the model')
+    parser.add_argument('--epochs', type=int, default=5, help='number of training epochs')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 100, 10000], help='number of rows per predict call')
+    parser.add_argument('--repeats', type=int, default=10, help='number of predict calls timed per batch size')
+    parser.add_argument('--path', type=str, default='ag_models_tt_benchmark/')
+    return parser.parse_args()
+
+
+def predict_proba_dataloader(model, X):
+    """ Previous prediction path of TabTransformerModel: builds a TabTransformerDataset and a torch DataLoader, and predicts batch by batch """
+    import torch
+    from torch.autograd import Variable
+
+    X = model.preprocess(X)
+    loader = X.build_loader(model.params['batch_size'], model.params['num_workers'])
+    model.model.eval()
+    softmax = torch.nn.Softmax(dim=1)
+    if model.problem_type == REGRESSION:
+        outputs = torch.zeros([len(loader.dataset), 1])
+    else:
+        outputs = torch.zeros([len(loader.dataset), model.num_classes])
+    iter = 0
+    for data, _ in loader:
+        with torch.no_grad():
+            data = Variable(data)
+            prob, _ = model.model(data)
+            batch_size = len(prob)
+            if model.problem_type != REGRESSION:
+                prob = softmax(prob)
+        outputs[iter:(iter + batch_size)] = prob
+        iter += batch_size
+    if model.problem_type == BINARY:
+        return outputs[:, 1].cpu().numpy()
+    elif model.problem_type == REGRESSION:
+        outputs = outputs.flatten()
+    return outputs.cpu().numpy()
+
+
+def time_predict(predict_fn, X, batch_size, repeats):
+    X_batch = X.sample(n=batch_size, replace=len(X) < batch_size, random_state=0)
+    predict_fn(X_batch)  # warm-up
+    time_start = time.time()
+    for _ in range(repeats):
+        predict_fn(X_batch)
+    return (time.time() - time_start) / repeats
+
+
+def main():
+    args = parse_args()
+    train_data = TabularDataset(args.train_data)
+    train_data = train_data.head(args.train_rows)
+    test_data = TabularDataset(args.test_data).drop(columns=[args.label])
+
+    predictor = TabularPredictor(label=args.label, path=args.path).fit(
+        train_data, hyperparameters={'TRANSF': {'epochs': args.epochs}}, ag_args_fit={'num_gpus': 0})
+    model = predictor._trainer.load_model(predictor.get_model_names()[0])
+    X = predictor._learner.transform_features(test_data)
+
+    variants = {
+        'dataloader (previous)': lambda X_batch: predict_proba_dataloader(model, X_batch),
+        'batched': dict(),
+        'batched + torchscript': dict(inference_torchscript=True),
+        'batched + int8': dict(inference_quantize=True),
+        'batched + int8 + torchscript': dict(inference_quantize=True, inference_torchscript=True),
+    }
+    pred_reference = predict_proba_dataloader(model, X)
+    results = []
+    for name, variant in variants.items():
+        if isinstance(variant, dict):
+            model.params.update(dict(inference_torchscript=False, inference_quantize=False))
+            model.params.update(variant)
+            model._inference_model = None
+            predict_fn = model.predict_proba
+        else:
+            predict_fn = variant
+        max_abs_diff = np.abs(predict_fn(X) - pred_reference).max()
+        for batch_size in args.batch_sizes:
+            latency = time_predict(predict_fn, X, batch_size=batch_size, repeats=args.repeats)
+            results.append(dict(variant=name, batch_size=batch_size, latency_ms=latency * 1000, max_abs_diff=max_abs_diff))
+    print(pd.DataFrame(results).pivot(index='variant', columns='batch_size', values='latency_ms').round(2))
+    print(pd.DataFrame(results).groupby('variant')['max_abs_diff'].first())
+
+
+if __name__ == '__main__':
+    main()
@@ -6,7 +6,6 @@ import numpy as np
 import pandas as pd
 import psutil
 from pandas import DataFrame, Series
-from sklearn.feature_selection import SelectKBest, f_classif, f_regression
 
 from autogluon.core.features.types import S_TEXT, S_TEXT_NGRAM
 
@@ -82,6 +81,7 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
            self.prefilter_tokens = False
 
         if self.prefilter_tokens:
+            from sklearn.feature_selection import SelectKBest, f_classif, f_regression
             scoring_function = f_classif if problem_type=='binary' else f_regression
             selector = SelectKBest(scoring_function, k=self.prefilter_token_count)
             selector.fit(X_out, y)
@@ -0,0 +1,2 @@
+"""This is the autogluon version file."""
+__version__ = '0.1.1b20261018'
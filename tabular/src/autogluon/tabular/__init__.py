@@ -1,8 +1,19 @@
 import logging
+import time
+
+_time_import_start = time.time()
 
 from autogluon.core.dataset import TabularDataset
 from autogluon.core.features.feature_metadata import FeatureMetadata
 
+_time_import_core = time.time()
+
 from .predictor import TabularPredictor
 
+# Time in seconds spent importing this package, see TabularPredictor.get_load_time_info
+_import_time_info = {
+    'autogluon.core': _time_import_core - _time_import_start,
+    'autogluon.tabular': time.time() - _time_import_core,
+}
+
 logging.basicConfig(format='%(message)s')  # just print message in logs
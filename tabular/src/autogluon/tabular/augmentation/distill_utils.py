@@ -1,7 +1,6 @@
 import logging, gc
 import numpy as np
 import pandas as pd
-from sklearn.neighbors import NearestNeighbors
 from autogluon.core.metrics import mean_squared_error
 from autogluon.core.constants import BINARY, MULTICLASS, REGRESSION
 from autogluon.core.features.feature_metadata import FeatureMetadata
@@ -59,7 +58,7 @@ def postprocess_augmented(X_aug, X):
     return X_aug.reset_index(drop=True, inplace=False)
 
 
-def spunge_augment(X, feature_metadata: FeatureMetadata, num_augmented_samples=10000, frac_perturb=0.1, continuous_feature_noise=0.1, **kwargs):
+def spunge_augment(X, feature_metadata: FeatureMetadata, num_augmented_samples=10000, frac_perturb=0.1, continuous_feature_noise=0.1, chunk_size=100000, **kwargs):
     """ Generates synthetic datapoints for learning to mimic teacher model in distillation
         via simplified version of MUNGE strategy (that does not require near-neighbor search).
 
@@ -67,44 +66,48 @@ def spunge_augment(X, feature_metadata: FeatureMetadata, num_augmented_samples=1
             num_augmented_samples: number of additional augmented data points to return
             frac_perturb: fraction of features/examples that are perturbed during augmentation. Set near 0 to ensure augmented sample distribution remains closer to real data.
             continuous_feature_noise: we noise numeric features by this factor times their std-dev. Set near 0 to ensure augmented sample distribution remains closer to real data.
+            chunk_size: maximum number of augmented data points generated at once, bounds the memory used by the intermediate perturbation masks.
     """
     if frac_perturb > 1.0:
         raise ValueError("frac_perturb must be <= 1")
     logger.log(20, f"SPUNGE: Augmenting training data with {num_augmented_samples} synthetic samples for distillation...")
-    num_feature_perturb = max(1, int(frac_perturb*len(X.columns)))
-    X_aug = pd.concat([X.iloc[[0]].copy()]*num_augmented_samples)
-    X_aug.reset_index(drop=True, inplace=True)
+    num_rows = len(X)
+    num_features = len(X.columns)
+    num_feature_perturb = max(1, int(frac_perturb*num_features))
     continuous_types = ['float', 'int']
-    continuous_featnames = feature_metadata.get_features(valid_raw_types=continuous_types)  # these features will have shuffled values with added noise
-
-    for i in range(num_augmented_samples): # hot-deck sample some features per datapoint
-        og_ind = i % len(X)
-        augdata_i = X.iloc[og_ind].copy()
-        num_feature_perturb_i = np.random.choice(range(1,num_feature_perturb+1))  # randomly sample number of features to perturb
-        cols_toperturb = np.random.choice(list(X.columns), size=num_feature_perturb_i, replace=False)
-        for feature in cols_toperturb:
-            feature_data = X[feature]
-            augdata_i[feature] = feature_data.sample(n=1).values[0]
-        X_aug.iloc[i] = augdata_i
-
-    for feature in X.columns:
-        if feature in continuous_featnames:
-            feature_data = X[feature]
-            aug_data = X_aug[feature]
-            noise = np.random.normal(scale=np.nanstd(feature_data)*continuous_feature_noise, size=num_augmented_samples)
-            mask = np.random.binomial(n=1, p=frac_perturb, size=num_augmented_samples)
-            aug_data = aug_data + noise*mask
-            X_aug[feature] = pd.Series(aug_data, index=X_aug.index)
-
-    return X_aug
-
-
-def munge_augment(X, feature_metadata: FeatureMetadata, num_augmented_samples=10000, perturb_prob=0.5, s=1.0, **kwargs):
+    continuous_featnames = set(feature_metadata.get_features(valid_raw_types=continuous_types))  # these features will have shuffled values with added noise
+    continuous_stds = {feature: np.nanstd(X[feature]) for feature in X.columns if feature in continuous_featnames}
+
+    X_aug_chunks = []
+    for chunk_start in range(0, num_augmented_samples, chunk_size):
+        chunk_end = min(chunk_start + chunk_size, num_augmented_samples)
+        num_rows_chunk = chunk_end - chunk_start
+        og_ind = np.arange(chunk_start, chunk_end) % num_rows
+        # hot-deck sample some features per datapoint
+        num_feature_perturb_chunk = np.random.randint(1, num_feature_perturb+1, size=num_rows_chunk)  # randomly sample number of features to perturb
+        perturb_mask = _sample_perturb_mask(num_feature_perturb_chunk, num_features=num_features)
+        X_aug_chunk = {}
+        for i, feature in enumerate(X.columns):
+            src_ind = np.where(perturb_mask[:, i], np.random.randint(0, num_rows, size=num_rows_chunk), og_ind)
+            aug_data = X[feature].array.take(src_ind)
+            if feature in continuous_featnames:
+                aug_data = np.asarray(aug_data)
+                noise = np.random.normal(scale=continuous_stds[feature]*continuous_feature_noise, size=num_rows_chunk)
+                mask = np.random.binomial(n=1, p=frac_perturb, size=num_rows_chunk)
+                aug_data = aug_data + noise*mask
+            X_aug_chunk[feature] = aug_data
+        X_aug_chunks.append(pd.DataFrame(X_aug_chunk, columns=X.columns))
+
+    return _concat_augmented_chunks(X_aug_chunks, X)
+
+
+def munge_augment(X, feature_metadata: FeatureMetadata, num_augmented_samples=10000, perturb_prob=0.5, s=1.0, chunk_size=100000, **kwargs):
     """ Uses MUNGE algorithm to generate synthetic datapoints for learning to mimic teacher model in distillation: https://www.cs.cornell.edu/~caruana/compression.kdd06.pdf
         Args:
             num_augmented_samples: number of additional augmented data points to return
             perturb_prob: probability of perturbing each feature during augmentation. Set near 0 to ensure augmented sample distribution remains closer to real data.
             s: We noise numeric features by their std-dev divided by this factor (inverse of continuous_feature_noise). Set large to ensure augmented sample distribution remains closer to real data.
+            chunk_size: maximum number of augmented data points generated at once, bounds the memory used by the intermediate perturbation masks.
     """
     from ..models.tabular_nn.tabular_nn_model import TabularNeuralNetModel
     nn_dummy = TabularNeuralNetModel(path='nn_dummy', name='nn_dummy', problem_type=REGRESSION, eval_metric=mean_squared_error,
@@ -114,11 +117,12 @@ def munge_augment(X, feature_metadata: FeatureMetadata, num_augmented_samples=10
                         num_dataloading_workers=0, impute_strategy=nn_dummy.params['proc.impute_strategy'],
                         max_category_levels=nn_dummy.params['proc.max_category_levels'], skew_threshold=nn_dummy.params['proc.skew_threshold'],
                         embed_min_categories=nn_dummy.params['proc.embed_min_categories'], use_ngram_features=nn_dummy.params['use_ngram_features'])
-    X_vector = processed_data.dataset._data[processed_data.vectordata_index].asnumpy()
+    X_vector = processed_data.dataset._data[processed_data.vectordata_index]
     processed_data = None
     nn_dummy = None
     gc.collect()
 
+    from sklearn.neighbors import NearestNeighbors
     neighbor_finder = NearestNeighbors(n_neighbors=2)
     neighbor_finder.fit(X_vector)
     neigh_dist, neigh_ind = neighbor_finder.kneighbors(X_vector)
@@ -131,26 +135,58 @@ def munge_augment(X, feature_metadata: FeatureMetadata, num_augmented_samples=10
     if perturb_prob > 1.0:
         raise ValueError("frac_perturb must be <= 1")
     logger.log(20, f"MUNGE: Augmenting training data with {num_augmented_samples} synthetic samples for distillation...")
-    X = X.copy()
-    X_aug = pd.concat([X.iloc[[0]].copy()]*num_augmented_samples)
-    X_aug.reset_index(drop=True, inplace=True)
+    num_rows = len(X)
+    num_features = len(X.columns)
     continuous_types = ['float', 'int']
-    continuous_featnames = feature_metadata.get_features(valid_raw_types=continuous_types)  # these features will have shuffled values with added noise
-    for col in continuous_featnames:
-        X_aug[col] = X_aug[col].astype(float)
-        X[col] = X[col].astype(float)
-
-    for i in range(num_augmented_samples):
-        og_ind = i % len(X)
-        augdata_i = X.iloc[og_ind].copy()
-        neighbor_i = X.iloc[neigh_ind[og_ind]].copy()
-        # dist_i = neigh_dist[og_ind]
-        cols_toperturb = np.random.choice(list(X.columns), size=np.random.binomial(X.shape[1], p=perturb_prob, size=1)[0], replace=False)
-        for col in cols_toperturb:
-            new_val = neighbor_i[col]
-            if col in continuous_featnames:
-                new_val += np.random.normal(scale=np.abs(augdata_i[col]-new_val)/s)
-            augdata_i[col] = new_val
-        X_aug.iloc[i] = augdata_i
-
+    continuous_featnames = set(feature_metadata.get_features(valid_raw_types=continuous_types))  # these features will have shuffled values with added noise
+    continuous_data = {feature: X[feature].to_numpy(dtype=float) for feature in X.columns if feature in continuous_featnames}
+
+    X_aug_chunks = []
+    for chunk_start in range(0, num_augmented_samples, chunk_size):
+        chunk_end = min(chunk_start + chunk_size, num_augmented_samples)
+        num_rows_chunk = chunk_end - chunk_start
+        og_ind = np.arange(chunk_start, chunk_end) % num_rows
+        neighbor_ind = neigh_ind[og_ind]
+        # each feature of a datapoint is swapped with the value of its nearest neighbor with probability perturb_prob
+        num_feature_perturb_chunk = np.random.binomial(num_features, p=perturb_prob, size=num_rows_chunk)
+        perturb_mask = _sample_perturb_mask(num_feature_perturb_chunk, num_features=num_features)
+        X_aug_chunk = {}
+        for i, feature in enumerate(X.columns):
+            perturb_mask_feature = perturb_mask[:, i]
+            if feature in continuous_featnames:
+                feature_data = continuous_data[feature]
+                og_data = feature_data[og_ind]
+                neighbor_data = feature_data[neighbor_ind]
+                noise = np.random.normal(size=num_rows_chunk) * (np.abs(og_data - neighbor_data) / s)
+                aug_data = np.where(perturb_mask_feature, neighbor_data + noise, og_data)
+            else:
+                src_ind = np.where(perturb_mask_feature, neighbor_ind, og_ind)
+                aug_data = X[feature].array.take(src_ind)
+            X_aug_chunk[feature] = aug_data
+        X_aug_chunks.append(pd.DataFrame(X_aug_chunk, columns=X.columns))
+
+    return _concat_augmented_chunks(X_aug_chunks, X)
+
+
+def _sample_perturb_mask(num_feature_perturb, num_features):
+    """ Returns boolean mask of shape (len(num_feature_perturb), num_features) in which row i has exactly num_feature_perturb[i] randomly chosen features set to True. """
+    num_rows = len(num_feature_perturb)
+    if num_rows == 0 or num_features == 0:
+        return np.zeros((num_rows, num_features), dtype=bool)
+    rand = np.random.rand(num_rows, num_features)
+    # A feature is perturbed if its random value is among the num_feature_perturb[i] smallest of its row
+    rand_sorted = np.sort(rand, axis=1)
+    thresholds = rand_sorted[np.arange(num_rows), np.clip(num_feature_perturb, 1, num_features) - 1]
+    return (rand <= thresholds[:, None]) & (num_feature_perturb > 0)[:, None]
+
+
+def _concat_augmented_chunks(X_aug_chunks, X):
+    """ Concatenates augmented chunks into a single DataFrame, restoring the category dtypes of X. """
+    if X_aug_chunks:
+        X_aug = pd.concat(X_aug_chunks, ignore_index=True)
+    else:
+        X_aug = X.iloc[:0].copy()
+    for feature in X.columns:
+        if isinstance(X[feature].dtype, pd.CategoricalDtype) and not isinstance(X_aug[feature].dtype, pd.CategoricalDtype):
+            X_aug[feature] = pd.Categorical(X_aug[feature], categories=X[feature].cat.categories)
     return X_aug
@@ -1,4 +1,3 @@
-import copy
 import json
 import logging
 import os
@@ -130,10 +129,7 @@ class AbstractLearner:
         raise NotImplementedError
 
     def predict_proba(self, X: DataFrame, model=None, as_pandas=True, as_multiclass=True, inverse_transform=True):
-        if as_pandas:
-            X_index = copy.deepcopy(X.index)
-        else:
-            X_index = None
+        X_index = X.index if as_pandas else None  # pandas Index objects are immutable
         y_pred_proba = self.load_trainer().predict_proba(self.transform_features(X), model=model)
         if inverse_transform:
             y_pred_proba = self.label_cleaner.inverse_transform_proba(y_pred_proba)
@@ -147,19 +143,14 @@ class AbstractLearner:
         return y_pred_proba
 
     def predict(self, X: DataFrame, model=None, as_pandas=True):
-        if as_pandas:
-            X_index = copy.deepcopy(X.index)
-        else:
-            X_index = None
+        X_index = X.index if as_pandas else None
         y_pred_proba = self.predict_proba(X=X, model=model, as_pandas=False, as_multiclass=False, inverse_transform=False)
         problem_type = self.label_cleaner.problem_type_transform or self.problem_type
         y_pred = get_pred_from_proba(y_pred_proba=y_pred_proba, problem_type=problem_type)
-        y_pred = self.label_cleaner.inverse_transform(pd.Series(y_pred))
+        # Decodes the labels with numpy, a pandas object is only constructed for the final output if as_pandas=True
+        y_pred = self.label_cleaner.inverse_transform(y_pred, as_pandas=False)
         if as_pandas:
-            y_pred.index = X_index
-            y_pred.name = self.label
-        else:
-            y_pred = y_pred.values
+            y_pred = pd.Series(data=y_pred, name=self.label, index=X_index)
         return y_pred
 
     def _validate_fit_input(self, X: DataFrame, **kwargs):
@@ -223,8 +214,8 @@ class AbstractLearner:
     # Fits _FULL models and links them in the stack so _FULL models only use other _FULL models as input during stacking
     # If model is specified, will fit all _FULL models that are ancestors of the provided model, automatically linking them.
     # If no model is specified, all models are refit and linked appropriately.
-    def refit_ensemble_full(self, model='all'):
-        return self.load_trainer().refit_ensemble_full(model=model)
+    def refit_ensemble_full(self, model='all', num_parallel_models=1):
+        return self.load_trainer().refit_ensemble_full(model=model, num_parallel_models=num_parallel_models)
 
     def fit_transform_features(self, X, y=None, **kwargs):
         if self.label in X:
@@ -309,18 +300,10 @@ class AbstractLearner:
 
         pred_time_test = {}
         # TODO: Add support for calculating pred_time_test_full for oracle_ensemble, need to copy graph from trainer and add oracle_ensemble to it with proper edges.
+        models_original = [model for model in model_pred_proba_dict.keys() if model in all_trained_models_original]
+        pred_time_test_full = trainer.get_models_attribute_full(attribute=pred_time_test_marginal, models=models_original)
         for model in model_pred_proba_dict.keys():
-            if model in all_trained_models_original:
-                base_model_set = trainer.get_minimum_model_set(model)
-                if len(base_model_set) == 1:
-                    pred_time_test[model] = pred_time_test_marginal[base_model_set[0]]
-                else:
-                    pred_time_test_full_num = 0
-                    for base_model in base_model_set:
-                        pred_time_test_full_num += pred_time_test_marginal[base_model]
-                    pred_time_test[model] = pred_time_test_full_num
-            else:
-                pred_time_test[model] = None
+            pred_time_test[model] = pred_time_test_full.get(model, None)
 
         scored_models = list(scores.keys())
         for model in all_trained_models:
@@ -7,6 +7,7 @@ from .rf.rf_model import RFModel
 from .xt.xt_model import XTModel
 from .knn.knn_model import KNNModel
 from .lr.lr_model import LinearModel
+from .lr.lr_sgd_model import LinearSGDModel
 from .tabular_nn.tabular_nn_model import TabularNeuralNetModel
 from .fastainn.tabular_nn_fastai import NNFastAiTabularModel
 from .fasttext.fasttext_model import FastTextModel
@@ -6,6 +6,7 @@ import sys
 import time
 import psutil
 import numpy as np
+import pandas as pd
 
 from autogluon.core.utils.exceptions import NotEnoughMemoryError, TimeLimitExceeded
 from autogluon.core.utils import try_import_catboost, try_import_catboostdev
@@ -27,6 +28,8 @@ class CatBoostModel(AbstractModel):
 
     Hyperparameter options: https://catboost.ai/docs/concepts/python-reference_parameters-list.html
     """
+    _num_threads_param_name = 'thread_count'
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._category_features = None
@@ -49,17 +52,42 @@ class CatBoostModel(AbstractModel):
         if self._category_features is None:
             self._category_features = list(X.select_dtypes(include='category').columns)
         if self._category_features:
-            X = X.copy()
+            X_nan_filled = dict()
             for category in self._category_features:
-                current_categories = X[category].cat.categories
+                # Fill missing values with the '__NaN__' category directly on the category codes, avoids a per-column fillna
+                feature = X[category].array
+                codes = feature.codes
+                is_nan = codes == -1
+                if not is_nan.any():
+                    continue
+                current_categories = feature.categories
                 if '__NaN__' in current_categories:
-                    X[category] = X[category].fillna('__NaN__')
+                    nan_code = current_categories.get_loc('__NaN__')
                 else:
-                    X[category] = X[category].cat.add_categories('__NaN__').fillna('__NaN__')
+                    nan_code = len(current_categories)
+                    current_categories = current_categories.append(pd.Index(['__NaN__']))
+                codes = np.where(is_nan, nan_code, codes)
+                X_nan_filled[category] = pd.Categorical.from_codes(codes, categories=current_categories)
+            if X_nan_filled:
+                X = X.copy(deep=False)
+                for category, feature in X_nan_filled.items():
+                    X[category] = feature
         return X
 
-    # TODO: Use Pool in preprocess, optimize bagging to do Pool.split() to avoid re-computing pool for each fold! Requires stateful + y
-    #  Pool is much more memory efficient, avoids copying data twice in memory
+    def _get_shared_fit_data(self, X, y, sample_weight=None):
+        """
+        Constructs a Pool of the full bagged training data once, which each fold model slices via `train_index` and `val_index`.
+        Avoids re-preprocessing the same data and re-hashing its categorical features into a new Pool for every fold.
+        """
+        if self.problem_type == SOFTCLASS or self.params.get('task_type', None) == 'GPU':
+            return None
+        try_import_catboost()
+        from catboost import Pool
+        X = self.preprocess(X)
+        cat_features = list(X.select_dtypes(include='category').columns)
+        # Note: The Pool is intentionally not quantized. Repeatedly training on slices of a quantized Pool with categorical features segfaults in catboost 0.24.
+        return Pool(data=X, label=y, cat_features=cat_features, weight=sample_weight)
+
     def _fit(self,
              X,
              y,
@@ -69,10 +97,14 @@ class CatBoostModel(AbstractModel):
              num_gpus=0,
              sample_weight=None,
              sample_weight_val=None,
+             shared_fit_data=None,
+             train_index=None,
+             val_index=None,
              **kwargs):
         try_import_catboost()
         from catboost import CatBoostClassifier, CatBoostRegressor, Pool
         params = self.params.copy()
+        params = self._set_num_threads_param(params, num_cpus=kwargs.get('num_cpus', None))
         if self.problem_type == SOFTCLASS:
             try_import_catboostdev()  # Need to first import catboost then catboost_dev not vice-versa.
             from catboost_dev import CatBoostClassifier, CatBoostRegressor, Pool
@@ -110,13 +142,22 @@ class CatBoostModel(AbstractModel):
                 logger.warning('\tWarning: Potentially not enough memory to safely train CatBoost model, roughly requires: %s GB, but only %s GB is available...' % (round(approx_mem_size_req / 1e9, 3), round(available_mem / 1e9, 3)))
 
         start_time = time.time()
-        X = self.preprocess(X)
-        cat_features = list(X.select_dtypes(include='category').columns)
-        X = Pool(data=X, label=y, cat_features=cat_features, weight=sample_weight)
+        if shared_fit_data is not None and (num_gpus != 0 or params.get('task_type', None) == 'GPU'):
+            shared_fit_data = None
+        if shared_fit_data is not None:
+            # Slice the Pool of the full bagged data constructed by `_get_shared_fit_data`
+            X = shared_fit_data.slice(train_index)
+        else:
+            X = self.preprocess(X)
+            cat_features = list(X.select_dtypes(include='category').columns)
+            X = Pool(data=X, label=y, cat_features=cat_features, weight=sample_weight)
 
         if X_val is not None:
-            X_val = self.preprocess(X_val)
-            X_val = Pool(data=X_val, label=y_val, cat_features=cat_features, weight=sample_weight_val)
+            if shared_fit_data is not None:
+                X_val = shared_fit_data.slice(val_index)
+            else:
+                X_val = self.preprocess(X_val)
+                X_val = Pool(data=X_val, label=y_val, cat_features=cat_features, weight=sample_weight_val)
             eval_set = X_val
             if num_rows_train <= 10000:
                 modifier = 1
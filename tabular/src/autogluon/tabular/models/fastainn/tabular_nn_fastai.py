@@ -6,6 +6,7 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+from pandas.api.types import is_categorical_dtype
 from autogluon.core.constants import REGRESSION, BINARY, MULTICLASS
 from autogluon.core.utils import try_import_fastai_v1
 from autogluon.core.utils.files import make_temp_directory
@@ -335,33 +336,93 @@ class NNFastAiTabularModel(AbstractModel):
         return objective_func_name_to_monitor
 
     def _predict_proba(self, X, **kwargs):
-        from fastai.basic_data import DatasetType
-        from fastai.tabular import TabularList
-        from fastai.utils.mod_display import progress_disabled_ctx
-
         X = self.preprocess(X, **kwargs)
-
-        single_row = len(X) == 1
-        # fastai has issues predicting on a single row, duplicating the row as a workaround
-        if single_row:
-            X = pd.concat([X, X]).reset_index(drop=True)
-
-        # Copy cat_columns and cont_columns because TabularList is mutating the list
-        self.model.data.add_test(TabularList.from_df(
-            X, cat_names=self.cat_columns.copy(), cont_names=self.cont_columns.copy(), procs=self.procs))
-        with progress_disabled_ctx(self.model) as model:
-            preds, _ = model.get_preds(ds_type=DatasetType.Test)
-        if single_row:
-            preds = preds[:1, :]
+        preds = self._predict_tensors(X)
         if self.problem_type == REGRESSION:
             if self.y_scaler is not None:
-                return self.y_scaler.inverse_transform(preds.numpy()).reshape(-1)
+                return self.y_scaler.inverse_transform(preds).reshape(-1)
             else:
-                return preds.numpy().reshape(-1)
+                return preds.reshape(-1)
         if self.problem_type == BINARY:
-            return preds[:, 1].numpy()
+            return preds[:, 1]
         else:
-            return preds.numpy()
+            return preds
+
+    def _get_inference_arrays(self, X: pd.DataFrame):
+        """
+        Applies the fitted fastai procs (FillMissing, Categorify, Normalize) of the learner to the preprocessed X with vectorized NumPy operations,
+        and returns the categorical codes and continuous values in the order expected by the fastai TabularModel.
+        Equivalent to adding X as the test set of the learner's DataBunch, without building fastai item lists.
+        """
+        from fastai.tabular import FillMissing, Categorify, Normalize
+        tabular_list = self.model.data.train_ds.x
+        procs = {type(proc): proc for proc in tabular_list.processor[0].procs}
+        cat_names = tabular_list.cat_names
+        cont_names = tabular_list.cont_names
+        num_rows = len(X)
+
+        fill_missing = procs.get(FillMissing, None)
+        normalize = procs.get(Normalize, None)
+        na_flags = dict()
+        cont_values = np.empty((num_rows, len(cont_names)), dtype=np.float32)
+        for i, name in enumerate(cont_names):
+            values = X[name].to_numpy(dtype=np.float64)
+            if fill_missing is not None and name in fill_missing.na_dict:
+                is_na = np.isnan(values)
+                if fill_missing.add_col:
+                    na_flags[name + '_na'] = is_na
+                values = np.where(is_na, fill_missing.na_dict[name], values)
+            if normalize is not None:
+                values = (values - normalize.means[name]) / (1e-7 + normalize.stds[name])
+            cont_values[:, i] = values
+
+        categorify = procs[Categorify]
+        cat_codes = np.empty((num_rows, len(cat_names)), dtype=np.int64)
+        for i, name in enumerate(cat_names):
+            categories = categorify.categories[name]
+            if name in na_flags:
+                codes = categories.get_indexer(na_flags[name])
+            elif is_categorical_dtype(X[name].dtype):
+                # Map the codes of X to the codes of the categories seen during fit, missing values and unseen categories map to -1
+                code_map = np.append(categories.get_indexer(X[name].cat.categories), -1)
+                codes = code_map[X[name].cat.codes.to_numpy()]
+            else:
+                codes = categories.get_indexer(X[name])
+            cat_codes[:, i] = codes + 1  # fastai reserves code 0 for missing values and unseen categories
+        return cat_codes, cont_values
+
+    def _predict_tensors(self, X: pd.DataFrame, batch_size=10000) -> np.ndarray:
+        """Predicts X by calling the underlying torch module of the learner directly on batches of `batch_size` rows, returns activated outputs."""
+        import torch
+
+        if len(X) == 0:
+            return np.zeros((0, self.model.data.c), dtype=np.float32)
+        cat_codes, cont_values = self._get_inference_arrays(X)
+        model = self.model.model
+        model.eval()
+        device = next(model.parameters()).device
+        activ = self._get_output_activation()
+        preds = []
+        with torch.no_grad():
+            for start in range(0, len(X), batch_size):
+                x_cat = torch.from_numpy(cat_codes[start:start + batch_size]).to(device)
+                x_cont = torch.from_numpy(cont_values[start:start + batch_size]).to(device)
+                out = model(x_cat, x_cont)
+                if activ is not None:
+                    out = activ(out)
+                preds.append(out.cpu().numpy())
+        return np.concatenate(preds)
+
+    def _get_output_activation(self):
+        """
+        Returns the activation which converts the outputs of the network into predictions, or None if the outputs are used as is.
+        Both classification losses used by this model (fastai's default CrossEntropyFlat and LabelSmoothingCrossEntropy) are computed on logits,
+        so classification outputs are normalized with softmax. Regression outputs are used as is.
+        """
+        if self.problem_type in [BINARY, MULTICLASS]:
+            import torch
+            return partial(torch.softmax, dim=-1)
+        return None
 
     def save(self, path: str = None, verbose=True) -> str:
         self._load_model = self.model is not None
@@ -4,7 +4,6 @@ import numpy as np
 import math
 import psutil
 import time
-from sklearn.neighbors import KNeighborsClassifier, KNeighborsRegressor
 
 from autogluon.core.constants import REGRESSION
 from autogluon.core.utils.exceptions import NotEnoughMemoryError
@@ -22,11 +21,15 @@ class KNNModel(AbstractModel):
     """
     KNearestNeighbors model (scikit-learn): https://scikit-learn.org/stable/modules/generated/sklearn.neighbors.KNeighborsClassifier.html
     """
+    _num_threads_param_name = 'n_jobs'
+    _fold_invariant_preprocess = True
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._model_type = self._get_model_type()
 
     def _get_model_type(self):
+        from sklearn.neighbors import KNeighborsClassifier, KNeighborsRegressor
         if self.problem_type == REGRESSION:
             return KNeighborsRegressor
         else:
@@ -64,19 +67,26 @@ class KNNModel(AbstractModel):
              y,
              time_limit=None,
              sample_weight=None,
+             shared_fit_data=None,
+             train_index=None,
              **kwargs):
         time_start = time.time()
-        X = self.preprocess(X)
+        if shared_fit_data is not None:
+            # Bagged fold model, slice the rows of the fold from the data preprocessed once by `_get_shared_fit_data`
+            X = shared_fit_data[train_index]
+        else:
+            X = self.preprocess(X)
         self._validate_fit_memory_usage(X=X)  # TODO: Can incorporate this into samples, can fit on portion of data to satisfy memory instead of raising exception immediately
         if sample_weight is not None:  # TODO: support
             logger.log(15, "sample_weight not yet supported for KNNModel, this model will ignore them in training.")
 
+        params = self._set_num_threads_param(self.params.copy(), num_cpus=kwargs.get('num_cpus', None))
         num_rows_max = len(X)
         # FIXME: v0.1 Must store final num rows for refit_full or else will use everything! Worst case refit_full could train far longer than the original model.
         if time_limit is None or num_rows_max <= 10000:
-            self.model = self._model_type(**self.params).fit(X, y)
+            self.model = self._model_type(**params).fit(X, y)
         else:
-            self.model = self._fit_with_samples(X=X, y=y, time_limit=time_limit - (time.time() - time_start))
+            self.model = self._fit_with_samples(X=X, y=y, params=params, time_limit=time_limit - (time.time() - time_start))
 
     def _validate_fit_memory_usage(self, X):
         max_memory_usage_ratio = self.params_aux['max_memory_usage_ratio']
@@ -91,7 +101,7 @@ class KNNModel(AbstractModel):
                 raise NotEnoughMemoryError  # don't train full model to avoid OOM error
 
     # TODO: Consider making this fully generic and available to all models
-    def _fit_with_samples(self, X, y, time_limit):
+    def _fit_with_samples(self, X, y, params, time_limit):
         """
         Fit model with samples of the data repeatedly, gradually increasing the amount of data until time_limit is reached or all data is used.
 
@@ -138,7 +148,7 @@ class KNNModel(AbstractModel):
             else:
                 X_samp = X
                 y_samp = y
-            self.model = self._model_type(**self.params).fit(X_samp, y_samp)
+            self.model = self._model_type(**params).fit(X_samp, y_samp)
             time_limit_left_prior = time_limit_left
             time_fit_end_sample = time.time()
             time_limit_left = time_limit - (time_fit_end_sample - time_start)
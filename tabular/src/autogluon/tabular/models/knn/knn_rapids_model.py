@@ -24,6 +24,9 @@ class KNNRapidsModel(KNNModel):
     conda activate rapids-0.18
     pip install --pre autogluon.tabular[all]
     """
+    # cuML models run on GPU and do not accept a thread count
+    _num_threads_param_name = None
+
     def _get_model_type(self):
         try_import_rapids_cuml()
         from cuml.neighbors import KNeighborsClassifier, KNeighborsRegressor
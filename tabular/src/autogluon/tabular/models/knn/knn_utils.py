@@ -3,6 +3,7 @@ from pandas import DataFrame
 from scipy.stats import mode
 from sklearn.utils.extmath import weighted_mode
 from autogluon.core.utils import try_import_faiss
+from autogluon.core.utils.thread_utils import limit_num_threads
 
 import logging
 
@@ -60,9 +61,6 @@ class FAISSNeighborsRegressor:
         self.n_neighbors = n_neighbors
         self.weights = weights
         self.n_jobs = n_jobs
-        if n_jobs > 0:
-            # global config, affects all faiss indexes
-            faiss.omp_set_num_threads(n_jobs)
 
     def fit(self, X, y):
         if isinstance(X, DataFrame):
@@ -74,8 +72,10 @@ class FAISSNeighborsRegressor:
         d = X.shape[1]
         self.index = self.faiss.index_factory(d, self.index_factory_string)
         self.y = np.array(y)
-        self.index.train(X)
-        self.index.add(X)
+        # FAISS threads are process-global, so they are limited through the shared thread budget rather than set directly
+        with limit_num_threads(self.n_jobs if self.n_jobs > 0 else None):
+            self.index.train(X)
+            self.index.add(X)
         return self
 
     def predict(self, X):
@@ -83,7 +83,8 @@ class FAISSNeighborsRegressor:
         X = np.ascontiguousarray(X)
         if X.ndim == 1:
             X = X[np.newaxis]
-        D, I = self.index.search(X, self.n_neighbors)
+        with limit_num_threads(self.n_jobs if self.n_jobs > 0 else None):
+            D, I = self.index.search(X, self.n_neighbors)
         outputs = np.squeeze(self.y[I])
 
         weights = _get_weights(D, self.weights)
@@ -137,9 +138,6 @@ class FAISSNeighborsClassifier:
         self.weights = weights
         self.classes = []
         self.n_jobs = n_jobs
-        if n_jobs > 0:
-            # global config, affects all faiss indexes
-            faiss.omp_set_num_threads(n_jobs)
 
     def fit(self, X, y):
         if isinstance(X, DataFrame):
@@ -151,8 +149,10 @@ class FAISSNeighborsClassifier:
         d = X.shape[1]
         self.index = self.faiss.index_factory(d, self.index_factory_string)
         self.labels = np.array(y)
-        self.index.train(X)
-        self.index.add(X)
+        # FAISS threads are process-global, so they are limited through the shared thread budget rather than set directly
+        with limit_num_threads(self.n_jobs if self.n_jobs > 0 else None):
+            self.index.train(X)
+            self.index.add(X)
         self.classes = np.unique(y)
         return self
 
@@ -161,7 +161,8 @@ class FAISSNeighborsClassifier:
         X = np.ascontiguousarray(X)
         if X.ndim == 1:
             X = X[np.newaxis]
-        D, I = self.index.search(X, self.n_neighbors)
+        with limit_num_threads(self.n_jobs if self.n_jobs > 0 else None):
+            D, I = self.index.search(X, self.n_neighbors)
         outputs = np.squeeze(self.labels[I])
         weights = _get_weights(D, self.weights)
         if weights is None:
@@ -175,7 +176,8 @@ class FAISSNeighborsClassifier:
         X = np.ascontiguousarray(X)
         if X.ndim == 1:
             X = X[np.newaxis]
-        D, I = self.index.search(X, self.n_neighbors)
+        with limit_num_threads(self.n_jobs if self.n_jobs > 0 else None):
+            D, I = self.index.search(X, self.n_neighbors)
         outputs = np.squeeze(self.labels[I])
         weights = _get_weights(D, self.weights)
         if weights is None:
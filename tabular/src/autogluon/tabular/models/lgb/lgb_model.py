@@ -36,6 +36,8 @@ class LGBModel(AbstractModel):
 
     Hyperparameter options: https://lightgbm.readthedocs.io/en/latest/Parameters.html
     """
+    _num_threads_param_name = 'num_threads'
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -75,8 +77,8 @@ class LGBModel(AbstractModel):
         start_time = time.time()
         params = self.params.copy()
 
-        # TODO: kwargs can have num_cpu, num_gpu. Currently these are ignored.
         params = fixedvals_from_searchspaces(params)
+        params = self._set_num_threads_param(params, num_cpus=kwargs.get('num_cpus', None))
 
         if verbosity <= 1:
             verbose_eval = False
@@ -15,18 +15,41 @@ preprocess_params_set = {
     'proc.impute_strategy',
     'penalty',
     'handle_text',
+    'proc.vectorizer',
+    'partial_fit.chunk_size',
+    'partial_fit.epochs',
+    'partial_fit.early_stopping_rounds',
 }
 
 
 def get_param_baseline():
     default_params = {
         'C': 1,
-        'vectorizer_dict_size': 75000,  # size of TFIDF vectorizer dictionary; used only in text model
+        'vectorizer_dict_size': 75000,  # size of TFIDF vectorizer dictionary or number of HashingVectorizer features; used only in text model
         'proc.ngram_range': (1, 5),  # range of n-grams for TFIDF vectorizer dictionary; used only in text model
+        'proc.vectorizer': 'tfidf',  # text vectorizer: `tfidf` - TfidfVectorizer; `hashing` - HashingVectorizer, requires no vocabulary fit and vectorizes chunks of rows in parallel; used only in text model
         'proc.skew_threshold': 0.99,  # numerical features whose absolute skewness is greater than this receive special power-transform preprocessing. Choose big value to avoid using power-transforms
         'proc.impute_strategy': 'median',  # strategy argument of sklearn.SimpleImputer() used to impute missing numeric values
         'penalty': 'L2',  # regularization to use with regression models
         'handle_text': IGNORE, # how text should be handled: `ignore` - don't use NLP features; `only` - only use NLP features; `include` - use both regular and NLP features
+        'partial_fit.chunk_size': None,  # if set, train with SGD via partial_fit on chunks of this many rows instead of fitting the preprocessed data of all rows at once
+        'partial_fit.epochs': 5,  # maximum number of passes over the data when `partial_fit.chunk_size` is set
+        'partial_fit.early_stopping_rounds': 3,  # when `partial_fit.chunk_size` is set, stop training once the validation score has not improved for this many epochs
+    }
+    return default_params
+
+
+def get_param_sgd_baseline():
+    default_params = {
+        'alpha': 0.0001,  # regularization strength of SGD, multiplies the `penalty` term
+        'learning_rate': 'constant',  # learning rate schedule of SGD, one of ['constant', 'optimal', 'invscaling']
+        'eta0': 0.01,  # initial learning rate of the 'constant' and 'invscaling' schedules
+        'chunk_size': 10000,  # number of rows preprocessed and passed to a single `partial_fit` call
+        'max_epochs': 20,  # maximum number of passes over the training data
+        'early_stopping_rounds': 3,  # stop training once the validation score has not improved for this many epochs
+        'num_workers': None,  # number of chunks trained in parallel threads whose coefficients are averaged after every round; None = number of CPUs available to the model
+        'data_source': None,  # Parquet file, directory of Parquet files or list of Parquet files to stream the training chunks from instead of the training data passed to fit
+        'data_source_label': '__label__',  # label column of `data_source`, containing the labels in their internal representation
     }
     return default_params
 
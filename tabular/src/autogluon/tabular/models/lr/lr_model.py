@@ -1,19 +1,16 @@
 import logging
 import re
+import time
 
 import numpy as np
 from pandas import DataFrame
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.impute import SimpleImputer
-from sklearn.pipeline import FeatureUnion, Pipeline
-from sklearn.preprocessing import StandardScaler, QuantileTransformer
 
 from autogluon.core.constants import BINARY, REGRESSION
 from autogluon.core.features.types import R_INT, R_FLOAT, R_CATEGORY, R_OBJECT
 
 from .hyperparameters.parameters import get_param_baseline, INCLUDE, IGNORE, ONLY, _get_solver, preprocess_params_set
 from .hyperparameters.searchspaces import get_default_searchspace
-from .lr_preprocessing_utils import NlpDataPreprocessor, OheFeaturesGenerator, NumericDataPreprocessor
+from .lr_preprocessing_utils import ChunkedParallelTransformer, NlpDataPreprocessor, OheFeaturesGenerator, NumericDataPreprocessor
 from autogluon.core.models.abstract.model_trial import skip_hpo
 from autogluon.core.models import AbstractModel
 
@@ -31,7 +28,12 @@ class LinearModel(AbstractModel):
         'binary' & 'multiclass': https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LogisticRegression.html
 
         'regression': https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.Ridge.html#sklearn.linear_model.Ridge
+
+    If the `partial_fit.chunk_size` hyperparameter is set, the model is instead trained with SGDClassifier / SGDRegressor via `partial_fit` on chunks of rows,
+    so the preprocessed data is never materialized for all rows at once.
     """
+    _num_threads_param_name = 'n_jobs'
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._pipeline = None
@@ -50,6 +52,7 @@ class LinearModel(AbstractModel):
             model_type = LogisticRegression
         return model_type
 
+    # Kept for models pickled with a TfidfVectorizer referencing it, text is now tokenized by the vectorizers with `token_pattern`
     def _tokenize(self, s):
         return re.split('[ ]+', s)
 
@@ -81,20 +84,35 @@ class LinearModel(AbstractModel):
         return features_selector(df, types_of_features, categorical_featnames, language_featnames, continuous_featnames)
 
     # TODO: handle collinear features - they will impact results quality
-    def _preprocess(self, X, is_train=False, **kwargs):
+    def _preprocess(self, X, is_train=False, num_cpus=None, fit_only=False, **kwargs):
+        """ If `fit_only=True` during training, only fits the preprocessing pipeline and returns X unchanged. """
         if is_train:
             feature_types = self._get_types_of_features(X)
-            X = self._preprocess_train(X, feature_types, self.params['vectorizer_dict_size'])
+            X = self._preprocess_train(X, feature_types, self.params['vectorizer_dict_size'], num_cpus=num_cpus, fit_only=fit_only)
         else:
             X = self._pipeline.transform(X)
         return X
 
-    def _preprocess_train(self, X, feature_types, vect_max_features):
+    def _preprocess_train(self, X, feature_types, vect_max_features, num_cpus=None, fit_only=False):
+        from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+        from sklearn.impute import SimpleImputer
+        from sklearn.pipeline import FeatureUnion, Pipeline
+        from sklearn.preprocessing import StandardScaler, QuantileTransformer
         transformer_list = []
         if len(feature_types['language']) > 0:
+            # Split on spaces, NlpDataPreprocessor already collapses consecutive spaces
+            token_pattern = r'[^ ]+'
+            if self.params.get('proc.vectorizer', 'tfidf') == 'hashing':
+                # Stateless: requires no vocabulary fit, and chunks of rows can be vectorized in parallel
+                vectorizer = ChunkedParallelTransformer(
+                    HashingVectorizer(ngram_range=self.params['proc.ngram_range'], n_features=vect_max_features, alternate_sign=False, token_pattern=token_pattern, dtype=np.float32),
+                    n_jobs=num_cpus if num_cpus is not None else 1,
+                )
+            else:
+                vectorizer = TfidfVectorizer(ngram_range=self.params['proc.ngram_range'], sublinear_tf=True, max_features=vect_max_features, token_pattern=token_pattern, dtype=np.float32)
             pipeline = Pipeline(steps=[
                 ("preparator", NlpDataPreprocessor(nlp_cols=feature_types['language'])),
-                ("vectorizer", TfidfVectorizer(ngram_range=self.params['proc.ngram_range'], sublinear_tf=True, max_features=vect_max_features, tokenizer=self._tokenize)),
+                ("vectorizer", vectorizer),
             ])
             transformer_list.append(('vect', pipeline))
         if len(feature_types['onehot']) > 0:
@@ -117,6 +135,9 @@ class LinearModel(AbstractModel):
             ])
             transformer_list.append(('skew', pipeline))
         self._pipeline = FeatureUnion(transformer_list=transformer_list)
+        if fit_only:
+            self._pipeline.fit(X)
+            return X
         return self._pipeline.fit_transform(X)
 
     def _set_default_params(self):
@@ -137,11 +158,15 @@ class LinearModel(AbstractModel):
              y,
              sample_weight=None,
              **kwargs):
-        X = self.preprocess(X, is_train=True)
+        if self.params.get('partial_fit.chunk_size', None) is not None:
+            return self._fit_partial(X=X, y=y, sample_weight=sample_weight, **kwargs)
+        X = self.preprocess(X, is_train=True, num_cpus=kwargs.get('num_cpus', None))
         if self.problem_type == BINARY:
             y = y.astype(int).values
 
         params = {k: v for k, v in self.params.items() if k not in preprocess_params_set}
+        if self.problem_type != REGRESSION:  # Ridge/Lasso do not support n_jobs
+            params = self._set_num_threads_param(params, num_cpus=kwargs.get('num_cpus', None))
 
         # Ridge/Lasso are using alpha instead of C, which is C^-1
         # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.Ridge.html#sklearn.linear_model.Ridge
@@ -162,6 +187,131 @@ class LinearModel(AbstractModel):
         else:
             self.model = model.fit(X, y, sample_weight=sample_weight)
 
+    def _get_sgd_model(self, num_cpus=None):
+        """ Returns the SGDClassifier / SGDRegressor equivalent to the hyperparameters, used for `partial_fit` training. """
+        from sklearn.linear_model import SGDClassifier, SGDRegressor
+        penalty = self.params.get('penalty', 'L2')
+        if penalty not in ['L1', 'L2']:
+            raise AssertionError(f'Unknown value for penalty "{penalty}" - supported types are ["L1", "L2"]')
+        params = dict(
+            penalty=penalty.lower(),
+            fit_intercept=self.params.get('fit_intercept', True),
+            random_state=self.params.get('random_state', 0),
+        )
+        if self.problem_type == REGRESSION:
+            return SGDRegressor(loss=_get_sgd_loss(self.problem_type), **params)
+        params = self._set_num_threads_param(params, num_cpus=num_cpus)  # Used for one-versus-all multiclass
+        return SGDClassifier(loss=_get_sgd_loss(self.problem_type), **params)
+
+    def _fit_partial(self, X, y, X_val=None, y_val=None, time_limit=None, sample_weight=None, num_cpus=None, **kwargs):
+        """
+        Fits the preprocessing pipeline, then trains with SGD by preprocessing and calling `partial_fit` on one chunk of `partial_fit.chunk_size` rows at a time,
+        for up to `partial_fit.epochs` passes over the data in a shuffled order. `C` is converted to the equivalent per-sample `alpha` of SGD.
+        If `X_val` is specified, training stops once the validation score has not improved for `partial_fit.early_stopping_rounds` epochs.
+        """
+        time_start = time.time()
+        # Chunks are transformed by the pipeline only, so they must come from the output of the non-adaptive preprocessing
+        X = self.preprocess(X, is_train=True, num_cpus=num_cpus, fit_only=True)
+        if self.problem_type == BINARY:
+            y = y.astype(int)
+        y = np.asarray(y)
+        if sample_weight is not None:
+            sample_weight = np.asarray(sample_weight)
+        if X_val is not None:
+            X_val = self.preprocess(X_val)
+            y_val = np.asarray(y_val)
+        chunk_size = self.params['partial_fit.chunk_size']
+
+        model = self._get_sgd_model(num_cpus=num_cpus)
+        model.set_params(alpha=1 / (max(self.params.get('C', 1), 1e-8) * len(X)))
+        logger.log(15, f'Training Model with the following hyperparameter settings:')
+        logger.log(15, model)
+
+        random_state = np.random.RandomState(self.params.get('random_state', 0))
+        if time_limit is not None:
+            time_limit = time_limit - (time.time() - time_start)
+        self.model = self._partial_fit_epochs(
+            models=[model],
+            get_chunks=lambda: self._iter_chunks(X, y, sample_weight=sample_weight, chunk_size=chunk_size, random_state=random_state),
+            num_epochs=self.params.get('partial_fit.epochs', 5),
+            classes=np.unique(y) if self.problem_type != REGRESSION else None,
+            X_val=X_val,
+            y_val=y_val,
+            early_stopping_rounds=self.params.get('partial_fit.early_stopping_rounds', 3),
+            time_limit=time_limit,
+            num_epochs_param='partial_fit.epochs',
+        )
+
+    def _partial_fit_epochs(self, models, get_chunks, num_epochs, classes=None, X_val=None, y_val=None, early_stopping_rounds=None, time_limit=None, num_epochs_param='max_epochs'):
+        """
+        Trains the SGD `models` with `partial_fit` for up to `num_epochs` passes over the (X_chunk, y_chunk, sample_weight_chunk) chunks yielded by `get_chunks()`, and returns the first model.
+
+        With several models, one chunk per model is trained in parallel threads in each round,
+        after which the coefficients of all models are set to their average weighted by chunk size (iterative parameter mixing).
+        If the preprocessed `X_val` is specified, training stops once the validation score has not improved for `early_stopping_rounds` epochs,
+        and the coefficients of the best epoch are kept. The number of epochs of the best epoch is stored as the `num_epochs_param` of `params_trained`.
+        """
+        from joblib import Parallel, delayed
+        time_start = time.time()
+        partial_fit_kwargs = dict()
+        if classes is not None:
+            partial_fit_kwargs['classes'] = classes
+        best_epoch = None
+        best_score = None
+        best_state = None
+        with Parallel(n_jobs=len(models), prefer='threads') as parallel:
+            for epoch in range(num_epochs):
+                time_start_epoch = time.time()
+                chunks = get_chunks()
+                while True:
+                    round_chunks = [chunk for _, chunk in zip(models, chunks)]
+                    if not round_chunks:
+                        break
+                    if len(models) == 1:
+                        self._partial_fit_chunk(models[0], *round_chunks[0], **partial_fit_kwargs)
+                    else:
+                        parallel(delayed(self._partial_fit_chunk)(model, *chunk, **partial_fit_kwargs) for model, chunk in zip(models, round_chunks))
+                        _average_coefficients(models[:len(round_chunks)], weights=[len(chunk[1]) for chunk in round_chunks], models_out=models)
+
+                if X_val is not None:
+                    score = self._score_preprocessed(models[0], X_val, y_val)
+                    logger.log(15, f'Epoch {epoch + 1}: {self.stopping_metric.name} = {round(score, 4)}')
+                    if best_score is None or score > best_score:
+                        best_epoch, best_score, best_state = epoch, score, (models[0].coef_.copy(), np.copy(models[0].intercept_))
+                    elif epoch - best_epoch >= early_stopping_rounds:
+                        logger.log(15, f'Early stopping after epoch {epoch + 1}, best epoch: {best_epoch + 1}')
+                        break
+                if time_limit is not None:
+                    time_left = time_limit - (time.time() - time_start)
+                    if time_left < (time.time() - time_start_epoch):
+                        logger.log(15, f'Stopping training after epoch {epoch + 1} to avoid exceeding the time limit')
+                        break
+
+        model = models[0]
+        if best_state is not None:
+            model.coef_, model.intercept_ = best_state
+            self.params_trained[num_epochs_param] = best_epoch + 1
+        return model
+
+    @staticmethod
+    def _iter_chunks(X, y, sample_weight=None, chunk_size=None, random_state=None):
+        """ Yields (X_chunk, y_chunk, sample_weight_chunk) of one epoch over X in a shuffled order. Rows within a chunk keep their order to avoid scattered reads. """
+        row_order = random_state.permutation(len(X))
+        for start in range(0, len(X), chunk_size):
+            chunk_idx = np.sort(row_order[start:start + chunk_size])
+            chunk_weight = sample_weight[chunk_idx] if sample_weight is not None else None
+            yield X.iloc[chunk_idx], y[chunk_idx], chunk_weight
+
+    def _partial_fit_chunk(self, model, X_chunk, y_chunk, sample_weight_chunk=None, **kwargs):
+        model.partial_fit(self._pipeline.transform(X_chunk), y_chunk, sample_weight=sample_weight_chunk, **kwargs)
+
+    def _score_preprocessed(self, model, X, y):
+        if self.problem_type == REGRESSION:
+            y_pred_proba = model.predict(X)
+        else:
+            y_pred_proba = self._convert_proba_to_unified_form(model.predict_proba(X))
+        return self.score_with_y_pred_proba(y=y, y_pred_proba=y_pred_proba, metric=self.stopping_metric)
+
     # TODO: Add HPO
     def _hyperparameter_tune(self, **kwargs):
         return skip_hpo(self, **kwargs)
@@ -215,3 +365,23 @@ class LinearModel(AbstractModel):
         )
         default_auxiliary_params.update(extra_auxiliary_params)
         return default_auxiliary_params
+
+
+def _average_coefficients(models, weights, models_out):
+    """ Sets the coefficients of every model in `models_out` to the average of the coefficients of `models`, weighted by `weights`. """
+    coef = np.average([model.coef_ for model in models], axis=0, weights=weights)
+    intercept = np.average([model.intercept_ for model in models], axis=0, weights=weights)
+    coef = coef.astype(models[0].coef_.dtype)
+    intercept = intercept.astype(models[0].intercept_.dtype)
+    for model in models_out:
+        model.coef_ = coef.copy()
+        model.intercept_ = intercept.copy()
+
+
+def _get_sgd_loss(problem_type):
+    """ Returns the name of the logistic / squared loss of SGDClassifier / SGDRegressor, which were renamed in scikit-learn 1.0 and 1.1. """
+    import sklearn
+    sklearn_version = tuple(int(v) for v in re.findall(r'\d+', sklearn.__version__)[:2])
+    if problem_type == REGRESSION:
+        return 'squared_error' if sklearn_version >= (1, 0) else 'squared_loss'
+    return 'log_loss' if sklearn_version >= (1, 1) else 'log'
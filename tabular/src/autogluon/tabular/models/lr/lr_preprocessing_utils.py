@@ -1,39 +1,28 @@
-from scipy.sparse import hstack
+import numpy as np
+from scipy.sparse import vstack
 from sklearn.base import BaseEstimator, TransformerMixin
-from sklearn.preprocessing import OneHotEncoder
+
+from ..tabular_nn.categorical_encoders import OneHotMergeRaresHandleUnknownEncoder
 
 
 class OheFeaturesGenerator(BaseEstimator, TransformerMixin):
-    missing_category_str = '!missing!'
+    """ One-hot encodes `cats_cols` from their category codes into a float32 CSR matrix. Missing values are their own category, unknown categories are encoded as all zeros. """
 
     def __init__(self, cats_cols):
         self._feature_names = []
         self.cats = cats_cols
-        self.ohe_encs = None
+        self.encoder = None
         self.labels = None
 
     def fit(self, X, y=None):
-        self.ohe_encs = {f: OneHotEncoder(handle_unknown='ignore') for f in self.cats}
-        self.labels = {}
-
-        for c in self.cats:
-            self.ohe_encs[c].fit(self._normalize(X[c]))
-            self.labels[c] = self.ohe_encs[c].categories_
+        self.encoder = OneHotMergeRaresHandleUnknownEncoder(sparse=True, dtype=np.float32)
+        self.encoder.fit(X[self.cats])
+        self.labels = {c: categories for c, categories in zip(self.cats, self.encoder.categories_)}
+        self._feature_names = [f'{c}_{category}' for c in self.cats for category in self.labels[c]]
         return self
 
     def transform(self, X, y=None):
-        Xs = [self.ohe_encs[c].transform(self._normalize(X[c])) for c in self.cats]
-
-        # Update feature names
-        self._feature_names = []
-        for k, v in self.labels.items():
-            for f in k + '_' + v[0]:
-                self._feature_names.append(f)
-
-        return hstack(Xs)
-
-    def _normalize(self, col):
-        return col.astype(str).fillna(self.missing_category_str).values.reshape(-1, 1)
+        return self.encoder.transform(X[self.cats])
 
     def get_feature_names(self):
         return self._feature_names
@@ -48,11 +37,9 @@ class NlpDataPreprocessor(BaseEstimator, TransformerMixin):
         return self
 
     def transform(self, X, y=None):
-        X = X[self.nlp_cols].copy()
-        for c in self.nlp_cols:
-            X[c] = X[c].astype(str).fillna(' ')
-        X = X.apply(' '.join, axis=1).str.replace('[ ]+', ' ', regex=True)
-        return X.values.tolist()
+        text = [X[c].astype(str) for c in self.nlp_cols]
+        text = text[0].str.cat(text[1:], sep=' ') if len(text) > 1 else text[0]
+        return text.str.replace('[ ]+', ' ', regex=True).values.tolist()
 
 
 class NumericDataPreprocessor(BaseEstimator, TransformerMixin):
@@ -64,5 +51,27 @@ class NumericDataPreprocessor(BaseEstimator, TransformerMixin):
         return self
 
     def transform(self, X, y=None):
-        X = X[self.cont_cols].copy()
-        return X.values.tolist()
+        return X[self.cont_cols].to_numpy(dtype=np.float32)
+
+
+class ChunkedParallelTransformer(BaseEstimator, TransformerMixin):
+    """
+    Applies the stateless `transformer` (such as sklearn's HashingVectorizer) to chunks of `chunk_size` rows in parallel with `n_jobs` joblib workers,
+    and stacks the resulting sparse matrices. `fit` only fits `transformer` once, as it is not expected to learn anything from the data.
+    """
+
+    def __init__(self, transformer, n_jobs=1, chunk_size=10000):
+        self.transformer = transformer
+        self.n_jobs = n_jobs
+        self.chunk_size = chunk_size
+
+    def fit(self, X, y=None):
+        self.transformer.fit(X[:1])
+        return self
+
+    def transform(self, X, y=None):
+        if self.n_jobs == 1 or len(X) <= self.chunk_size:
+            return self.transformer.transform(X)
+        from joblib import Parallel, delayed
+        chunks = [X[start:start + self.chunk_size] for start in range(0, len(X), self.chunk_size)]
+        return vstack(Parallel(n_jobs=self.n_jobs)(delayed(self.transformer.transform)(chunk) for chunk in chunks)).tocsr()
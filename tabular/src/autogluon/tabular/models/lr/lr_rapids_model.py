@@ -23,6 +23,9 @@ class LinearRapidsModel(LinearModel):
     conda activate rapids-0.18
     pip install --pre autogluon.tabular[all]
     """
+    # cuML models run on GPU and do not accept a thread count
+    _num_threads_param_name = None
+
     def _get_model_type(self):
         penalty = self.params.get('penalty', 'L2')
         try_import_rapids_cuml()
@@ -0,0 +1,124 @@
+import logging
+import os
+import time
+
+import numpy as np
+
+from autogluon.core.constants import REGRESSION
+from autogluon.core.utils import get_num_cpus_budget
+
+from .hyperparameters.parameters import get_param_baseline, get_param_sgd_baseline
+from .lr_model import LinearModel
+
+logger = logging.getLogger(__name__)
+
+
+class LinearSGDModel(LinearModel):
+    """
+    Out-of-core linear model trained with minibatch SGD (scikit-learn): https://scikit-learn.org/stable/modules/sgd.html
+
+    Model backend differs depending on problem_type:
+
+        'binary' & 'multiclass': https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.SGDClassifier.html (logistic loss)
+
+        'regression': https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.SGDRegressor.html (squared loss)
+
+    The preprocessing pipeline of LinearModel is fit once, after which the data is streamed through it in chunks of `chunk_size` rows,
+    so the preprocessed matrix of all rows is never materialized. Each epoch visits the chunks in a shuffled order.
+
+    If `data_source` is specified, the chunks are read one Parquet file at a time from `data_source` instead of from the training data passed to fit.
+    `data_source` is the path to a Parquet file, a directory of Parquet files (such as written by `autogluon.core.utils.savers.save_pd` with a multipart path), or a list of Parquet file paths.
+    The files must contain the features of the model after feature generation (e.g. the output of `TabularPredictor.transform_features`)
+    and the label in its internal representation (e.g. the output of `TabularPredictor.transform_labels`) in the `data_source_label` column.
+    The training data passed to fit is then only used to fit the preprocessing pipeline, so it can be a sample of the rows of `data_source`.
+
+    With more than one CPU, `num_workers` chunks are trained in parallel threads on copies of the model, whose coefficients are averaged after every round (iterative parameter mixing).
+    Training stops early once the validation score has not improved for `early_stopping_rounds` epochs, and the coefficients of the best epoch are kept.
+    """
+
+    def _set_default_params(self):
+        default_params = {'random_state': 0, 'fit_intercept': True}
+        default_params.update(get_param_baseline())
+        default_params.update(get_param_sgd_baseline())
+        for param, val in default_params.items():
+            self._set_default_param_value(param, val)
+
+    def _fit(self,
+             X,
+             y,
+             X_val=None,
+             y_val=None,
+             time_limit=None,
+             sample_weight=None,
+             num_cpus=None,
+             **kwargs):
+        time_start = time.time()
+        if num_cpus is None or num_cpus == 'auto':
+            num_cpus = get_num_cpus_budget()
+        num_workers = self.params['num_workers']
+        num_workers = max(1, min(num_workers, num_cpus) if num_workers is not None else num_cpus)
+
+        X = self.preprocess(X, is_train=True, num_cpus=num_cpus, fit_only=True)
+        data_source = self.params['data_source']
+        if data_source is None:
+            if self.problem_type != REGRESSION:
+                y = y.astype(int)
+            y = np.asarray(y)
+            if sample_weight is not None:
+                sample_weight = np.asarray(sample_weight)
+        else:
+            data_source = _get_parquet_paths(data_source)
+        if X_val is not None:
+            X_val = self.preprocess(X_val)
+            y_val = np.asarray(y_val)
+
+        models = [self._get_sgd_model(num_cpus=num_cpus if num_workers == 1 else 1) for _ in range(num_workers)]
+        for model in models:
+            model.set_params(alpha=self.params['alpha'], learning_rate=self.params['learning_rate'], eta0=self.params['eta0'])
+        logger.log(15, f'Training Model with {num_workers} workers and the following hyperparameter settings:')
+        logger.log(15, models[0])
+
+        chunk_size = self.params['chunk_size']
+        random_state = np.random.RandomState(self.params['random_state'])
+        if data_source is None:
+            get_chunks = lambda: self._iter_chunks(X, y, sample_weight=sample_weight, chunk_size=chunk_size, random_state=random_state)
+        else:
+            get_chunks = lambda: self._iter_chunks_data_source(data_source, chunk_size=chunk_size, random_state=random_state)
+        if time_limit is not None:
+            time_limit = time_limit - (time.time() - time_start)
+        self.model = self._partial_fit_epochs(
+            models=models,
+            get_chunks=get_chunks,
+            num_epochs=self.params['max_epochs'],
+            classes=np.arange(self.num_classes) if self.problem_type != REGRESSION else None,
+            X_val=X_val,
+            y_val=y_val,
+            early_stopping_rounds=self.params['early_stopping_rounds'],
+            time_limit=time_limit,
+        )
+
+    def _iter_chunks_data_source(self, paths, chunk_size=None, random_state=None):
+        """ Yields (X_chunk, y_chunk, None) of one epoch over the Parquet files in `paths`, loading one file at a time in a shuffled order. """
+        from autogluon.core.utils.loaders import load_pd
+        label = self.params['data_source_label']
+        for path_idx in random_state.permutation(len(paths)):
+            df = load_pd.load(paths[path_idx], format='parquet')
+            row_order = random_state.permutation(len(df))
+            for start in range(0, len(df), chunk_size):
+                df_chunk = df.iloc[np.sort(row_order[start:start + chunk_size])]
+                y_chunk = df_chunk[label].to_numpy()
+                if self.problem_type != REGRESSION:
+                    y_chunk = y_chunk.astype(int)
+                # Chunks are transformed by the pipeline only, so they need the non-adaptive preprocessing (e.g. feature selection) applied to the training data
+                yield self.preprocess(df_chunk, preprocess_stateful=False), y_chunk, None
+
+
+def _get_parquet_paths(data_source):
+    if isinstance(data_source, (list, tuple)):
+        return list(data_source)
+    if os.path.isdir(data_source):
+        paths = [os.path.join(data_source, file) for file in sorted(os.listdir(data_source)) if file.endswith('.parquet')]
+        if not paths:
+            raise AssertionError(f'No Parquet files found in data_source directory: {data_source}')
+        return paths
+    return [data_source]
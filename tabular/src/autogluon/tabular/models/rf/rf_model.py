@@ -6,7 +6,6 @@ import time
 
 import numpy as np
 import psutil
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 
 from autogluon.core.constants import BINARY, MULTICLASS, REGRESSION, SOFTCLASS
 from autogluon.core.utils.exceptions import NotEnoughMemoryError, TimeLimitExceeded
@@ -23,11 +22,16 @@ class RFModel(AbstractModel):
     """
     Random Forest model (scikit-learn): https://scikit-learn.org/stable/modules/generated/sklearn.ensemble.RandomForestClassifier.html
     """
+    _num_threads_param_name = 'n_jobs'
+    # Category codes are taken from the category dtype, so the preprocessed rows do not depend on the rows the model is fit on
+    _fold_invariant_preprocess = True
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._feature_generator = None
 
     def _get_model_type(self):
+        from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
         if self.problem_type in [REGRESSION, SOFTCLASS]:
             return RandomForestRegressor
         else:
@@ -69,16 +73,23 @@ class RFModel(AbstractModel):
              y,
              time_limit=None,
              sample_weight=None,
+             shared_fit_data=None,
+             train_index=None,
              **kwargs):
         time_start = time.time()
         max_memory_usage_ratio = self.params_aux['max_memory_usage_ratio']
         hyperparams = self.params.copy()
+        hyperparams = self._set_num_threads_param(hyperparams, num_cpus=kwargs.get('num_cpus', None))
         n_estimators_final = hyperparams['n_estimators']
 
         n_estimators_minimum = min(40, n_estimators_final)
         n_estimators_test = min(4, max(1, math.floor(n_estimators_minimum/5)))
 
-        X = self.preprocess(X)
+        if shared_fit_data is not None:
+            # Bagged fold model, slice the rows of the fold from the data preprocessed once by `_get_shared_fit_data`
+            X = shared_fit_data[train_index]
+        else:
+            X = self.preprocess(X)
         n_estimator_increments = [n_estimators_final]
 
         # Very rough guess to size of a single tree before training
@@ -23,6 +23,9 @@ class RFRapidsModel(RFModel):
     conda activate rapids-0.18
     pip install --pre autogluon.tabular[all]
     """
+    # cuML models run on GPU and do not accept a thread count
+    _num_threads_param_name = None
+
     def _get_model_type(self):
         try_import_rapids_cuml()
         from cuml.ensemble import RandomForestClassifier, RandomForestRegressor
@@ -40,11 +43,15 @@ class RFRapidsModel(RFModel):
         for param, val in default_params.items():
             self._set_default_param_value(param, val)
 
-    def _fit(self, X, y, **kwargs):
+    def _fit(self, X, y, shared_fit_data=None, train_index=None, **kwargs):
         logger.warning('\tWarning: Training RAPIDS RandomForest model... There is a known bug that lowers model quality compared to sklearn RandomForest. '
                        'Consider using CPU instead if model quality is not sufficient.\n'
                        '\t\tLink to issue: https://github.com/rapidsai/cuml/issues/2518')
-        X = self.preprocess(X)
+        if shared_fit_data is not None:
+            # Bagged fold model, slice the rows of the fold from the data preprocessed once by `_get_shared_fit_data`
+            X = shared_fit_data[train_index]
+        else:
+            X = self.preprocess(X)
         self.model = self._get_model_type()(**self.params)
         self.model = self.model.fit(X, y)
         self.params_trained['n_estimators'] = self.model.n_estimators
@@ -1,7 +1,10 @@
 
 def get_fixed_params():
     """ Parameters that currently cannot be searched during HPO """
-    fixed_params = {'batch_size': 512, # The size of example chunks to predict on.
+    fixed_params = {'batch_size': 512, # The size of example chunks to train on.
+                    'predict_batch_size': 8192, # The size of example chunks to predict on.
+                    'inference_torchscript': False, # If True, predict on CPU with a TorchScript-traced copy of the model.
+                    'inference_quantize': False, # If True, predict on CPU with a copy of the model whose Linear layers use dynamic int8 quantization. Predictions can differ slightly.
                     'n_cont_embeddings': 0, # How many continuous feature embeddings to use.
                     'norm_class_name': 'LayerNorm', # What kind of normalization to use on continuous features.
                     'column_embedding': True, # If True, 1/(n_shared_embs)th of every embedding will be reserved for a learned parameter that's common to all embeddings.
@@ -1,4 +1,5 @@
 """ TabTransformer model """
+import copy
 import logging
 import os
 import time
@@ -45,6 +46,7 @@ class TabTransformerModel(AbstractNeuralNetworkModel):
         self._verbosity = None
         self._temp_file_name = "tab_trans_temp.pth"
         self._period_columns_mapping = None
+        self._inference_model = None  # Traced and/or quantized copy of self.model used for prediction, built lazily
 
     def _set_default_params(self):
         default_params = get_default_param()
@@ -411,58 +413,92 @@ class TabTransformerModel(AbstractNeuralNetworkModel):
             self.tt_fit(loader_train, loader_val, y_val, state='finetune', time_limit=finetune_time_limit, reporter=reporter)
         else:
             self.tt_fit(loader_train, loader_val, y_val, time_limit=time_limit, reporter=reporter)
+        self._inference_model = None
 
     def _predict_proba(self, X, **kwargs):
         """
-        X (torch.tensor or pd.dataframe): data for model to give prediction probabilities
+        X (pd.DataFrame, torch DataLoader or torch.Tensor): data for model to give prediction probabilities.
+            A torch.Tensor is expected to already be encoded, such as the `cat_data` of a TabTransformerDataset.
         returns: np.array of k-probabilities for each of the k classes. If k=2 we drop the second probability.
         """
         import torch
-        import torch.nn as nn
         from torch.utils.data import DataLoader
-        from torch.autograd import Variable
 
         if isinstance(X, pd.DataFrame):
-            # Preprocess here also calls our _preprocess, which creates a TTDataset.
+            # Preprocess here also calls our _preprocess, which creates a TTDataset with the encoded features as a single contiguous tensor.
             X = self.preprocess(X, **kwargs)
-            loader = X.build_loader(self.params['batch_size'], self.params['num_workers'])
+            data = X.cat_data
         elif isinstance(X, DataLoader):
-            loader = X
+            data = X.dataset.cat_data
         elif isinstance(X, torch.Tensor):
-            X = X.rename(columns=self._get_no_period_columns(X))
-            loader = X.build_loader(self.params['batch_size'], self.params['num_workers'])
+            data = X
         else:
             raise NotImplementedError(
                 "Attempting to predict against a non-supported data type. \nNeeds to be a pandas DataFrame, torch DataLoader or torch Tensor.")
 
-        self.model.eval()
-        softmax = nn.Softmax(dim=1)
-
-        if self.problem_type == REGRESSION:
-            outputs = torch.zeros([len(loader.dataset), 1])
-        else:
-            outputs = torch.zeros([len(loader.dataset), self.num_classes])
-
-        iter = 0
-        for data, _ in loader:
-            if self.device.type == "cuda":
-                data = data.cuda()
-            with torch.no_grad():
-                data = Variable(data)
-                prob, _ = self.model(data)
-                batch_size = len(prob)
-                if self.problem_type != REGRESSION:
-                    prob = softmax(prob)
-
-            outputs[iter:(iter + batch_size)] = prob
-            iter += batch_size
+        # DataLoaders are scored during training, where a traced or quantized copy of the model would be stale
+        outputs = self._predict_encoded(data, use_inference_model=not isinstance(X, DataLoader))
 
         if self.problem_type == BINARY:
-            return outputs[:, 1].cpu().numpy()
+            return outputs[:, 1]
         elif self.problem_type == REGRESSION:
             outputs = outputs.flatten()
 
-        return outputs.cpu().numpy()
+        return outputs
+
+    def _predict_encoded(self, data, use_inference_model=True):
+        """
+        Predicts the encoded features `data` in batches of `predict_batch_size` rows without a DataLoader,
+        returns the model outputs (probabilities for classification) as a numpy array.
+        """
+        import torch
+
+        if use_inference_model:
+            model = self._get_inference_model(data[:1])
+        else:
+            self.model.eval()
+            model = self.model
+        batch_size = self.params.get('predict_batch_size', self.params['batch_size'])
+        inference_mode = torch.inference_mode if hasattr(torch, 'inference_mode') else torch.no_grad  # torch < 1.9 has no inference_mode
+        outputs = []
+        with inference_mode():
+            for start in range(0, len(data), batch_size):
+                batch = data[start:start + batch_size]
+                if self.device.type == "cuda":
+                    batch = batch.cuda(non_blocking=True)
+                out, _ = model(batch)
+                if self.problem_type != REGRESSION:
+                    out = torch.softmax(out, dim=1)
+                outputs.append(out.cpu())
+        if not outputs:
+            num_outputs = 1 if self.problem_type == REGRESSION else self.num_classes
+            return np.zeros((0, num_outputs), dtype=np.float32)
+        return torch.cat(outputs).numpy()
+
+    def _get_inference_model(self, example_batch):
+        """
+        Returns the module used for prediction, which is `self.model` unless `inference_quantize` or `inference_torchscript` are enabled.
+        On CPU, `inference_quantize=True` applies dynamic int8 quantization to the Linear layers (predictions can differ slightly),
+        and `inference_torchscript=True` traces the model with TorchScript on `example_batch`. The result is cached until the model is refit or loaded.
+        """
+        import torch
+        self.model.eval()
+        use_quantize = self.params.get('inference_quantize', False)
+        use_torchscript = self.params.get('inference_torchscript', False)
+        if self.device.type != "cpu" or not (use_quantize or use_torchscript) or len(example_batch) == 0:
+            return self.model
+        if self._inference_model is None:
+            model = copy.deepcopy(self.model)
+            # The output layers of TabNet are kept in a python list, register them as submodules of the copy so they are quantized and traced as well
+            model.fc = torch.nn.ModuleList(model.fc)
+            model.requires_grad_(False)
+            if use_quantize:
+                model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+            if use_torchscript:
+                with torch.no_grad():
+                    model = torch.jit.trace(model, example_batch, check_trace=False)
+            self._inference_model = model
+        return self._inference_model
 
     def _get_default_searchspace(self):
         return get_default_searchspace()
@@ -509,13 +545,16 @@ class TabTransformerModel(AbstractNeuralNetworkModel):
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
         temp_model = self.model
+        temp_inference_model = self._inference_model
         if self.model is not None:
             torch.save(self.model, params_filepath)
 
         self.model = None  # Avoiding pickling the weights.
+        self._inference_model = None
         modelobj_filepath = super().save(path=path, verbose=verbose)
 
         self.model = temp_model
+        self._inference_model = temp_inference_model
 
         return modelobj_filepath
 
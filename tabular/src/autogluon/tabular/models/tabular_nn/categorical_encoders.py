@@ -1,11 +1,17 @@
 """ 
 Variant of the sklearn OneHotEncoder and OrdinalEncoder that can handle unknown classes at test-time 
 as well as binning of infrequent categories to limit the overall number of categories considered.
-Unknown categories are returned as None in inverse transforms. Always converts input list X to list of the same type elements first (string typically)
+Unknown categories are returned as None in inverse transforms.
+With the default `categories='auto'`, features are encoded from their pandas category codes (features of other dtypes are converted to category dtype first),
+with infrequent and unknown categories handled as remaps of small per-feature lookup arrays instead of comparisons of the values themselves.
+Missing values are treated as their own category, placed after the other categories.
+Otherwise input list X is converted to a list of the same type elements first (string typically).
 """
 from numbers import Integral
 
 import numpy as np
+import pandas as pd
+from pandas.api.types import is_categorical_dtype
 from scipy import sparse
 
 from sklearn.base import BaseEstimator, TransformerMixin
@@ -238,6 +244,90 @@ class _BaseEncoder(BaseEstimator, TransformerMixin):
                 infrequent_indices = np.array([])
             self.infrequent_indices_.append(infrequent_indices)
     
+    def _get_feature_codes(self, X, feature_idx):
+        """Returns the categories of a feature and its category codes (-1 = missing value)."""
+        Xi = self._get_feature(X, feature_idx)
+        if not isinstance(Xi, pd.Series):
+            Xi = pd.Series(Xi)
+        if not is_categorical_dtype(Xi.dtype):
+            Xi = Xi.astype('category')
+        return Xi.cat.categories, Xi.cat.codes.to_numpy()
+
+    def _fit_codes(self, X):
+        """
+        Category code based equivalent of `_fit` for `categories='auto'`.
+        Sets `categories_` and `infrequent_indices_`, and for each feature the lookup array mapping (category code + 1) to its encoded level, -1 = unknown.
+        """
+        if not hasattr(X, 'iloc'):
+            X = np.asarray(X)
+            if X.ndim != 2:
+                raise ValueError("Expected 2D array, got {}D array instead.".format(X.ndim))
+        if self.max_levels is not None:
+            if (not isinstance(self.max_levels, Integral) or
+                    self.max_levels <= 0):
+                raise ValueError("max_levels must be None or a strictly "
+                                 "positive int, got {}.".format(
+                                     self.max_levels))
+
+        self.categories_ = []
+        self.infrequent_indices_ = []
+        self._fit_categories_ = []
+        self._code_maps_ = []
+        for i in range(X.shape[1]):
+            categories, codes = self._get_feature_codes(X, feature_idx=i)
+            # counts[0] is the count of missing values (code -1), counts[j+1] the count of category j
+            counts = np.bincount(codes + 1, minlength=len(categories) + 1)
+            present = np.flatnonzero(counts[1:])
+            cats = np.asarray(categories.take(present))
+            level_counts = counts[1:][present]
+            if counts[0] > 0:
+                cats = np.append(cats.astype(object), np.nan)
+                level_counts = np.append(level_counts, counts[0])
+            n_levels = len(cats)
+
+            if self.max_levels is not None and n_levels > self.max_levels:
+                infrequent_indices = np.sort(np.argsort(-level_counts, kind='stable')[self.max_levels:])
+            else:
+                infrequent_indices = np.array([], dtype=np.int64)
+            # Frequent categories keep their relative order, infrequent categories all share the level after them
+            is_frequent = np.ones(n_levels, dtype=bool)
+            is_frequent[infrequent_indices] = False
+            level_map = np.empty(n_levels, dtype=np.int64)
+            level_map[is_frequent] = np.arange(is_frequent.sum())
+            level_map[~is_frequent] = is_frequent.sum()
+
+            code_map = np.full(len(categories) + 1, -1, dtype=np.int64)
+            code_map[present + 1] = level_map[:len(present)]
+            if counts[0] > 0:
+                code_map[0] = level_map[-1]
+            self.categories_.append(cats)
+            self.infrequent_indices_.append(infrequent_indices)
+            self._fit_categories_.append(categories)
+            self._code_maps_.append(code_map)
+
+    def _transform_codes(self, X):
+        """Category code based equivalent of `_transform`, returns the encoded levels of X with -1 for unknown categories."""
+        if not hasattr(X, 'iloc'):
+            X = np.asarray(X)
+        n_features = X.shape[1]
+        if n_features != len(self._code_maps_):
+            raise ValueError(
+                "The number of features in X is different to the number of "
+                "features of the fitted data. The fitted data had {} features "
+                "and the X has {} features."
+                .format(len(self._code_maps_), n_features)
+            )
+        X_int = np.empty((X.shape[0], n_features), dtype=np.int64)
+        for i in range(n_features):
+            categories, codes = self._get_feature_codes(X, feature_idx=i)
+            code_map = self._code_maps_[i]
+            if not categories.equals(self._fit_categories_[i]):
+                # Align the codes of X to the categories seen during fit, unseen categories are unknown
+                codes_fit = self._fit_categories_[i].get_indexer(categories)
+                code_map = np.concatenate([code_map[:1], np.where(codes_fit >= 0, code_map[codes_fit + 1], -1)])
+            X_int[:, i] = code_map[codes + 1]
+        return X_int
+
     def _find_infrequent_category_indices(self, Xi):
         # TODO: this is using unique on X again. Ideally we should integrate
         # this into _encode()
@@ -464,8 +554,12 @@ class OneHotMergeRaresHandleUnknownEncoder(_BaseEncoder):
         -------
         self
         """
-        X = np.array(X).tolist() # converts all elements in X to the same type (i.e. cannot mix floats, ints, and str)
         self._validate_keywords()
+        if self._use_codes():
+            self._fit_codes(X)
+            self.drop_idx_ = None
+            return self
+        X = np.array(X).tolist() # converts all elements in X to the same type (i.e. cannot mix floats, ints, and str)
         self._fit(X, handle_unknown=self.handle_unknown)
         self.drop_idx_ = self._compute_drop_idx()
         # check if user wants to manually drop a feature that is
@@ -499,8 +593,10 @@ class OneHotMergeRaresHandleUnknownEncoder(_BaseEncoder):
         X_out : sparse matrix if sparse=True else a 2-d array
             Transformed input.
         """
-        X = np.array(X).tolist() # converts all elements in X to the same type (i.e. cannot mix floats, ints, and str)
         self._validate_keywords()
+        if self._use_codes():
+            return self.fit(X).transform(X)
+        X = np.array(X).tolist() # converts all elements in X to the same type (i.e. cannot mix floats, ints, and str)
         return super().fit_transform(X, y)
     
     def transform(self, X):
@@ -516,8 +612,10 @@ class OneHotMergeRaresHandleUnknownEncoder(_BaseEncoder):
         X_out : sparse matrix if sparse=True else a 2-d array
             Transformed input.
         """
-        X = np.array(X).tolist() # converts all elements in X to the same type (i.e. cannot mix floats, ints, and str)
         check_is_fitted(self, 'categories_')
+        if hasattr(self, '_code_maps_'):
+            return self._transform_from_codes(X)
+        X = np.array(X).tolist() # converts all elements in X to the same type (i.e. cannot mix floats, ints, and str)
         # validation of X happens in _check_X called by _transform
         X_int, X_mask = self._transform(X, handle_unknown=self.handle_unknown)
         n_samples, n_features = X_int.shape
@@ -585,6 +683,25 @@ class OneHotMergeRaresHandleUnknownEncoder(_BaseEncoder):
         else:
             return out
     
+    def _use_codes(self):
+        return self.categories == 'auto' and self.drop is None
+
+    def _transform_from_codes(self, X):
+        X_int = self._transform_codes(X)
+        n_samples, n_features = X_int.shape
+        n_columns = [len(cats) - max(infrequent_indices.size - 1, 0) for cats, infrequent_indices in zip(self.categories_, self.infrequent_indices_)]
+        feature_indices = np.cumsum([0] + n_columns)
+        X_mask = X_int >= 0  # unknown categories are encoded as all zeros
+        indices = (X_int + feature_indices[:-1])[X_mask]
+        if not self.sparse:
+            out = np.zeros((n_samples, feature_indices[-1]), dtype=self.dtype)
+            out[np.nonzero(X_mask)[0], indices] = 1
+            return out
+        indptr = np.zeros(n_samples + 1, dtype=np.int64)
+        np.cumsum(X_mask.sum(axis=1), out=indptr[1:])
+        data = np.ones(len(indices), dtype=self.dtype)
+        return sparse.csr_matrix((data, indices, indptr), shape=(n_samples, feature_indices[-1]))
+
     def inverse_transform(self, X):
         """Convert the back data to the original representation.
         
@@ -765,10 +882,12 @@ class OrdinalMergeRaresHandleUnknownEncoder(_BaseEncoder):
         self
         
         """
-        X = np.array(X).tolist()  # converts all elements in X to the same type (i.e. cannot mix floats, ints, and str)
-        self._fit(X, handle_unknown='ignore')
-
-        self.categories_as_sets_ = [set(categories) for categories in self.categories_]
+        if self.categories == 'auto':
+            self._fit_codes(X)
+        else:
+            X = np.array(X).tolist()  # converts all elements in X to the same type (i.e. cannot mix floats, ints, and str)
+            self._fit(X, handle_unknown='ignore')
+            self.categories_as_sets_ = [set(categories) for categories in self.categories_]
         # new level introduced to account for unknown categories, always = 1 + total number of categories seen during training
         self.categories_unknown_level_ = [min(len(categories), self.max_levels) for categories in self.categories_]
         self.categories_len_ = [len(categories) for categories in self.categories_]
@@ -788,6 +907,10 @@ class OrdinalMergeRaresHandleUnknownEncoder(_BaseEncoder):
             Transformed input.
         
         """
+        if hasattr(self, '_code_maps_'):
+            X_int = self._transform_codes(X)
+            X_int = np.where(X_int >= 0, X_int, np.array(self.categories_unknown_level_))  # unknown categories are mapped to the unknown level of each feature
+            return X_int.astype(self.dtype, copy=False)
         X_og_array = np.array(X)  # original X array before transform
         X = X_og_array.tolist()  # converts all elements in X to the same type (i.e. cannot mix floats, ints, and str)
         X_int, _ = self._transform(X, handle_unknown='ignore')  # will contain zeros for 0th category as well as unknown values.
@@ -18,8 +18,9 @@ class TabularNNDataset:
 
         Attributes:
             dataset (mxnet.gluon.data.dataset): Contains the raw data (use dataset._data to access).
-                                                Different indices in this list correspond to different types of inputs to the neural network (each is 2D ND array)
+                                                Different indices in this list correspond to different types of inputs to the neural network (each is 2D numpy array view into data_buffer)
                                                 All vector-valued (continuous & one-hot) features are concatenated together into a single index of the dataset.
+            data_buffer (np.ndarray): Single contiguous float32 array holding the values of all features, columns ordered as [vector, embed, language] features.
             data_desc (list[str]): Describes the data type of each index of dataset (options: 'vector','embed_<featname>', 'language_<featname>')
             dataloader (mxnet.gluon.data.DataLoader): Loads batches of data from dataset for neural net training and inference.
             embed_indices (list): which columns in dataset correspond to embed features (order matters!)
@@ -28,17 +29,17 @@ class TabularNNDataset:
             feature_dataindex_map (dict): maps feature_name -> i such that dataset._data[i] = data array for this feature. Cannot be used for vector-valued features, instead use vecfeature_col_map
             feature_groups (dict): maps feature_type (ie. 'vector' or 'embed' or 'language') to list of feature names of this type (empty list if there are no features of this type)
             vectordata_index (int): describes which element of the dataset._data list holds the vector data matrix (access via self.dataset._data[self.vectordata_index]); None if no vector features
-            label_index (int): describing which element of the dataset._data list holds labels (access via self.dataset._data[self.label_index].asnumpy()); None if no labels
+            label_index (int): describing which element of the dataset._data list holds labels (access via self.dataset._data[self.label_index]); None if no labels
             num_categories_per_embedfeature (list): Number of categories for each embedding feature (order matters!)
             num_examples (int): number of examples in this dataset
             num_features (int): number of features (we only consider original variables as features, so num_features may not correspond to dimensionality of the data eg in the case of one-hot encoding)
             num_classes (int): number of classes (only used for multiclass classification)
 
-        Note: Default numerical data-type is converted to float32 (as well as labels in regression).
+        Note: Default numerical data-type is converted to float32 (as well as labels and embedding/language feature values).
     """
 
     DATAOBJ_SUFFIX = '_tabNNdataset.pkl' # hard-coded names for files. This file contains pickled TabularNNDataset object
-    DATAVALUES_SUFFIX = '_tabNNdata.npz' # This file contains raw data values as data_list of NDArrays
+    DATAVALUES_SUFFIX = '_tabNNdata.npy' # This file contains raw data values as the contiguous data_buffer array (memory-mapped when loaded)
 
     def __init__(self, processed_array, feature_arraycol_map, feature_type_map, batch_size, num_dataloading_workers, problem_type,
                  labels=None, is_test=True):
@@ -94,40 +95,45 @@ class TabularNNDataset:
         if labels is not None and len(labels) != self.num_examples:
             raise ValueError("number of labels and training examples do not match")
 
-        data_list = [] # stores all data of each feature-type in list used to construct MXNet dataset. Each index of list = 2D NDArray.
+        data_list = [] # stores views into self.data_buffer for each feature-type used to construct MXNet dataset. Each index of list = 2D numpy array.
         self.label_index = None # int describing which element of the dataset._data list holds labels
         self.data_desc = [] # describes feature-type of each index of data_list
         self.vectordata_index = None # int describing which element of the dataset._data list holds the vector data matrix
         self.vecfeature_col_map = {} # maps vector_feature_name ->  columns of dataset._data[vector] array that contain data for this feature
         self.feature_dataindex_map = {} # maps feature_name -> i such that dataset._data[i] = data array for this feature. Cannot be used for vector-valued features, instead use: self.vecfeature_col_map
 
-        if len(self.feature_groups['vector']) > 0:
-            vector_inds = [] # columns of processed_array corresponding to vector data
+        # All features are stored in a single contiguous float32 buffer whose columns are ordered as: [vector features, embed features, language features].
+        # Each feature-group is a view into this buffer, so the data is held in memory only once (and shared copy-on-write by forked dataloading workers).
+        buffer_cols = [] # columns of processed_array in the order they are stored in self.data_buffer
+        vector_inds = [] # columns of processed_array corresponding to vector data
+        for feature in feature_type_map:
+            if feature_type_map[feature] == 'vector':
+                current_last_ind = len(vector_inds) # current last index of the vector datamatrix
+                vector_inds += feature_arraycol_map[feature]
+                new_last_ind = len(vector_inds) # new last index of the vector datamatrix
+                self.vecfeature_col_map[feature] = list(range(current_last_ind, new_last_ind))
+        buffer_cols += vector_inds
+        nonvector_colslices = [] # (feature_type, feature, slice of self.data_buffer columns) for each embed & language feature
+        for feature_type in ['embed', 'language']:
             for feature in feature_type_map:
-                if feature_type_map[feature] == 'vector':
-                    current_last_ind = len(vector_inds) # current last index of the vector datamatrix
-                    vector_inds += feature_arraycol_map[feature]
-                    new_last_ind = len(vector_inds) # new last index of the vector datamatrix
-                    self.vecfeature_col_map[feature] = list(range(current_last_ind, new_last_ind))
-            data_list.append(mx.nd.array(processed_array[:,vector_inds], dtype='float32')) # Matrix of data from all vector features
+                if feature_type_map[feature] == feature_type:
+                    feature_colinds = feature_arraycol_map[feature]
+                    nonvector_colslices.append((feature_type, feature, slice(len(buffer_cols), len(buffer_cols) + len(feature_colinds))))
+                    buffer_cols += feature_colinds
+        self.data_buffer = self._create_data_buffer(processed_array, buffer_cols)
+
+        self.buffer_col_slices = [] # slice of self.data_buffer columns corresponding to each feature-type index of data_list
+        if vector_inds:
+            self.buffer_col_slices.append(slice(0, len(vector_inds)))
+            data_list.append(self.data_buffer[:, :len(vector_inds)]) # Matrix of data from all vector features
             self.data_desc.append("vector")
             self.vectordata_index = len(data_list) - 1
 
-        if len(self.feature_groups['embed']) > 0:
-            for feature in feature_type_map:
-                if feature_type_map[feature] == 'embed':
-                    feature_colind = feature_arraycol_map[feature]
-                    data_list.append(mx.nd.array(processed_array[:,feature_colind], dtype='int32')) # array of ints with data for this embedding feature
-                    self.data_desc.append("embed")
-                    self.feature_dataindex_map[feature]  = len(data_list)-1
-
-        if len(self.feature_groups['language']) > 0:
-            for feature in feature_type_map:
-                if feature_type_map[feature] == 'language':
-                    feature_colinds = feature_arraycol_map[feature]
-                    data_list.append(mx.nd.array(processed_array[:,feature_colinds], dtype='int32')) # array of ints with data for this language feature
-                    self.data_desc.append("language")
-                    self.feature_dataindex_map[feature]  = len(data_list)-1
+        for feature_type, feature, col_slice in nonvector_colslices:
+            self.buffer_col_slices.append(col_slice)
+            data_list.append(self.data_buffer[:, col_slice]) # integer-valued data for this embedding/language feature (stored as float32)
+            self.data_desc.append(feature_type)
+            self.feature_dataindex_map[feature] = len(data_list)-1
 
         self.num_classes = None
         if labels is not None:
@@ -137,13 +143,11 @@ class TabularNNDataset:
             self.num_classes = None
             if self.problem_type == SOFTCLASS:
                 self.num_classes = labels.shape[1]
-                data_list.append(mx.nd.array(labels))
+                data_list.append(labels.astype(np.float32, copy=False))
             else:
-                if self.problem_type == REGRESSION and labels.dtype != np.float32:
-                    labels = labels.astype('float32') # Convert to proper float-type if not already
-                elif self.problem_type in [BINARY, MULTICLASS]:
+                if self.problem_type in [BINARY, MULTICLASS]:
                     self.num_classes = len(set(labels))
-                data_list.append(mx.nd.array(labels.reshape(len(labels),1)))
+                data_list.append(labels.astype(np.float32, copy=False).reshape(len(labels),1))
 
         self.embed_indices = [i for i in range(len(self.data_desc)) if 'embed' in self.data_desc[i]] # list of indices of embedding features in self.dataset, order matters!
         self.language_indices = [i for i in range(len(self.data_desc)) if 'language' in self.data_desc[i]]  # list of indices of language features in self.dataset, order matters!
@@ -152,8 +156,21 @@ class TabularNNDataset:
         if not self.is_test:
             self.num_categories_per_embedfeature = self.getNumCategoriesEmbeddings()
 
+    @staticmethod
+    def _create_data_buffer(processed_array, buffer_cols):
+        """ Returns contiguous float32 array holding columns `buffer_cols` of processed_array (in this order).
+            Avoids any copy if processed_array is already a float32 array in the required column order.
+        """
+        num_examples = processed_array.shape[0]
+        if list(buffer_cols) == list(range(processed_array.shape[1])):
+            return np.ascontiguousarray(processed_array, dtype=np.float32)
+        data_buffer = np.empty((num_examples, len(buffer_cols)), dtype=np.float32)
+        for i, col in enumerate(buffer_cols): # column-by-column to avoid materializing a reordered copy of processed_array
+            data_buffer[:, i] = processed_array[:, col]
+        return data_buffer
+
     def generate_dataset_and_dataloader(self, data_list):
-        self.dataset = mx.gluon.data.dataset.ArrayDataset(*data_list)  # Access ith embedding-feature via: self.dataset._data[self.data_desc.index('embed_'+str(i))].asnumpy()
+        self.dataset = mx.gluon.data.dataset.ArrayDataset(*data_list)  # Access ith embedding-feature via: self.dataset._data[self.data_desc.index('embed_'+str(i))]
         self.dataloader = mx.gluon.data.DataLoader(
             self.dataset, self.batch_size, shuffle=not self.is_test,
             last_batch='keep' if self.is_test else 'rollover',
@@ -186,9 +203,9 @@ class TabularNNDataset:
         """ Returns numpy array of labels for this dataset """
         if self.label_index is not None:
             if self.problem_type == SOFTCLASS:
-                return self.dataset._data[self.label_index].asnumpy()
+                return self.dataset._data[self.label_index]
             else:
-                return self.dataset._data[self.label_index].asnumpy().flatten()
+                return self.dataset._data[self.label_index].flatten()
         else:
             return None
 
@@ -228,9 +245,9 @@ class TabularNNDataset:
         else:
             raise ValueError("Unknown feature specified: " % feature)
         if asnumpy:
-            return feature_data.asnumpy()
-        else:
             return feature_data
+        else:
+            return mx.nd.array(feature_data)
 
     def get_feature_batch(self, feature, data_batch, asnumpy=False):
         """ Returns part of this batch corresponding to data from a single feature
@@ -302,20 +319,36 @@ class TabularNNDataset:
         """ Additional naming changes will be appended to end of file_prefix (must contain full absolute path) """
         dataobj_file = file_prefix + self.DATAOBJ_SUFFIX
         datalist_file = file_prefix + self.DATAVALUES_SUFFIX
-        data_list = self.dataset._data
+        data_buffer = self.data_buffer
+        labels = self.dataset._data[self.label_index] if self.label_index is not None else None
         self.dataset = None  # Avoid pickling these
         self.dataloader = None
+        self.data_buffer = None
+        self._labels = labels  # labels are small, pickle them with the object
         save_pkl.save(path=dataobj_file, object=self)
-        mx.nd.save(datalist_file, data_list)
+        with open(datalist_file, 'wb') as f:
+            np.save(f, data_buffer)
+        self._labels = None
+        self.data_buffer = data_buffer
         logger.debug("TabularNN Dataset saved to files: \n %s \n %s" % (dataobj_file, datalist_file))
 
     @classmethod
-    def load(cls, file_prefix=""):
-        """ Additional naming changes will be appended to end of file_prefix (must contain full absolute path) """
+    def load(cls, file_prefix="", mmap_mode='r'):
+        """ Additional naming changes will be appended to end of file_prefix (must contain full absolute path).
+            By default the data values are memory-mapped, so that multiple processes loading the same dataset share a single copy.
+        """
         dataobj_file = file_prefix + cls.DATAOBJ_SUFFIX
         datalist_file = file_prefix + cls.DATAVALUES_SUFFIX
         dataset: TabularNNDataset = load_pkl.load(path=dataobj_file)
-        data_list = mx.nd.load(datalist_file)
-        dataset.generate_dataset_and_dataloader(data_list=data_list)
+        dataset.data_buffer = np.load(datalist_file, mmap_mode=mmap_mode)
+        dataset.generate_dataset_and_dataloader(data_list=dataset._get_data_list())
+        dataset._labels = None
         logger.debug("TabularNN Dataset loaded from files: \n %s \n %s" % (dataobj_file, datalist_file))
         return dataset
+
+    def _get_data_list(self):
+        """ Reconstructs the list of per-feature-type views into self.data_buffer (followed by labels), in the order described by self.data_desc """
+        data_list = [self.data_buffer[:, col_slice] for col_slice in self.buffer_col_slices]
+        if self.label_index is not None:
+            data_list.append(self._labels)
+        return data_list
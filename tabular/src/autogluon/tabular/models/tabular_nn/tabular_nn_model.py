@@ -17,10 +17,6 @@ from collections import OrderedDict
 
 import numpy as np
 import pandas as pd
-from sklearn.compose import ColumnTransformer
-from sklearn.impute import SimpleImputer
-from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler, QuantileTransformer, FunctionTransformer  # PowerTransformer
 
 from autogluon.core import Space
 from autogluon.core.constants import BINARY, MULTICLASS, REGRESSION, SOFTCLASS
@@ -57,9 +53,9 @@ class TabularNeuralNetModel(AbstractNeuralNetworkModel):
 
     # Constants used throughout this class:
     # model_internals_file_name = 'model-internals.pkl' # store model internals here
-    unique_category_str = '!missing!' # string used to represent missing values and unknown categories for categorical features. Should not appear in the dataset
     params_file_name = 'net.params' # Stores parameters of final network
     temp_file_name = 'temp_net.params' # Stores temporary network parameters (eg. during the course of training)
+    predict_batch_size = 8192  # number of rows per forward pass when predicting directly from a processed array (larger than training batch-size since no gradients are stored)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -115,7 +111,7 @@ class TabularNeuralNetModel(AbstractNeuralNetworkModel):
         elif self.problem_type == REGRESSION:
             self.num_net_outputs = 1
             if params['y_range'] is None:  # Infer default y-range
-                y_vals = train_dataset.dataset._data[train_dataset.label_index].asnumpy()
+                y_vals = train_dataset.get_labels()
                 min_y = float(min(y_vals))
                 max_y = float(max(y_vals))
                 std_y = np.std(y_vals)
@@ -443,7 +439,9 @@ class TabularNeuralNetModel(AbstractNeuralNetworkModel):
         from .tabular_nn_dataset import TabularNNDataset
         import mxnet as mx
         if process:
-            new_data = self.process_test_data(new_data, batch_size=self.batch_size, num_dataloading_workers=self.num_dataloading_workers_inference, labels=None)
+            # Direct inference path: avoids constructing a TabularNNDataset and DataLoader for the new data.
+            processed_array = self.process_test_array(new_data)
+            return self._predict_processed_array(processed_array, predict_proba=predict_proba)
         if not isinstance(new_data, TabularNNDataset):
             raise ValueError("new_data must of of type TabularNNDataset if process=False")
         if self.problem_type == REGRESSION or not predict_proba:
@@ -469,6 +467,56 @@ class TabularNeuralNetModel(AbstractNeuralNetworkModel):
 
         return preds.asnumpy()  # return 2D numpy array
 
+    def _predict_processed_array(self, processed_array, predict_proba=True):
+        """ Produces predictions from the 2D numpy array output by self.processor, without a TabularNNDataset/DataLoader.
+            Rows are fed to the network in slices of `self.predict_batch_size`, output format matches _predict_tabular_data().
+        """
+        import mxnet as mx
+        num_examples = processed_array.shape[0]
+        vector_inds, embed_inds = self._get_network_input_inds()
+        if self.problem_type == REGRESSION or not predict_proba:
+            preds = np.empty((num_examples, 1), dtype=np.float32)
+        else:
+            preds = np.empty((num_examples, self.num_net_outputs), dtype=np.float32)
+        batch_size = max(self.predict_batch_size, 1)
+        for start in range(0, num_examples, batch_size):
+            end = min(start + batch_size, num_examples)
+            data_batch = {}
+            if vector_inds is not None:
+                data_batch['vector'] = mx.nd.array(processed_array[start:end, vector_inds], ctx=self.ctx, dtype='float32')
+            if embed_inds:
+                data_batch['embed'] = [mx.nd.array(processed_array[start:end, feature_colinds], ctx=self.ctx, dtype='int32') for feature_colinds in embed_inds]
+            preds_batch = self.model(data_batch)
+            if self.problem_type != REGRESSION:
+                if not predict_proba:  # need to take argmax
+                    preds_batch = mx.nd.argmax(preds_batch, axis=1, keepdims=True)
+                else:  # need to take softmax
+                    preds_batch = mx.nd.softmax(preds_batch, axis=1)
+            preds[start:end] = preds_batch.asnumpy()
+        if self.problem_type == REGRESSION or not predict_proba:
+            return preds.flatten()  # return 1D numpy array
+        elif self.problem_type == BINARY and predict_proba:
+            return preds[:, 1]  # for binary problems, only return P(Y==+1)
+        return preds  # return 2D numpy array
+
+    def _get_network_input_inds(self):
+        """ Returns column-indices of the processed array which feed each input block of the network, in the same order as TabularNNDataset.
+            Returns tuple (vector_inds, embed_inds): vector_inds is list of columns of the vector data matrix (None if no vector features),
+            embed_inds is list containing the list of columns for each embedding feature.
+        """
+        vector_inds = []
+        embed_inds = []
+        for feature, feature_type in self.feature_type_map.items():
+            if feature_type == 'vector':
+                vector_inds += self.feature_arraycol_map[feature]
+            elif feature_type == 'embed':
+                embed_inds.append(self.feature_arraycol_map[feature])
+            elif feature_type == 'language':
+                raise NotImplementedError("language_features cannot be used at the moment")
+        if not vector_inds:
+            vector_inds = None
+        return vector_inds, embed_inds
+
     def generate_datasets(self, X, y, params, X_val=None, y_val=None):
         impute_strategy = params['proc.impute_strategy']
         max_category_levels = params['proc.max_category_levels']
@@ -508,9 +556,16 @@ class TabularNeuralNetModel(AbstractNeuralNetworkModel):
             Dataset object
         """
         from .tabular_nn_dataset import TabularNNDataset
-        warnings.filterwarnings("ignore", module='sklearn.preprocessing') # sklearn processing n_quantiles warning
         if labels is not None and len(labels) != len(df):
             raise ValueError("Number of examples in Dataframe does not match number of labels")
+        df = self.process_test_array(df)
+        return TabularNNDataset(df, self.feature_arraycol_map, self.feature_type_map,
+                                batch_size=batch_size, num_dataloading_workers=num_dataloading_workers,
+                                problem_type=self.problem_type, labels=labels, is_test=True)
+
+    def process_test_array(self, df):
+        """ Process test DataFrame into the 2D float32 numpy array consumed by the neural network, using the previously fit self.processor. """
+        warnings.filterwarnings("ignore", module='sklearn.preprocessing') # sklearn processing n_quantiles warning
         if (self.processor is None or self._types_of_features is None
            or self.feature_arraycol_map is None or self.feature_type_map is None):
             raise ValueError("Need to process training data before test data")
@@ -519,10 +574,8 @@ class TabularNeuralNetModel(AbstractNeuralNetworkModel):
             if drop_cols:
                 df = df.drop(columns=drop_cols)
 
-        df = self.processor.transform(df) # 2D numpy array. self.feature_arraycol_map, self.feature_type_map have been previously set while processing training data.
-        return TabularNNDataset(df, self.feature_arraycol_map, self.feature_type_map,
-                                batch_size=batch_size, num_dataloading_workers=num_dataloading_workers,
-                                problem_type=self.problem_type, labels=labels, is_test=True)
+        processed_array = self.processor.transform(df) # 2D numpy array. self.feature_arraycol_map, self.feature_type_map have been previously set while processing training data.
+        return np.asarray(processed_array, dtype=np.float32)
 
     def process_train_data(self, df, batch_size, num_dataloading_workers, impute_strategy, max_category_levels, skew_threshold, embed_min_categories, use_ngram_features, labels):
         """ Preprocess training data and create self.processor object that can be used to process future data.
@@ -639,6 +692,10 @@ class TabularNeuralNetModel(AbstractNeuralNetworkModel):
 
     def _create_preprocessor(self, impute_strategy, max_category_levels):
         """ Defines data encoders used to preprocess different data types and creates instance variable which is sklearn ColumnTransformer object """
+        from sklearn.compose import ColumnTransformer
+        from sklearn.impute import SimpleImputer
+        from sklearn.pipeline import Pipeline
+        from sklearn.preprocessing import StandardScaler, QuantileTransformer  # PowerTransformer
         if self.processor is not None:
             Warning("Attempting to process training data for TabularNeuralNetModel, but previously already did this.")
         continuous_features = self._types_of_features['continuous']
@@ -659,15 +716,11 @@ class TabularNeuralNetModel(AbstractNeuralNetworkModel):
             transformers.append( ('skewed', power_transformer, skewed_features) )
         if onehot_features:
             onehot_transformer = Pipeline(steps=[
-                # TODO: Consider avoiding converting to string for improved memory efficiency
-                ('to_str', FunctionTransformer(convert_df_dtype_to_str)),
-                ('imputer', SimpleImputer(strategy='constant', fill_value=self.unique_category_str)),
+                # Features are encoded from their category codes, missing values are treated as their own category
                 ('onehot', OneHotMergeRaresHandleUnknownEncoder(max_levels=max_category_levels, sparse=False))])  # test-time unknown values will be encoded as all zeros vector
             transformers.append( ('onehot', onehot_transformer, onehot_features) )
         if embed_features:  # Ordinal transformer applied to convert to-be-embedded categorical features to integer levels
             ordinal_transformer = Pipeline(steps=[
-                ('to_str', FunctionTransformer(convert_df_dtype_to_str)),
-                ('imputer', SimpleImputer(strategy='constant', fill_value=self.unique_category_str)),
                 ('ordinal', OrdinalMergeRaresHandleUnknownEncoder(max_levels=max_category_levels))])  # returns 0-n when max_category_levels = n-1. category n is reserved for unknown test-time categories.
             transformers.append( ('ordinal', ordinal_transformer, embed_features) )
         if language_features:
@@ -701,8 +754,8 @@ class TabularNeuralNetModel(AbstractNeuralNetworkModel):
             from .embednet import EmbedNet
             model.model = EmbedNet(architecture_desc=model._architecture_desc, ctx=model.ctx)  # recreate network from architecture description
             model._architecture_desc = None
-            # TODO: maybe need to initialize/hybridize?
             model.model.load_parameters(model.path + model.params_file_name, ctx=model.ctx)
+            model.model.hybridize(static_alloc=True)  # reuse cached graph & memory across predict calls
             model.summary_writer = None
         return model
 
@@ -782,10 +835,6 @@ class TabularNeuralNetModel(AbstractNeuralNetworkModel):
         return self.eval_metric
 
 
-def convert_df_dtype_to_str(df):
-    return df.astype(str)
-
-
 """ General TODOs:
 
 - Automatically decrease batch-size if memory issue arises
@@ -20,6 +20,8 @@ class XGBoostModel(AbstractModel):
 
     Hyperparameter options: https://xgboost.readthedocs.io/en/latest/parameter.html
     """
+    _num_threads_param_name = 'n_jobs'
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._ohe_generator = None
@@ -74,6 +76,7 @@ class XGBoostModel(AbstractModel):
         start_time = time.time()
 
         params = self.params.copy()
+        params = self._set_num_threads_param(params, num_cpus=kwargs.get('num_cpus', None))
         max_category_levels = params.pop('proc.max_category_levels', 100)
 
         verbosity = kwargs.get('verbosity', 2)
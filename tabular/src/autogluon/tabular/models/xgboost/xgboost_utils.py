@@ -1,12 +1,9 @@
 import numpy as np
 from collections import OrderedDict
-from scipy.sparse import hstack, csr_matrix
+from scipy.sparse import csr_matrix
 from sklearn.base import BaseEstimator, TransformerMixin
-from sklearn.preprocessing import OneHotEncoder
 from autogluon.core.constants import BINARY, MULTICLASS, REGRESSION, SOFTCLASS
 
-from ..tabular_nn.categorical_encoders import OneHotMergeRaresHandleUnknownEncoder
-
 
 _ag_to_xgbm_metric_dict = {
     BINARY: dict(
@@ -94,31 +91,68 @@ def func_generator(metric, is_higher_better, needs_pred_proba, problem_type):
 
 
 class OheFeatureGenerator(BaseEstimator, TransformerMixin):
+    """
+    Converts a DataFrame into a CSR matrix for XGBoost by one-hot encoding its category features and appending its other (numeric) features.
+
+    Category features are encoded directly from their pandas category codes with NumPy, without converting the values to strings.
+    Missing values are treated as their own category if present during fit, and categories unseen during fit are mapped to an all zeros vector.
+    If `max_levels` is specified, only the `max_levels` most frequent categories of a feature get their own column,
+    the remaining categories are merged into a single column placed after them.
+    As with `scipy.sparse.csr_matrix`, zeros of numeric features are not stored, and are therefore treated as missing by XGBoost.
+    """
     null_category_str = '!missing!'
+    rare_category_str = '!rare!'
 
     def __init__(self, max_levels=None):
         self._feature_map = OrderedDict()  # key: feature_name, value: feature_type
         self.labels = OrderedDict()
         self.cat_cols = []
         self.other_cols = []
-        self.ohe_encs = None
-        self.max_levels=max_levels
+        self.max_levels = max_levels
+        self._categories = dict()  # key: cat_col, value: categories of the column during fit
+        self._code_maps = dict()  # key: cat_col, value: array mapping (category code + 1) to output column offset within the feature, -1 = all zeros
+        self._cat_num_columns = []  # number of output columns of each cat_col
 
     def fit(self, X, y=None):
         self.cat_cols = list(X.select_dtypes(include='category').columns)
         self.other_cols = list(X.select_dtypes(exclude='category').columns)
-        self.ohe_encs = OneHotMergeRaresHandleUnknownEncoder(max_levels=self.max_levels)
-
-        if self.cat_cols:
-            self.ohe_encs.fit(self._normalize(X[self.cat_cols]))
-            assert len(self.cat_cols) == len(self.ohe_encs.categories_)
-            
-            for cat_col, categories in zip(self.cat_cols, self.ohe_encs.categories_):
-                categories_ = categories.tolist()
-                self.labels[cat_col] = categories_
-                # Update feature map ({name: type})
-                for category in categories_:
-                    self._feature_map[f"{cat_col}_{category}"] = 'i'  # one-hot encoding data type is boolean
+        self._feature_map = OrderedDict()
+        self.labels = OrderedDict()
+        self._categories = dict()
+        self._code_maps = dict()
+        self._cat_num_columns = []
+
+        for cat_col in self.cat_cols:
+            categories = X[cat_col].cat.categories
+            codes = X[cat_col].cat.codes.to_numpy()
+            # counts[0] is the count of missing values (code -1), counts[i+1] the count of category i
+            counts = np.bincount(codes + 1, minlength=len(categories) + 1)
+            present = np.flatnonzero(counts)
+            # Missing values are ordered after the categories
+            present = np.concatenate([present[present != 0], present[present == 0]])
+            if self.max_levels is not None and len(present) > self.max_levels:
+                frequent_order = np.argsort(-counts[present], kind='stable')
+                frequent = np.sort(present[frequent_order[:self.max_levels]])
+                frequent = np.concatenate([frequent[frequent != 0], frequent[frequent == 0]])
+                rare = present[frequent_order[self.max_levels:]]
+            else:
+                frequent = present
+                rare = np.array([], dtype=present.dtype)
+            code_map = np.full(len(categories) + 1, -1, dtype=np.int64)
+            code_map[frequent] = np.arange(len(frequent))
+            if len(rare) > 0:
+                code_map[rare] = len(frequent)
+            self._categories[cat_col] = categories
+            self._code_maps[cat_col] = code_map
+            self._cat_num_columns.append(len(frequent) + (1 if len(rare) > 0 else 0))
+
+            labels = [categories[code - 1] if code != 0 else self.null_category_str for code in frequent]
+            if len(rare) > 0:
+                labels.append(self.rare_category_str)
+            self.labels[cat_col] = labels
+            # Update feature map ({name: type})
+            for category in labels:
+                self._feature_map[f"{cat_col}_{category}"] = 'i'  # one-hot encoding data type is boolean
 
         if self.other_cols:
             for c in self.other_cols:
@@ -126,15 +160,38 @@ class OheFeatureGenerator(BaseEstimator, TransformerMixin):
         return self
 
     def transform(self, X, y=None):
-        X_list = []
-        if self.cat_cols:
-            X_list.append(self.ohe_encs.transform(self._normalize(X[self.cat_cols])))
+        num_rows = len(X)
+        num_cat_cols = len(self.cat_cols)
+        num_cols_out = sum(self._cat_num_columns) + len(self.other_cols)
+        # Column index and value of every potential non-zero entry in row-major order, one per input feature, masked by `nonzero`
+        indices = np.empty((num_rows, num_cat_cols + len(self.other_cols)), dtype=np.int32)
+        data = np.ones((num_rows, num_cat_cols + len(self.other_cols)), dtype=np.float32)
+        nonzero = np.empty((num_rows, num_cat_cols + len(self.other_cols)), dtype=bool)
+
+        col_offset = 0
+        for i, cat_col in enumerate(self.cat_cols):
+            feature = X[cat_col]
+            code_map = self._code_maps[cat_col]
+            if not feature.cat.categories.equals(self._categories[cat_col]):
+                # Align the codes of X to the categories seen during fit, unseen categories are mapped to all zeros
+                codes_fit = self._categories[cat_col].get_indexer(feature.cat.categories)
+                code_map_aligned = np.full(len(codes_fit) + 1, -1, dtype=np.int64)
+                code_map_aligned[0] = code_map[0]
+                code_map_aligned[1:][codes_fit >= 0] = code_map[codes_fit[codes_fit >= 0] + 1]
+                code_map = code_map_aligned
+            col_out = code_map[feature.cat.codes.to_numpy() + 1]
+            nonzero[:, i] = col_out >= 0
+            indices[:, i] = col_out + col_offset
+            col_offset += self._cat_num_columns[i]
         if self.other_cols:
-            X_list.append(csr_matrix(X[self.other_cols]))
-        return hstack(X_list, format="csr")
-
-    def _normalize(self, X):
-        return X.replace(np.nan, self.null_category_str)
+            X_other = X[self.other_cols].to_numpy(dtype=np.float32)
+            data[:, num_cat_cols:] = X_other
+            nonzero[:, num_cat_cols:] = X_other != 0
+            indices[:, num_cat_cols:] = np.arange(col_offset, col_offset + len(self.other_cols), dtype=np.int32)
+
+        indptr = np.zeros(num_rows + 1, dtype=np.int64)
+        np.cumsum(nonzero.sum(axis=1), out=indptr[1:])
+        return csr_matrix((data[nonzero], indices[nonzero], indptr), shape=(num_rows, num_cols_out))
 
     def get_feature_names(self):
         return list(self._feature_map.keys())
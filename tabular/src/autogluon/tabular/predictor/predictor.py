@@ -192,6 +192,7 @@ class TabularPredictor:
                                                       sample_weight=self.sample_weight, weight_evaluation=self.weight_evaluation, **learner_kwargs)
         self._learner_type = type(self._learner)
         self._trainer = None
+        self._load_time_info = None
 
     @property
     def class_labels(self):
@@ -499,6 +500,13 @@ class TabularPredictor:
                 Reference `hyperparameters` documentation for what models correspond to each value.
                 Useful when a particular model type such as 'KNN' or 'custom' is not desired but altering the `hyperparameters` dictionary is difficult or time-consuming.
                     Example: To exclude both 'KNN' and 'custom' models, specify `excluded_model_types=['KNN', 'custom']`.
+            num_parallel_models : int or str, default = 1
+                Number of models of a stack level to train at the same time, each in its own worker process.
+                The CPUs available to AutoGluon are shared between the models trained at the same time, which is much faster than training the models one at a time on machines with many CPUs, as most models do not scale well beyond 8 CPUs.
+                If 'auto', trains as many models at the same time as there are groups of 8 CPUs.
+                The number of models trained at the same time is reduced if there is not enough memory for each worker process to hold a copy of the training data.
+                Models which are hyperparameter tuned or use GPUs are trained one at a time.
+                Note: The worker processes are started with the 'forkserver' method, so a script calling `fit` with `num_parallel_models` must guard its entry point with `if __name__ == '__main__':`.
             refit_full : bool or str, default = False
                 Whether to retrain all models on all of the data (training + validation) after the normal training procedure.
                 This is equivalent to calling `predictor.refit_full(model=refit_full)` after fit.
@@ -685,7 +693,8 @@ class TabularPredictor:
                 ag_args_ensemble = {}
             ag_args_ensemble['save_bag_folds'] = kwargs['_save_bag_folds']
 
-        core_kwargs = {'ag_args': ag_args, 'ag_args_ensemble': ag_args_ensemble, 'ag_args_fit': ag_args_fit, 'excluded_model_types': excluded_model_types}
+        core_kwargs = {'ag_args': ag_args, 'ag_args_ensemble': ag_args_ensemble, 'ag_args_fit': ag_args_fit, 'excluded_model_types': excluded_model_types,
+                       'num_parallel_models': kwargs['num_parallel_models']}
         self._learner.fit(X=train_data, X_val=tuning_data, X_unlabeled=unlabeled_data,
                           holdout_frac=holdout_frac, num_bag_folds=num_bag_folds, num_bag_sets=num_bag_sets, num_stack_levels=num_stack_levels,
                           hyperparameters=hyperparameters, core_kwargs=core_kwargs, time_limit=time_limit, verbosity=verbosity)
@@ -696,11 +705,12 @@ class TabularPredictor:
             refit_full=kwargs['refit_full'],
             set_best_to_refit_full=kwargs['set_best_to_refit_full'],
             save_space=kwargs['save_space'],
+            num_parallel_models=kwargs['num_parallel_models'],
         )
         self.save()
         return self
 
-    def _post_fit(self, keep_only_best=False, refit_full=False, set_best_to_refit_full=False, save_space=False):
+    def _post_fit(self, keep_only_best=False, refit_full=False, set_best_to_refit_full=False, save_space=False, num_parallel_models=1):
         if refit_full is True:
             if keep_only_best is True:
                 if set_best_to_refit_full is True:
@@ -713,7 +723,7 @@ class TabularPredictor:
 
         if refit_full is not False:
             trainer_model_best = self._trainer.get_model_best()
-            self.refit_full(model=refit_full)
+            self.refit_full(model=refit_full, num_parallel_models=num_parallel_models)
             if set_best_to_refit_full:
                 if trainer_model_best in self._trainer.model_full_dict.keys():
                     self._trainer.model_best = self._trainer.model_full_dict[trainer_model_best]
@@ -800,7 +810,8 @@ class TabularPredictor:
             num_stack_levels = highest_level
 
         # TODO: make core_kwargs a kwargs argument to predictor.fit, add aux_kwargs to predictor.fit
-        core_kwargs = {'ag_args': ag_args, 'ag_args_ensemble': ag_args_ensemble, 'ag_args_fit': ag_args_fit, 'excluded_model_types': excluded_model_types}
+        core_kwargs = {'ag_args': ag_args, 'ag_args_ensemble': ag_args_ensemble, 'ag_args_fit': ag_args_fit, 'excluded_model_types': excluded_model_types,
+                       'num_parallel_models': kwargs['num_parallel_models']}
 
         # TODO: Add special error message if called and training/val data was not cached.
         X, y, X_val, y_val = self._trainer.load_data()
@@ -825,6 +836,7 @@ class TabularPredictor:
             refit_full=kwargs['refit_full'],
             set_best_to_refit_full=kwargs['set_best_to_refit_full'],
             save_space=kwargs['save_space'],
+            num_parallel_models=kwargs['num_parallel_models'],
         )
         self.save()
         return self
@@ -1416,6 +1428,8 @@ class TabularPredictor:
             Proportion of total available memory to allow for the persisted models to use.
             If the models' summed memory usage requires a larger proportion of memory than max_memory, they are not persisted. In this case, the output will be an empty list.
             If None, then models are persisted regardless of estimated memory usage. This can cause out-of-memory errors.
+            To instead keep as many of the most recently used models of all predictors in the process in memory as fit in a fixed number of bytes,
+            use `autogluon.core.utils.set_model_cache_max_memory`. Models which are not persisted are then loaded through this cache.
 
         Returns
         -------
@@ -1442,7 +1456,7 @@ class TabularPredictor:
         """
         return self._learner.load_trainer().unpersist_models(model_names=models)
 
-    def refit_full(self, model='all'):
+    def refit_full(self, model='all', num_parallel_models=1):
         """
         Retrain model on all of the data (training + validation).
         For bagged models:
@@ -1472,12 +1486,15 @@ class TabularPredictor:
                 If 'best' then the model with the highest validation score is refit.
             All ancestor models will also be refit in the case that the selected model is a weighted or stacker ensemble.
             Valid models are listed in this `predictor` by calling `predictor.get_model_names()`.
+        num_parallel_models : int or str, default = 1
+            Number of models of a stack level to refit at the same time, each in its own worker process.
+            Refer to the `num_parallel_models` argument of `fit()` for details. `fit()` passes its own value when `refit_full` is set.
 
         Returns
         -------
         Dictionary of original model names -> refit_full model names.
         """
-        refit_full_dict = self._learner.refit_ensemble_full(model=model)
+        refit_full_dict = self._learner.refit_ensemble_full(model=model, num_parallel_models=num_parallel_models)
         return refit_full_dict
 
     def get_model_best(self):
@@ -1523,7 +1540,7 @@ class TabularPredictor:
     # TODO: Move code logic to learner/trainer
     # TODO: Add fit() arg to perform this automatically at end of training
     # TODO: Consider adding cutoff arguments such as top-k models
-    def fit_weighted_ensemble(self, base_models: list = None, name_suffix='Best', expand_pareto_frontier=False, time_limit=None):
+    def fit_weighted_ensemble(self, base_models: list = None, name_suffix='Best', expand_pareto_frontier=False, time_limit=None, infer_limit: float = None, memory_limit: int = None):
         """
         Fits new weighted ensemble models to combine predictions of previously-trained models.
         `cache_data` must have been set to `True` during the original training to enable this functionality.
@@ -1545,6 +1562,17 @@ class TabularPredictor:
         time_limit : int, default = None
             Time in seconds each weighted ensemble model is allowed to train for. If `expand_pareto_frontier=True`, the `time_limit` value is applied to each model.
             If None, the ensemble models train without time restriction.
+        infer_limit : float, default = None
+            Maximum inference time in seconds per row of the weighted ensemble, including the time of all models it depends on.
+            The ensemble only selects base models such that the estimated inference time of the models it requires stays within this budget, maximizing the validation score.
+            Inference times are estimated from the validation inference times shown by `leaderboard()` (batch inference), so leave headroom for latency targets such as a p99 SLA on single rows.
+            Base models whose inference time is unknown (such as refit models) are not considered.
+            If no base model satisfies the budget, the ensemble uses the single model closest to it.
+            If None, inference time is not restricted.
+        memory_limit : int, default = None
+            Maximum memory in bytes of the models the weighted ensemble depends on, as estimated by `memory_size` in `leaderboard(extra_info=True)`.
+            Handled the same way as `infer_limit`, both can be specified together.
+            If None, memory is not restricted.
 
         Returns
         -------
@@ -1579,11 +1607,13 @@ class TabularPredictor:
                 models_to_check_now = models_to_check[:i + 1]
                 max_base_model_level = max([trainer.get_model_level(base_model) for base_model in models_to_check_now])
                 weighted_ensemble_level = max_base_model_level + 1
-                models += trainer.generate_weighted_ensemble(X=X_stack_preds, y=y, level=weighted_ensemble_level, stack_name=stack_name, base_model_names=models_to_check_now, name_suffix=name_suffix + '_Pareto' + str(i), time_limit=time_limit)
+                models += trainer.generate_weighted_ensemble(X=X_stack_preds, y=y, level=weighted_ensemble_level, stack_name=stack_name, base_model_names=models_to_check_now, name_suffix=name_suffix + '_Pareto' + str(i), time_limit=time_limit,
+                                                             infer_limit=infer_limit, memory_limit=memory_limit)
 
         max_base_model_level = max([trainer.get_model_level(base_model) for base_model in base_models])
         weighted_ensemble_level = max_base_model_level + 1
-        models += trainer.generate_weighted_ensemble(X=X_stack_preds, y=y, level=weighted_ensemble_level, stack_name=stack_name, base_model_names=base_models, name_suffix=name_suffix, time_limit=time_limit)
+        models += trainer.generate_weighted_ensemble(X=X_stack_preds, y=y, level=weighted_ensemble_level, stack_name=stack_name, base_model_names=base_models, name_suffix=name_suffix, time_limit=time_limit,
+                                                     infer_limit=infer_limit, memory_limit=memory_limit)
 
         return models
 
@@ -1844,6 +1874,39 @@ class TabularPredictor:
                 models_to_keep = self._trainer.get_model_best()
         self._trainer.delete_models(models_to_keep=models_to_keep, models_to_delete=models_to_delete, allow_delete_cascade=allow_delete_cascade, delete_from_disk=delete_from_disk, dry_run=dry_run)
 
+    def optimize_for_deployment(self, model: str = None, refit_stackers=True, delete_from_disk=True, dry_run=True) -> dict:
+        """
+        Deletes all models that are not required to predict with `model`, after optionally refitting the stacker models it depends on to remove base models which do not contribute to their predictions.
+        Weighted ensembles only depend on base models with non-zero weight, but stacker models depend on every model of the previous stack level,
+        so without refitting the stackers, predicting with a multi-layer stack ensemble requires loading and predicting with all models of the lower levels.
+        This is useful to minimize inference time, memory usage and disk usage for model deployment.
+        WARNING: If `delete_from_disk=True`, this will DELETE ALL FILES in the deleted model directories, see `delete_models()`.
+
+        Parameters
+        ----------
+        model : str, default = None
+            Name of the model to deploy. If None, the best model is used, as in `delete_models(models_to_keep='best')`.
+        refit_stackers : bool, default = True
+            If True, each stacker model required by `model` is refit as a new model with the suffix '_Pruned' which only uses the base models that receive non-zero weight
+            in an Ensemble Selection fit on the out-of-fold predictions of its base models. Models depending on a refit stacker (such as weighted ensembles) are refit on the new version.
+            The refit version of `model` is deployed only if its validation score is not worse than the score of `model`.
+            Requires bagging and `cache_data=True` during `fit()`, otherwise no models are refit.
+        delete_from_disk : bool, default = True
+            If True, deletes the deleted models from disk. See `delete_models()`.
+        dry_run : bool, default = True
+            If True, no models are refit or deleted, and logging statements describe the stackers that would be refit and the models that would be deleted.
+            Set `dry_run=False` to perform the optimization.
+
+        Returns
+        -------
+        Dictionary with the following keys:
+            'model': Name of the deployed model, which is the new best model if `dry_run=False`.
+            'models_deleted': List of the deleted models.
+            'pred_time_val_before', 'pred_time_val_after': Validation inference time in seconds of `model` and of the deployed model, including all models they depend on (see `pred_time_val` in `leaderboard()`).
+            'disk_size_before', 'disk_size_after': Disk size in bytes of all models before the optimization and of the models kept afterwards.
+        """
+        return self._trainer.optimize_for_deployment(model=model, refit_stackers=refit_stackers, delete_from_disk=delete_from_disk, dry_run=dry_run)
+
     # TODO: v0.1 add documentation for arguments
     def get_model_names(self, stack_name=None, level=None, can_infer: bool = None, models: list = None) -> list:
         """Returns the list of model names trained in this `predictor` object."""
@@ -2065,6 +2128,35 @@ class TabularPredictor:
             self._learner.persist_trainer(low_memory=True)
             self._trainer: AbstractTrainer = self._learner.load_trainer()  # Trainer object
 
+    def get_load_time_info(self, wait_for_prefetch=False) -> dict:
+        """
+        Returns a breakdown of the time in seconds spent to import AutoGluon and to load this predictor, to diagnose slow cold starts.
+
+        Parameters
+        ----------
+        wait_for_prefetch : bool, default = False
+            If True and the predictor was loaded with `prefetch_models=True`, waits until all prefetched models are loaded.
+
+        Returns
+        -------
+        Dictionary with the following keys:
+            'import': Dictionary of package name -> time spent importing it as part of `import autogluon.tabular`.
+            'load': Dictionary of the time spent in `load()` on loading the 'predictor', 'learner' and 'trainer' objects, and the 'total'. None if this predictor was not loaded via `load()`.
+            'models_prefetched': Dictionary of model name -> time spent loading the model in the background. Only models prefetched so far are included. Empty if `prefetch_models=False`.
+        """
+        from .. import _import_time_info
+        models_prefetched = dict()
+        model_prefetcher = self._trainer.get_model_prefetcher() if self._trainer is not None else None
+        if model_prefetcher is not None:
+            if wait_for_prefetch:
+                model_prefetcher.wait()
+            models_prefetched = model_prefetcher.get_load_times()
+        return {
+            'import': dict(_import_time_info),
+            'load': getattr(self, '_load_time_info', None),
+            'models_prefetched': models_prefetched,
+        }
+
     def save(self):
         """
         Save this Predictor to file in directory specified by this Predictor's `path`.
@@ -2083,9 +2175,11 @@ class TabularPredictor:
         logger.log(20, f'TabularPredictor saved. To load, use: predictor = TabularPredictor.load("{self.path}")')
 
     @classmethod
-    def load(cls, path: str, verbosity: int = None):
+    def load(cls, path: str, verbosity: int = None, prefetch_models=False):
         """
         Load a TabularPredictor object previously produced by `fit()` from file and returns this object. It is highly recommended the predictor be loaded with the exact AutoGluon version it was fit with.
+        Models are loaded from disk on demand when predicting, unless `prefetch_models=True`.
+        To see how long loading took, call `predictor.get_load_time_info()`.
 
         Parameters
         ----------
@@ -2097,6 +2191,11 @@ class TabularPredictor:
             If None, logging verbosity is not changed from existing values.
             Specify larger values to see more information printed when using Predictor during inference, smaller values to see less information.
             Refer to TabularPredictor init for more information.
+        prefetch_models : bool, default = False
+            If True, starts loading the best model and all models it depends on in a background thread as soon as the learner is loaded.
+            Loading the models then overlaps with loading the trainer and with any work done before the first prediction, such as preprocessing the data.
+            The prefetched models are persisted in memory once they are used, as with `persist_models()`.
+            This reduces the latency of the first prediction after loading, such as on the cold start of a serving container.
         """
         if verbosity is not None:
             set_logger_verbosity(verbosity, logger=logger)  # Reset logging after load (may be in new Python session)
@@ -2104,9 +2203,24 @@ class TabularPredictor:
             raise ValueError("path cannot be None in load()")
 
         path = setup_outputdir(path, warn_if_exist=False)  # replace ~ with absolute path if it exists
+        time_start = time.time()
         predictor: TabularPredictor = load_pkl.load(path=path + cls.predictor_file_name)
+        time_predictor = time.time()
         learner = predictor._learner_type.load(path)
+        time_learner = time.time()
+        model_prefetcher = None
+        if prefetch_models and learner.trainer_path is not None:
+            model_prefetcher = learner.trainer_type.prefetch_models(path=learner.trainer_path)
         predictor._set_post_fit_vars(learner=learner)
+        if model_prefetcher is not None:
+            predictor._trainer.set_model_prefetcher(model_prefetcher)
+        time_trainer = time.time()
+        predictor._load_time_info = dict(
+            predictor=time_predictor - time_start,
+            learner=time_learner - time_predictor,
+            trainer=time_trainer - time_learner,
+            total=time_trainer - time_start,
+        )
         try:
             from ..version import __version__
             version_inference = __version__
@@ -2184,6 +2298,7 @@ class TabularPredictor:
             ag_args_fit=None,
             ag_args_ensemble=None,
             excluded_model_types=None,
+            num_parallel_models=1,
 
             # aux_kwargs -> +1 nest
 
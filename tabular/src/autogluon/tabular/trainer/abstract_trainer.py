@@ -1,4 +1,5 @@
 import copy, time, traceback, logging
+import importlib
 import os
 from typing import List, Union, Tuple
 
@@ -10,10 +11,12 @@ from collections import defaultdict
 
 from autogluon.core.constants import AG_ARGS_FIT, BINARY, MULTICLASS, REGRESSION, REFIT_FULL_NAME, REFIT_FULL_SUFFIX
 from autogluon.core.models import AbstractModel, BaggedEnsembleModel, StackerEnsembleModel, WeightedEnsembleModel
+from autogluon.core.models.greedy_ensemble.ensemble_selection import EnsembleSelection
 from autogluon.core.scheduler.scheduler_factory import scheduler_factory
 from autogluon.core.utils import default_holdout_frac, get_pred_from_proba, generate_train_test_split, infer_eval_metric, compute_permutation_feature_importance, extract_column, compute_weighted_metric
+from autogluon.core.utils import get_num_cpus_budget, set_num_cpus_budget, allocate_time_budget, TimeBudgetPlanner, get_model_cache, async_saving, get_async_saver, ModelPrefetcher, get_directory_size
 from autogluon.core.utils.exceptions import TimeLimitExceeded, NotEnoughMemoryError, NoValidFeatures, NoGPUError
-from autogluon.core.utils.loaders import load_pkl
+from autogluon.core.utils.loaders import load_json, load_pkl
 from autogluon.core.utils.savers import save_json, save_pkl
 
 from .utils import process_hyperparameters
@@ -33,6 +36,7 @@ class AbstractTrainer:
     trainer_file_name = 'trainer.pkl'
     trainer_info_name = 'info.pkl'
     trainer_info_json_name = 'info.json'
+    trainer_manifest_name = 'manifest.json'
     distill_stackname = 'distill'  # name of stack-level for distilled student models
 
     def __init__(self, path: str, problem_type: str, eval_metric=None,
@@ -70,6 +74,7 @@ class AbstractTrainer:
         self.model_best = None
 
         self.models = {}  # Dict of model name -> model object. A key, value pair only exists if a model is persisted in memory.  # TODO: v0.1 Rename and consider making private
+        self._model_prefetcher = None  # ModelPrefetcher of models loaded in the background, see self.prefetch_models
         self.model_graph = nx.DiGraph()  # Directed Acyclic Graph (DAG) of model interactions. Describes how certain models depend on the predictions of certain other models. Contains numerous metadata regarding each model.
         self.model_full_dict = {}  # Dict of normal model -> FULL model. FULL models are produced by self.refit_single_full() and self.refit_ensemble_full().
         self._model_full_dict_val_score = {}  # Dict of FULL model -> normal model validation score in case the normal model had been deleted.
@@ -87,6 +92,8 @@ class AbstractTrainer:
 
         self._extra_banned_names = set()  # Names which are banned but are not used by a trained model.
 
+        self._time_budget_planner = None  # Predicts the fit cost of models to split time limits between them, created by self.get_time_budget_planner()
+
         # self._exceptions_list = []  # TODO: Keep exceptions list for debugging during benchmarking.
 
     # path_root is the directory containing learner.pkl
@@ -242,26 +249,32 @@ class AbstractTrainer:
         aux_kwargs = {} if aux_kwargs is None else aux_kwargs.copy()
 
         model_names_fit = []
-        for level in range(level_start, level_end + 1):
-            core_kwargs_level = core_kwargs.copy()
-            aux_kwargs_level = aux_kwargs.copy()
-            if time_limit is not None:
-                time_train_level_start = time.time()
-                time_limit_for_level = (time_limit - (time_train_level_start - time_train_start)) / (level_end + 1 - level)
-                time_limit_core = time_limit_for_level
-                time_limit_aux = max(time_limit_for_level * 0.1, min(time_limit, 360))  # Allows aux to go over time_limit, but only by a small amount
-                core_kwargs_level['time_limit'] = core_kwargs_level.get('time_limit', time_limit_core)
-                aux_kwargs_level['time_limit'] = aux_kwargs_level.get('time_limit', time_limit_aux)
-            if level != 1:
-                feature_prune = False  # TODO: Enable feature prune on levels > 1
-            base_model_names, aux_models = self.stack_new_level(
-                X=X, y=y, X_val=X_val, y_val=y_val, X_unlabeled=X_unlabeled,
-                models=hyperparameters, level=level, base_model_names=base_model_names,
-                feature_prune=feature_prune,
-                core_kwargs=core_kwargs_level, aux_kwargs=aux_kwargs_level, name_suffix=name_suffix,
-            )
-            model_names_fit += base_model_names + aux_models
+        # Model files are written in the background while the next models train, self.save() waits for them to be written
+        with async_saving():
+            for level in range(level_start, level_end + 1):
+                core_kwargs_level = core_kwargs.copy()
+                aux_kwargs_level = aux_kwargs.copy()
+                if time_limit is not None:
+                    time_train_level_start = time.time()
+                    time_limit_for_level = (time_limit - (time_train_level_start - time_train_start)) / (level_end + 1 - level)
+                    time_limit_core = time_limit_for_level
+                    time_limit_aux = max(time_limit_for_level * 0.1, min(time_limit, 360))  # Allows aux to go over time_limit, but only by a small amount
+                    core_kwargs_level['time_limit'] = core_kwargs_level.get('time_limit', time_limit_core)
+                    aux_kwargs_level['time_limit'] = aux_kwargs_level.get('time_limit', time_limit_aux)
+                if level != 1:
+                    feature_prune = False  # TODO: Enable feature prune on levels > 1
+                base_model_names, aux_models = self.stack_new_level(
+                    X=X, y=y, X_val=X_val, y_val=y_val, X_unlabeled=X_unlabeled,
+                    models=hyperparameters, level=level, base_model_names=base_model_names,
+                    feature_prune=feature_prune,
+                    core_kwargs=core_kwargs_level, aux_kwargs=aux_kwargs_level, name_suffix=name_suffix,
+                )
+                model_names_fit += base_model_names + aux_models
+                async_saver = get_async_saver()
+                if async_saver is not None:
+                    async_saver.flush()  # The models of a level are fully written before the next level is trained on them
         self._time_limit = None
+        self.get_time_budget_planner().save()
         self.save()
         return model_names_fit
 
@@ -557,7 +570,13 @@ class AbstractTrainer:
 
     # You must have previously called fit() with cache_data=True
     # Fits _FULL versions of specified models, but does NOT link them (_FULL stackers will still use normal models as input)
-    def refit_single_full(self, X=None, y=None, X_val=None, y_val=None, X_unlabeled=None, models=None) -> List[str]:
+    def refit_single_full(self, X=None, y=None, X_val=None, y_val=None, X_unlabeled=None, models=None, num_parallel_models=1) -> List[str]:
+        """
+        Fits _FULL versions of models on all of the data (training + validation).
+        The models of a level that are fit on the same stack features are refit together: the stack features of X_full are generated once for them,
+        and they are trained concurrently if `num_parallel_models` is not 1 (see self._train_multi_fold_parallel).
+        Returns a list of the trained _FULL model names.
+        """
         if X is None:
             X = self.load_X()
             if X_val is None and not self.bagged_mode:
@@ -594,16 +613,19 @@ class AbstractTrainer:
         model_full_dict = {}
         for level in levels:
             models_level = model_levels[level]
+            # Models of the level which share the same base models and ensemble type are refit in a single call -> (base model names, ensemble type) -> list of (model name, _FULL template)
+            model_full_groups = dict()
             for model in models_level:
                 model = self.load_model(model)
                 model_name = model.name
                 model_full = model.convert_to_refit_full_template()
                 # Mitigates situation where bagged models barely had enough memory and refit requires more. Worst case results in OOM, but this lowers chance of failure.
                 model_full.params_aux['max_memory_usage_ratio'] = model_full.params_aux['max_memory_usage_ratio'] * 1.15
-                # TODO: Do it for all models in the level at once to avoid repeated processing of data?
                 base_model_names = self.get_base_model_names(model_name)
                 stacker_type = type(model)
-                if issubclass(stacker_type, WeightedEnsembleModel):
+                if not issubclass(stacker_type, WeightedEnsembleModel):
+                    model_full_groups.setdefault((tuple(base_model_names), stacker_type), []).append((model_name, model_full))
+                else:
                     # TODO: Technically we don't need to re-train the weighted ensemble, we could just copy the original and re-use the weights.
                     w = None
                     if self.bagged_mode:
@@ -634,13 +656,20 @@ class AbstractTrainer:
                         model_loaded.predict_time = None
                         self.set_model_attribute(model=model_weighted_ensemble, attribute='val_score', val=None)
                         self.save_model(model_loaded)
-                else:
-                    models_trained = self.stack_new_level_core(X=X_full, y=y_full, X_unlabeled=X_unlabeled, models=[model_full], base_model_names=base_model_names, level=level, stack_name=REFIT_FULL_NAME,
-                                                               hyperparameter_tune_kwargs=None, feature_prune=False, k_fold=0, n_repeats=1, ensemble_type=stacker_type)
-                if len(models_trained) == 1:
-                    model_full_dict[model_name] = models_trained[0]
-                for model_trained in models_trained:
-                    self._model_full_dict_val_score[model_trained] = self.get_model_attribute(model_name, 'val_score')
+                    if len(models_trained) == 1:
+                        model_full_dict[model_name] = models_trained[0]
+                    for model_trained in models_trained:
+                        self._model_full_dict_val_score[model_trained] = self.get_model_attribute(model_name, 'val_score')
+                    models_trained_full += models_trained
+
+            for (base_model_names, stacker_type), model_full_group in model_full_groups.items():
+                models_trained = self.stack_new_level_core(X=X_full, y=y_full, X_unlabeled=X_unlabeled, models=[model_full for _, model_full in model_full_group], base_model_names=list(base_model_names),
+                                                           level=level, stack_name=REFIT_FULL_NAME, hyperparameter_tune_kwargs=None, feature_prune=False, k_fold=0, n_repeats=1,
+                                                           ensemble_type=stacker_type, num_parallel_models=num_parallel_models)
+                for model_name, model_full in model_full_group:
+                    if model_full.name in models_trained:
+                        model_full_dict[model_name] = model_full.name
+                        self._model_full_dict_val_score[model_full.name] = self.get_model_attribute(model_name, 'val_score')
                 models_trained_full += models_trained
 
         keys_to_del = []
@@ -656,7 +685,7 @@ class AbstractTrainer:
     # Fits _FULL models and links them in the stack so _FULL models only use other _FULL models as input during stacking
     # If model is specified, will fit all _FULL models that are ancestors of the provided model, automatically linking them.
     # If no model is specified, all models are refit and linked appropriately.
-    def refit_ensemble_full(self, model='all') -> dict:
+    def refit_ensemble_full(self, model='all', num_parallel_models=1) -> dict:
         if model == 'all':
             ensemble_set = self.get_model_names()
         else:
@@ -671,7 +700,7 @@ class AbstractTrainer:
             else:
                 ensemble_set_valid.append(model)
         if ensemble_set_valid:
-            models_trained_full = self.refit_single_full(models=ensemble_set_valid)
+            models_trained_full = self.refit_single_full(models=ensemble_set_valid, num_parallel_models=num_parallel_models)
         else:
             models_trained_full = []
 
@@ -692,6 +721,7 @@ class AbstractTrainer:
                     model_loaded.stack_column_prefix_to_model_map[stack_column_prefix] = new_base_model
 
             model_loaded.save()  # TODO: Avoid this!
+            self._reset_model_info_summary(model_full)
 
             # Remove old edges and add new edges
             edges_to_remove = list(self.model_graph.in_edges(model_loaded.name))
@@ -729,6 +759,12 @@ class AbstractTrainer:
             model.save()
         else:
             self.models[model.name] = model
+        self._reset_model_info_summary(model.name)
+
+    def _reset_model_info_summary(self, model_name: str):
+        """Clears the cached info summary of the model (see `_get_models_info_summary`), as its memory and disk sizes change whenever the model is saved again."""
+        if model_name in self.model_graph:
+            self.model_graph.nodes[model_name]['info_summary'] = None
 
     def save(self):
         models = self.models
@@ -737,6 +773,99 @@ class AbstractTrainer:
         save_pkl.save(path=self.path + self.trainer_file_name, object=self)
         if self.low_memory:
             self.models = models
+        self._save_manifest()
+        async_saver = get_async_saver()
+        if async_saver is not None:
+            # Once the trainer is saved, all models it references must be fully written
+            async_saver.flush()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_model_prefetcher'] = None  # Holds a background thread, which can't be pickled
+        return state
+
+    def _save_manifest(self):
+        """
+        Saves a compact json manifest of the models next to the trainer file: the best model, and the path, type and base models of each model.
+        The manifest is used by `prefetch_models` to start loading models before the trainer itself is loaded.
+        """
+        models = dict()
+        for model_name, node in self.model_graph.nodes(data=True):
+            model_type = node['type']
+            models[model_name] = dict(
+                path=os.path.relpath(node['path'], self.path) + os.path.sep,
+                type=f'{model_type.__module__}:{model_type.__qualname__}',
+                base_models=list(self.model_graph.predecessors(model_name)),
+            )
+        manifest = dict(model_best=self.model_best, models=models)
+        save_json.save(path=self.path + self.trainer_manifest_name, obj=manifest, sanitize=False)
+
+    @classmethod
+    def prefetch_models(cls, path: str, models: List[str] = None) -> Union[ModelPrefetcher, None]:
+        """
+        Starts loading `models` and all models they depend on (the best model if None) in a background thread, based on the manifest of the trainer saved in `path`.
+        This does not require the trainer to be loaded, so that loading the trainer and the models overlap.
+        Pass the returned ModelPrefetcher to `set_model_prefetcher` of the loaded trainer, so that it uses the prefetched models.
+        Returns None if there is no manifest, such as for trainers saved by older versions, or if no model is found.
+        """
+        try:
+            manifest = load_json.load(path=path + cls.trainer_manifest_name)
+        except OSError:
+            return None
+        if models is None:
+            if manifest['model_best'] is None:
+                return None
+            models = [manifest['model_best']]
+        models_info = manifest['models']
+
+        # Order the models so that the base models of a model are loaded before it, as in inference
+        model_order = []
+        def _add_model(model_name):
+            if model_name in model_order or model_name not in models_info:
+                return
+            for base_model in models_info[model_name]['base_models']:
+                _add_model(base_model)
+            model_order.append(model_name)
+        for model in models:
+            _add_model(model)
+        if not model_order:
+            return None
+
+        load_fns = dict()
+        for model_name in model_order:
+            module_name, type_name = models_info[model_name]['type'].split(':')
+            model_path = path + models_info[model_name]['path']
+            load_fns[model_name] = lambda model_path=model_path, module_name=module_name, type_name=type_name: cls._load_model_persisted(
+                path=model_path, model_type=getattr(importlib.import_module(module_name), type_name), reset_paths=True)
+        return ModelPrefetcher(load_fns=load_fns)
+
+    def set_model_prefetcher(self, model_prefetcher: ModelPrefetcher):
+        """Uses the models loaded by `model_prefetcher` (see `prefetch_models`): `load_model` returns them and persists them in memory, instead of loading the models from disk."""
+        self._model_prefetcher = model_prefetcher
+
+    def get_model_prefetcher(self) -> Union[ModelPrefetcher, None]:
+        return getattr(self, '_model_prefetcher', None)
+
+    def get_time_budget_planner(self) -> TimeBudgetPlanner:
+        """Returns the planner of fit costs used to split time limits between models, creating it on first use (trainers saved by older versions do not have one)."""
+        if getattr(self, '_time_budget_planner', None) is None:
+            self._time_budget_planner = TimeBudgetPlanner(priors=self._get_fit_cost_priors())
+        return self._time_budget_planner
+
+    @staticmethod
+    def _load_model_persisted(path: str, model_type, reset_paths=False) -> AbstractModel:
+        """Loads a model, and also the children of bagged ensemble models, so that the model can predict without loading from disk, as done by `persist_models`."""
+        model = model_type.load(path=path, reset_paths=reset_paths)
+        AbstractTrainer._persist_children(model)
+        return model
+
+    @staticmethod
+    def _persist_children(model: AbstractModel):
+        # TODO: Move this to model code
+        if isinstance(model, BaggedEnsembleModel):
+            for fold, fold_model in enumerate(model.models):
+                if isinstance(fold_model, str):
+                    model.models[fold] = model.load_child(fold_model, use_cache=False)
 
     def persist_models(self, model_names='all', with_ancestors=False, max_memory=None) -> List[str]:
         if model_names == 'all':
@@ -770,36 +899,49 @@ class AbstractTrainer:
             if memory_proportion > max_memory:
                 logger.log(30, f'Models will not be persisted in memory as they are expected to require {round(memory_proportion * 100, 2)}% of memory, which is greater than the specified max_memory limit of {round(max_memory*100, 2)}%.')
                 logger.log(30, f'\tModels will be loaded on-demand from disk to maintain safe memory usage, increasing inference latency. If inference latency is a concern, try to use smaller models or increase the value of max_memory.')
+                logger.log(30, f'\tTo keep as many recently used models in memory as fit in a memory budget instead, use `autogluon.core.utils.set_model_cache_max_memory`.')
                 return []
             else:
                 logger.log(20, f'Persisting {len(model_names)} models in memory. Models will require {round(memory_proportion*100, 2)}% of memory.')
 
         models = []
         for model_name in model_names:
-            model = self.load_model(model_name)
+            # Persisted models are modified below, so they must not be shared with the model cache. Cached copies would only take up memory.
+            model = self.load_model(model_name, use_cache=False)
+            get_model_cache().pop_dir(self.get_model_attribute(model=model_name, attribute='path'))
             self.models[model.name] = model
             models.append(model)
 
         for model in models:
-            # TODO: Move this to model code
-            if isinstance(model, BaggedEnsembleModel):
-                for fold, fold_model in enumerate(model.models):
-                    if isinstance(fold_model, str):
-                        model.models[fold] = model.load_child(fold_model)
+            self._persist_children(model)
         return model_names
 
     # TODO: model_name change to model in params
-    def load_model(self, model_name: str, path: str = None, model_type=None) -> AbstractModel:
+    def load_model(self, model_name: str, path: str = None, model_type=None, use_cache=True) -> AbstractModel:
+        """
+        Returns the model `model_name`, persisted in memory, prefetched or loaded from disk.
+        Models loaded from disk are shared through the model cache (`autogluon.core.utils.ModelCache`) unless `use_cache=False`,
+        which is required if the model will be modified, such as when fitting it further.
+        """
         if isinstance(model_name, AbstractModel):
             return model_name
         if model_name in self.models.keys():
             return self.models[model_name]
         else:
+            model_prefetcher = self.get_model_prefetcher()
+            if model_prefetcher is not None and model_name in model_prefetcher:
+                model = model_prefetcher.pop(model_name)
+                if model is not None:
+                    self.models[model_name] = model
+                    return model
             if path is None:
                 path = self.get_model_attribute(model=model_name, attribute='path')
             if model_type is None:
                 model_type = self.get_model_attribute(model=model_name, attribute='type')
-            return model_type.load(path=path, reset_paths=self.reset_paths)
+            load_fn = lambda: model_type.load(path=path, reset_paths=self.reset_paths)
+            if not use_cache:
+                return load_fn()
+            return get_model_cache().load(path + model_type.model_file_name, load_fn, size_fn=lambda model: model.get_cache_size())
 
     def unpersist_models(self, model_names='all') -> list:
         if model_names == 'all':
@@ -817,16 +959,23 @@ class AbstractTrainer:
             logger.log(30, f'No valid persisted models were specified to be unpersisted, so no change in model persistence was performed.')
         return unpersisted_models
 
-    def generate_weighted_ensemble(self, X, y, level, base_model_names, k_fold=0, n_repeats=1, stack_name=None, hyperparameters=None, time_limit=None, name_suffix: str = None, save_bag_folds=None, check_if_best=True, child_hyperparameters=None, get_models_func=None) -> List[str]:
+    def generate_weighted_ensemble(self, X, y, level, base_model_names, k_fold=0, n_repeats=1, stack_name=None, hyperparameters=None, time_limit=None, name_suffix: str = None, save_bag_folds=None, check_if_best=True, child_hyperparameters=None, get_models_func=None,
+                                   infer_limit: float = None, memory_limit: int = None) -> List[str]:
+        """
+        Fits a weighted ensemble of `base_model_names` on the stack inputs `X`.
+        If `infer_limit` (seconds per row) or `memory_limit` (bytes) is specified, the ensemble is constructed to satisfy these budgets, see `_get_ensemble_cost_constraints`.
+        """
         if get_models_func is None:
             get_models_func = self.get_models
+        if child_hyperparameters is None:
+            child_hyperparameters = {}
+        if infer_limit is not None or memory_limit is not None:
+            base_model_names, cost_constraints = self._get_ensemble_cost_constraints(base_model_names=base_model_names, num_rows=len(X), infer_limit=infer_limit, memory_limit=memory_limit)
+            child_hyperparameters = {**child_hyperparameters, 'cost_constraints': cost_constraints}
         if len(base_model_names) == 0:
             logger.log(20, 'No base models to train on, skipping weighted ensemble...')
             return []
 
-        if child_hyperparameters is None:
-            child_hyperparameters = {}
-
         if save_bag_folds is None:
             can_infer_dict = self.get_models_attribute_dict('can_infer', models=base_model_names)
             if False in can_infer_dict.values():
@@ -872,6 +1021,45 @@ class AbstractTrainer:
                         self.model_best = weighted_ensemble_model_name
         return models
 
+    def _get_ensemble_cost_constraints(self, base_model_names: List[str], num_rows: int, infer_limit: float = None, memory_limit: int = None) -> Tuple[List[str], List[dict]]:
+        """
+        Returns the base models whose costs are known and the `cost_constraints` hyperparameter of GreedyWeightedEnsembleModel for the given budgets.
+
+        The inference time per row of a model is estimated from its validation `predict_time`, measured on `num_rows` rows (the stack inputs of the ensemble).
+        A bagged model predicts each of those rows with one child per repeat, but predicts new data with all of its children, so its time is scaled accordingly.
+        As the estimate is based on batch predictions, it excludes the per-call overhead of predicting a single row.
+        The memory of a model is its `memory_size` as shown by self.leaderboard(extra_info=True).
+        The cost of each base model includes the costs of all models it depends on, so that the ensemble counts models shared by several base models once.
+        """
+        required_models = self.get_minimum_models_set(base_model_names)
+        info_summary = self._get_models_info_summary(models=required_models)
+        constraints = []  # (name, max_cost, model name -> marginal cost)
+        if infer_limit is not None:
+            infer_time_per_row = dict()
+            for model in required_models:
+                predict_time = self.get_model_attribute(model=model, attribute='predict_time')
+                if predict_time is None:
+                    infer_time_per_row[model] = None
+                else:
+                    infer_time_per_row[model] = predict_time * info_summary[model]['num_models'] / (num_rows * info_summary[model]['num_repeats'])
+            constraints.append(('infer_time_per_row', infer_limit, infer_time_per_row))
+        if memory_limit is not None:
+            constraints.append(('memory_size', memory_limit, {model: info_summary[model]['memory_size'] for model in required_models}))
+
+        ancestors_dict = self._get_models_ancestors_dict()
+        base_models_valid = []
+        cost_constraints = [dict(name=name, max_cost=max_cost, base_model_costs=dict()) for name, max_cost, _ in constraints]
+        for base_model in base_model_names:
+            base_model_set = [base_model] + list(ancestors_dict[base_model])
+            costs_unknown = [name for name, _, model_costs in constraints if any(model_costs[model] is None for model in base_model_set)]
+            if costs_unknown:
+                logger.log(20, f'\tExcluding {base_model} from the weighted ensemble, as its {costs_unknown} cannot be estimated.')
+                continue
+            base_models_valid.append(base_model)
+            for cost_constraint, (_, _, model_costs) in zip(cost_constraints, constraints):
+                cost_constraint['base_model_costs'][base_model] = {model: model_costs[model] for model in base_model_set}
+        return base_models_valid, cost_constraints
+
     def _train_single(self, X, y, model: AbstractModel, X_val=None, y_val=None, **model_fit_kwargs) -> AbstractModel:
         """
         Trains model but does not add the trained model to this Trainer.
@@ -893,14 +1081,27 @@ class AbstractTrainer:
             The model will be accessible and usable through any Trainer function that takes as input 'model' or 'model_name'.
         Note: self._train_and_save should not be used outside of self._train_single_full
         """
+        model_names_trained = []
+        model = self._fit_and_save(X, y, model, X_val, y_val, **model_fit_kwargs)
+        if model is not None:
+            self._add_model(model=model, stack_name=stack_name, level=level)
+            model_names_trained.append(model.name)
+            if self.low_memory:
+                del model
+        return model_names_trained
+
+    def _fit_and_save(self, X, y, model: AbstractModel, X_val=None, y_val=None, **model_fit_kwargs) -> Union[AbstractModel, None]:
+        """
+        Trains model, scores it and saves it via self.save_model, without registering it in this Trainer.
+        Returns the trained model, or None if training failed.
+        """
         fit_start_time = time.time()
         time_limit = model_fit_kwargs.get('time_limit', None)
-        model_names_trained = []
         try:
             if time_limit is not None:
                 if time_limit <= 0:
                     logger.log(15, f'Skipping {model.name} due to lack of time remaining.')
-                    return model_names_trained
+                    return None
                 if self._time_limit is not None and self._time_train_start is not None:
                     time_left_total = self._time_limit - (fit_start_time - self._time_train_start)
                 else:
@@ -962,11 +1163,8 @@ class AbstractTrainer:
                 logger.exception('Detailed Traceback:')
             del model
         else:
-            self._add_model(model=model, stack_name=stack_name, level=level)
-            model_names_trained.append(model.name)
-            if self.low_memory:
-                del model
-        return model_names_trained
+            return model
+        return None
 
     def _add_model(self, model: AbstractModel, stack_name: str = 'core', level: int = 1) -> bool:
         """
@@ -1017,6 +1215,7 @@ class AbstractTrainer:
             is_valid=model.is_valid(),
             stack_name=stack_name,
             level=level,
+            info_summary=None,  # Computed on demand, see self._get_models_info_summary
         )
         if isinstance(model, StackerEnsembleModel):
             prior_models = self.get_model_names()
@@ -1044,22 +1243,9 @@ class AbstractTrainer:
             k_fold = self.k_fold
         if n_repeats is None:
             n_repeats = self.n_repeats
-        model_fit_kwargs = dict(
-            time_limit=time_limit,
-            verbosity=self.verbosity,
-        )
-        if self.sample_weight is not None:
-            X, w_train = extract_column(X, self.sample_weight)
-            if w_train is not None:  # may be None for ensemble
-                # TODO: consider moving weight normalization into AbstractModel.fit()
-                model_fit_kwargs['sample_weight'] = w_train.values/w_train.mean()  # normalization can affect gradient algorithms like boosting
-            if X_val is not None:
-                X_val, w_val = extract_column(X_val, self.sample_weight)
-                if self.weight_evaluation and w_val is not None:  # ignore validation sample weights unless weight_evaluation specified
-                    model_fit_kwargs['sample_weight_val'] = w_val.values/w_val.mean()
-            ens_sample_weight =  kwargs.get('ens_sample_weight', None)
-            if ens_sample_weight is not None:
-                model_fit_kwargs['sample_weight'] = ens_sample_weight  # sample weights to use for weighted ensemble only
+        X, X_val, model_fit_kwargs = self._get_model_fit_kwargs(X=X, X_val=X_val, model=model, time_limit=time_limit, k_fold=k_fold, k_fold_start=k_fold_start, k_fold_end=k_fold_end,
+                                                                n_repeats=n_repeats, n_repeat_start=n_repeat_start, ens_sample_weight=kwargs.get('ens_sample_weight', None),
+                                                                include_bag_kwargs=not hyperparameter_tune_kwargs)
         if hyperparameter_tune_kwargs:
             if n_repeat_start != 0:
                 raise ValueError(f'n_repeat_start must be 0 to hyperparameter_tune, value = {n_repeat_start}')
@@ -1091,66 +1277,107 @@ class AbstractTrainer:
                     if self._add_model(model=model_hpo, stack_name=stack_name, level=level):
                         model_names_trained.append(model_hpo.name)
         else:
-            if isinstance(model, BaggedEnsembleModel):
-                model_fit_kwargs.update(dict(
-                    k_fold=k_fold,
-                    k_fold_start=k_fold_start,
-                    k_fold_end=k_fold_end,
-                    n_repeats=n_repeats,
-                    n_repeat_start=n_repeat_start,
-                    compute_base_preds=False,
-                ))
             model_names_trained = self._train_and_save(X, y, model, X_val, y_val, X_unlabeled=X_unlabeled, stack_name=stack_name, level=level, **model_fit_kwargs)
         self.save()
         return model_names_trained
 
+    def _get_model_fit_kwargs(self, X, X_val, model: AbstractModel, time_limit=None, k_fold=None, k_fold_start=0, k_fold_end=None, n_repeats=None, n_repeat_start=0,
+                              ens_sample_weight=None, include_bag_kwargs=True) -> Tuple[pd.DataFrame, pd.DataFrame, dict]:
+        """
+        Returns X and X_val with the sample weight column removed, and the kwargs to pass to the fit call of model.
+        If `include_bag_kwargs=True` and model is a bagged ensemble, the kwargs contain the k-fold bagging arguments.
+        """
+        if k_fold is None:
+            k_fold = self.k_fold
+        if n_repeats is None:
+            n_repeats = self.n_repeats
+        model_fit_kwargs = dict(
+            time_limit=time_limit,
+            verbosity=self.verbosity,
+        )
+        if self.sample_weight is not None:
+            X, w_train = extract_column(X, self.sample_weight)
+            if w_train is not None:  # may be None for ensemble
+                # TODO: consider moving weight normalization into AbstractModel.fit()
+                model_fit_kwargs['sample_weight'] = w_train.values/w_train.mean()  # normalization can affect gradient algorithms like boosting
+            if X_val is not None:
+                X_val, w_val = extract_column(X_val, self.sample_weight)
+                if self.weight_evaluation and w_val is not None:  # ignore validation sample weights unless weight_evaluation specified
+                    model_fit_kwargs['sample_weight_val'] = w_val.values/w_val.mean()
+            if ens_sample_weight is not None:
+                model_fit_kwargs['sample_weight'] = ens_sample_weight  # sample weights to use for weighted ensemble only
+        if include_bag_kwargs and isinstance(model, BaggedEnsembleModel):
+            model_fit_kwargs.update(dict(
+                k_fold=k_fold,
+                k_fold_start=k_fold_start,
+                k_fold_end=k_fold_end,
+                n_repeats=n_repeats,
+                n_repeat_start=n_repeat_start,
+                compute_base_preds=False,
+            ))
+        return X, X_val, model_fit_kwargs
+
     # TODO: How to deal with models that fail during this? They have trained valid models before, but should we still use those models or remove the entire model? Currently we still use models.
     # TODO: Time allowance can be made better by only using time taken during final model training and not during HPO and feature pruning.
     # TODO: Time allowance not accurate if running from fit_continue
     # TODO: Remove level and stack_name arguments, can get them automatically
     # TODO: Make sure that pretraining on X_unlabeled only happens 1 time rather than every fold of bagging. (Do during pretrain API work?)
-    def _train_multi_repeats(self, X, y, models: list, n_repeats, n_repeat_start=1, time_limit=None, time_limit_total_level=None, **kwargs) -> List[str]:
+    def _train_multi_repeats(self, X, y, models: list, n_repeats, n_repeat_start=1, time_limit=None, **kwargs) -> List[str]:
         """
         Fits bagged ensemble models with additional folds and/or bagged repeats.
         Models must have already been fit prior to entering this method.
         This method should only be called in self._train_multi
         Returns a list of successfully trained and saved model names.
+
+        A repeat is only started if the time left is enough to fit it, based on the time each model took for its previous repeats.
+        Within a repeat, each model gets a share of the time left proportional to the time it took for its previous repeats.
+        A model which fails to fit a repeat is kept with the repeats it has already fit, and is not fit with further repeats.
         """
-        if time_limit_total_level is None:
-            time_limit_total_level = time_limit
         models_valid = models
         models_valid_next = []
+        models_stopped = []
         repeats_completed = 0
         time_start = time.time()
+        # Time in seconds each model takes to fit a single repeat, estimated from the repeats it has already fit
+        repeat_costs = {}
+        for model in models_valid:
+            model_name = model if isinstance(model, str) else model.name
+            repeat_costs[model_name] = self._get_model_fit_cost(model_name) / max(n_repeat_start, 1)
         for n in range(n_repeat_start, n_repeats):
             if time_limit is not None:
                 time_start_repeat = time.time()
                 time_left = time_limit - (time_start_repeat - time_start)
-                if n == n_repeat_start:
-                    time_required = time_limit_total_level * 0.575  # Require slightly over 50% to be safe
-                else:
-                    time_required = (time_start_repeat - time_start) / repeats_completed * (0.575/0.425)
+                time_required = sum(repeat_costs[model if isinstance(model, str) else model.name] for model in models_valid) * 1.5  # Require 50% extra to be safe, as the time of a repeat varies
                 if time_left < time_required:
-                    logger.log(15, 'Not enough time left to finish repeated k-fold bagging, stopping early ...')
+                    logger.log(15, f'Not enough time left to finish repeated k-fold bagging, stopping early ... (time left: {round(time_left, 1)}s, estimated time required: {round(time_required, 1)}s)')
                     break
             logger.log(20, f'Repeating k-fold bagging: {n+1}/{n_repeats}')
             for i, model in enumerate(models_valid):
                 if isinstance(model, str):
-                    model = self.load_model(model)
+                    # Not loaded through the model cache, as the model is modified in place and left half-fit if an exception is raised
+                    model = self.load_model(model, use_cache=False)
                 if not isinstance(model, BaggedEnsembleModel):
                     raise AssertionError(f'{model.name} must inherit from BaggedEnsembleModel to perform repeated k-fold bagging. Model type: {type(model).__name__}')
+                time_start_model = time.time()
                 if time_limit is None:
                     time_left = None
                 else:
-                    time_start_model = time.time()
                     time_left = time_limit - (time_start_model - time_start)
+                    time_left = allocate_time_budget(time_left, [repeat_costs[model.name]] + [repeat_costs[model_name if isinstance(model_name, str) else model_name.name] for model_name in models_valid[i+1:]])
 
-                models_valid_next += self._train_single_full(X=X, y=y, model=model, k_fold_start=0, k_fold_end=None, n_repeats=n + 1, n_repeat_start=n, time_limit=time_left, **kwargs)
+                models_trained = self._train_single_full(X=X, y=y, model=model, k_fold_start=0, k_fold_end=None, n_repeats=n + 1, n_repeat_start=n, time_limit=time_left, **kwargs)
+                if models_trained:
+                    models_valid_next += models_trained
+                    repeat_costs[model.name] = time.time() - time_start_model
+                else:
+                    # The model saved to disk and registered in the trainer is still the one fit with the previous repeats
+                    logger.log(15, f'\tKeeping {model.name} with the {n} k-fold bagging repeats it has already fit.')
+                    models_stopped.append(model.name)
             models_valid = copy.deepcopy(models_valid_next)
             models_valid_next = []
             repeats_completed += 1
         logger.log(20, f'Completed {n_repeat_start + repeats_completed}/{n_repeats} k-fold bagging repeats ...')
-        return models_valid
+        return models_valid + models_stopped
 
     def _train_multi_initial(self, X, y, models: List[AbstractModel], k_fold, n_repeats, hyperparameter_tune_kwargs=None, feature_prune=False, time_limit=None, **kwargs) -> List[str]:
         """
@@ -1199,9 +1426,10 @@ class AbstractTrainer:
     # TODO: Add time_limit_per_model
     # TODO: Rename for v0.1
     def _train_multi_fold(self, X, y, models: List[AbstractModel], time_limit=None, time_split=False,
-                          time_ratio=1, hyperparameter_tune_kwargs=None, **kwargs) -> List[str]:
+                          time_ratio=1, hyperparameter_tune_kwargs=None, num_parallel_models=1, **kwargs) -> List[str]:
         """
         Trains and saves a list of models sequentially.
+        If `num_parallel_models` is not 1 and no model is hyperparameter tuned, the models are instead trained concurrently via self._train_multi_fold_parallel.
         This method should only be called in self._train_multi_initial
         Returns a list of trained model names.
         """
@@ -1209,13 +1437,23 @@ class AbstractTrainer:
         time_start = time.time()
         if time_limit is not None:
             time_limit = time_limit * time_ratio
+        if num_parallel_models != 1 and len(models) > 1:
+            if hyperparameter_tune_kwargs is not None and isinstance(hyperparameter_tune_kwargs, dict):
+                hpo_enabled = any(hyperparameter_tune_kwargs.get(model if isinstance(model, str) else model.name, None) for model in models)
+            else:
+                hpo_enabled = False
+            if not hpo_enabled:
+                return self._train_multi_fold_parallel(X, y, models, num_parallel_models=num_parallel_models, time_limit=time_limit, time_split=time_split, **kwargs)
         if time_limit is not None and len(models) > 0:
             time_limit_model_split = time_limit / len(models)
         else:
             time_limit_model_split = time_limit
+        num_cells = self._get_fit_num_cells(X, **kwargs)
+        time_budget_planner = self.get_time_budget_planner()
+        fit_costs = [time_budget_planner.predict_cost(self._get_model_type_inner(model).__name__, num_cells) for model in models]
         for i, model in enumerate(models):
             if isinstance(model, str):
-                model = self.load_model(model)
+                model = self.load_model(model, use_cache=False)
             elif self.low_memory:
                 model = copy.deepcopy(model)
             if hyperparameter_tune_kwargs is not None and isinstance(hyperparameter_tune_kwargs, dict):
@@ -1231,8 +1469,13 @@ class AbstractTrainer:
                 else:
                     time_start_model = time.time()
                     time_left = time_limit - (time_start_model - time_start)
+                    # Only give the model its share of the time left by predicted cost, so that it can't starve the models after it
+                    time_left = allocate_time_budget(time_left, fit_costs[i:])
             model_name_trained_lst = self._train_single_full(X, y, model, time_limit=time_left,
                                                              hyperparameter_tune_kwargs=hyperparameter_tune_kwargs_model, **kwargs)
+            if hyperparameter_tune_kwargs_model is None:
+                for model_name in model_name_trained_lst:
+                    self._record_model_fit_cost(model_name, num_cells)
 
             if self.low_memory:
                 del model
@@ -1240,6 +1483,166 @@ class AbstractTrainer:
 
         return models_valid
 
+    def _train_multi_fold_parallel(self, X, y, models: List[AbstractModel], num_parallel_models='auto', time_limit=None, time_split=False,
+                                   X_val=None, y_val=None, X_unlabeled=None, stack_name='core', level=1, **kwargs) -> List[str]:
+        """
+        Trains and saves a list of models concurrently in worker processes, registering each model in this Trainer as soon as it finishes.
+        This method should only be called in self._train_multi_fold
+        Returns a list of trained model names, in the order of `models`.
+
+        The number of workers is limited by `num_parallel_models`, the CPU budget (see `autogluon.core.utils.set_num_cpus_budget`) and the memory required to hold a copy of the data in each worker.
+        Models are started in order, each with an even share of the CPUs that are free at that moment, and only if at least one CPU is free and enough memory is available for another worker.
+        If `time_split=False`, each model gets a fair share of the remaining time: the remaining time multiplied by the number of workers, divided by the number of models that have not been started yet.
+        Models which use GPUs are trained one at a time in this process after the other models finish.
+
+        The workers are started with the 'forkserver' method, so scripts which call `fit` with `num_parallel_models` must be guarded with `if __name__ == '__main__':`.
+        """
+        time_start = time.time()
+        models = [self.load_model(model, use_cache=False) if isinstance(model, str) else model for model in models]
+        models_gpu = [model for model in models if self._get_model_num_gpus(model) > 0]
+        models_cpu = [model for model in models if model not in models_gpu]
+        num_cpus = get_num_cpus_budget()
+        data_mem_size = sum(data.memory_usage(deep=True).sum() for data in [X, X_val, X_unlabeled] if data is not None)
+        # Very rough guess of the memory of a worker: a copy of the data, the sample weight extraction and preprocessing copies of it and the model itself
+        worker_mem_size = data_mem_size * 4
+        num_workers = self._get_num_parallel_workers(num_parallel_models=num_parallel_models, num_models=len(models_cpu), num_cpus=num_cpus, worker_mem_size=worker_mem_size)
+
+        if num_workers <= 1:
+            return self._train_multi_fold(X, y, models, time_limit=time_limit, time_split=time_split, X_val=X_val, y_val=y_val, X_unlabeled=X_unlabeled, stack_name=stack_name, level=level, **kwargs)
+        worker_fit_kwargs = {key: kwargs[key] for key in ['k_fold', 'k_fold_start', 'k_fold_end', 'n_repeats', 'n_repeat_start', 'ens_sample_weight'] if key in kwargs}
+        if time_limit is not None and len(models) > 0:
+            time_limit_model_split = time_limit / len(models)
+        else:
+            time_limit_model_split = time_limit
+        num_cells = self._get_fit_num_cells(X, **kwargs)
+        time_budget_planner = self.get_time_budget_planner()
+        fit_costs = [time_budget_planner.predict_cost(self._get_model_type_inner(model).__name__, num_cells) for model in models_cpu]
+
+        import multiprocessing
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+        multiprocessing_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        logger.log(20, f'Fitting {len(models_cpu)} models with {num_workers} models in parallel, sharing {num_cpus} CPUs ...')
+        trainer_worker = copy.copy(self)  # Workers only fit and save models, they never register them
+        trainer_worker.models = {}
+        trainer_worker.low_memory = True
+        model_names_trained = dict()
+        models_pending = list(range(len(models_cpu)))
+        models_running = dict()
+        num_cpus_free = num_cpus
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=multiprocessing.get_context(multiprocessing_method),
+                                 initializer=_init_parallel_fit_worker, initargs=(trainer_worker, X, y, X_val, y_val, X_unlabeled, logging.getLogger().level)) as executor:
+            while models_pending or models_running:
+                while models_pending and len(models_running) < num_workers:
+                    if models_running and psutil.virtual_memory().available < worker_mem_size:
+                        break  # Wait for a running model to finish
+                    if num_cpus_free < 1:
+                        break  # Wait for a running model to free its CPUs, the CPUs of all running models never exceed the CPU budget
+                    i = models_pending.pop(0)
+                    model = models_cpu[i]
+                    num_cpus_model = max(1, num_cpus_free // min(num_workers - len(models_running), len(models_pending) + 1))
+                    if time_split:
+                        time_left = time_limit_model_split
+                    elif time_limit is None:
+                        time_left = None
+                    else:
+                        time_left_total = time_limit - (time.time() - time_start)
+                        time_left = allocate_time_budget(time_left_total * num_workers, [fit_costs[i]] + [fit_costs[j] for j in models_pending])
+                        time_left = min(time_left_total, time_left)
+                    future = executor.submit(_fit_and_save_parallel, model=model, num_cpus=num_cpus_model, time_limit=time_left, fit_kwargs=worker_fit_kwargs)
+                    models_running[future] = (i, model.name, num_cpus_model)
+                    num_cpus_free -= num_cpus_model
+                futures_done, _ = wait(models_running, return_when=FIRST_COMPLETED)
+                for future in futures_done:
+                    i, model_name, num_cpus_model = models_running.pop(future)
+                    num_cpus_free += num_cpus_model
+                    try:
+                        model_load_info = future.result()
+                    except Exception as err:
+                        logger.error(f'\tWarning: Exception caused {model_name} to fail in a worker process... Skipping this model.')
+                        logger.error(f'\t\t{err}')
+                        model_load_info = None
+                    model_names_trained[i] = []
+                    if model_load_info is not None:
+                        model_name, model_path, model_type = model_load_info
+                        model = self.load_model(model_name, path=model_path, model_type=model_type)
+                        logger.log(20, f'Fitted model: {model.name} ...')
+                        if self._add_model(model=model, stack_name=stack_name, level=level):
+                            model_names_trained[i].append(model.name)
+                            self._record_model_fit_cost(model.name, num_cells)
+                            if not self.low_memory:
+                                self.models[model.name] = model
+                        self.save()
+        models_valid = [model_name for i in range(len(models_cpu)) for model_name in model_names_trained[i]]
+        if models_gpu:
+            if time_limit is None:
+                time_limit_gpu = None
+            elif time_split:
+                time_limit_gpu = time_limit_model_split * len(models_gpu)
+            else:
+                time_limit_gpu = time_limit - (time.time() - time_start)
+            models_valid += self._train_multi_fold(X, y, models_gpu, time_limit=time_limit_gpu, time_split=time_split, X_val=X_val, y_val=y_val, X_unlabeled=X_unlabeled, stack_name=stack_name, level=level, **kwargs)
+        return models_valid
+
+    def _get_num_parallel_workers(self, num_parallel_models, num_models: int, num_cpus: int, worker_mem_size: int) -> int:
+        """
+        Returns the number of models to train concurrently, see self._train_multi_fold_parallel.
+        If `num_parallel_models='auto'`, every model is given at least 8 CPUs, as many model libraries do not scale well beyond that.
+        """
+        if num_parallel_models == 'auto':
+            num_parallel_models = num_cpus // 8
+        elif num_parallel_models < 1:
+            raise ValueError(f'num_parallel_models must be >= 1 or \'auto\', but was {num_parallel_models}')
+        num_workers = min(num_parallel_models, num_models, num_cpus)
+        if num_workers > 1 and worker_mem_size > 0:
+            num_workers_mem = int(psutil.virtual_memory().available * 0.5 / worker_mem_size)
+            if num_workers_mem < num_workers:
+                logger.log(15, f'Reducing the number of models trained in parallel from {num_workers} to {max(num_workers_mem, 1)} due to low memory.')
+                num_workers = num_workers_mem
+        return max(num_workers, 1)
+
+    @staticmethod
+    def _get_model_num_gpus(model: AbstractModel) -> int:
+        """Returns the number of GPUs model will use during fit."""
+        if isinstance(model, BaggedEnsembleModel):
+            model = model._get_model_base()
+        num_gpus = model.params_aux.get('num_gpus', 'auto')
+        if num_gpus == 'auto':
+            num_gpus = model._get_default_resources()[1]
+        return num_gpus
+
+    def _get_fit_cost_priors(self) -> dict:
+        """Returns the expected fit cost of model types in seconds per million cells, used by self.get_time_budget_planner() for model types it has not observed yet."""
+        return {}
+
+    def _get_model_type_inner(self, model: Union[str, AbstractModel]) -> type:
+        """Returns the type of model, or the type of its child models if model is a bagged ensemble."""
+        if isinstance(model, str):
+            return self.get_model_attribute(model, 'type_inner')
+        elif isinstance(model, BaggedEnsembleModel):
+            return model._child_type
+        else:
+            return type(model)
+
+    def _get_model_fit_cost(self, model: str) -> float:
+        """Returns the time in seconds model took to fit, including the time to predict its validation data."""
+        return self.get_model_attribute(model, 'fit_time') + (self.get_model_attribute(model, 'predict_time') or 0)
+
+    def _get_fit_num_cells(self, X, k_fold=None, k_fold_start=0, k_fold_end=None, n_repeats=1, n_repeat_start=0, **kwargs) -> float:
+        """Returns the number of cells (rows * columns) of X that a model is fit on in a self._train_single_full call, summed over all folds fit if bagging."""
+        num_cells = len(X) * len(X.columns)
+        if k_fold is None:
+            k_fold = self.k_fold
+        if k_fold >= 2:
+            if k_fold_end is None:
+                k_fold_end = k_fold
+            num_folds = (n_repeats - 1) * k_fold + k_fold_end - (n_repeat_start * k_fold + k_fold_start)
+            num_cells = num_cells * (k_fold - 1) / k_fold * max(num_folds, 1)
+        return num_cells
+
+    def _record_model_fit_cost(self, model: str, num_cells: float):
+        """Records the fit cost of model in the time budget planner, to better predict the cost of future models of the same type."""
+        self.get_time_budget_planner().record(self._get_model_type_inner(model).__name__, num_cells, self._get_model_fit_cost(model))
+
     def _train_multi(self, X, y, models: List[AbstractModel], hyperparameter_tune_kwargs=None, feature_prune=False, k_fold=None, n_repeats=None, n_repeat_start=0, time_limit=None, **kwargs) -> List[str]:
         """
         Train a list of models using the same data.
@@ -1248,7 +1651,6 @@ class AbstractTrainer:
         Note: Consider using public APIs instead of this.
         Returns a list of trained model names.
         """
-        time_limit_total_level = time_limit
         if k_fold is None:
             k_fold = self.k_fold
         if n_repeats is None:
@@ -1270,7 +1672,7 @@ class AbstractTrainer:
             model_names_trained = models
         if (n_repeats > 1) and self.bagged_mode and (n_repeat_start < n_repeats):
             model_names_trained = self._train_multi_repeats(X=X, y=y, models=model_names_trained,
-                                                            k_fold=k_fold, n_repeats=n_repeats, n_repeat_start=n_repeat_start, time_limit=time_limit, time_limit_total_level=time_limit_total_level, **kwargs)
+                                                            k_fold=k_fold, n_repeats=n_repeats, n_repeat_start=n_repeat_start, time_limit=time_limit, **kwargs)
         return model_names_trained
 
     def _train_multi_and_ensemble(self, X, y, X_val, y_val, hyperparameters: dict = None, X_unlabeled=None, num_stack_levels=0, time_limit=None, **kwargs) -> List[str]:
@@ -1449,6 +1851,41 @@ class AbstractTrainer:
             attribute_full = 0
         return attribute_full
 
+    def get_models_attribute_full(self, attribute, models: List[str] = None, func=sum) -> dict:
+        """
+        Returns a dictionary of model name -> self.get_model_attribute_full(model, attribute, func) for each model in `models` (all models if None).
+        The ancestors of all models are found in a single pass over the model graph instead of a graph search per model.
+        """
+        if models is None:
+            models = self.get_model_names()
+        if isinstance(attribute, dict):
+            attribute_dict = attribute
+        else:
+            attribute_dict = self.get_models_attribute_dict(attribute)
+        ancestors_dict = self._get_models_ancestors_dict()
+        attribute_full_dict = dict()
+        for model in models:
+            if not ancestors_dict[model]:
+                attribute_full_dict[model] = attribute_dict[model]
+                continue
+            attribute_lst = [attribute_dict[model]] + [attribute_dict[ancestor] for ancestor in ancestors_dict[model]]
+            if any(attribute_model is None for attribute_model in attribute_lst):
+                attribute_full_dict[model] = None
+            else:
+                attribute_full_dict[model] = func(attribute_lst)
+        return attribute_full_dict
+
+    def _get_models_ancestors_dict(self) -> dict:
+        """Returns a dictionary of model name -> set of all ancestor model names, computed in topological order so each model extends the sets of its base models."""
+        ancestors_dict = dict()
+        for model in nx.topological_sort(self.model_graph):
+            ancestors = set()
+            for base_model in self.model_graph.predecessors(model):
+                ancestors.add(base_model)
+                ancestors |= ancestors_dict[base_model]
+            ancestors_dict[model] = ancestors
+        return ancestors_dict
+
     # Returns dictionary of model name -> attribute value for the provided attribute
     def get_models_attribute_dict(self, attribute, models: list = None) -> dict:
         models_attribute_dict = nx.get_node_attributes(self.model_graph, attribute)
@@ -1516,12 +1953,14 @@ class AbstractTrainer:
         score_val_dict = self.get_models_attribute_dict('val_score')
         fit_time_marginal_dict = self.get_models_attribute_dict('fit_time')
         predict_time_marginal_dict = self.get_models_attribute_dict('predict_time')
+        fit_time_dict = self.get_models_attribute_full(attribute=fit_time_marginal_dict, models=model_names)
+        predict_time_dict = self.get_models_attribute_full(attribute=predict_time_marginal_dict, models=model_names)
         for model_name in model_names:
             score_val.append(score_val_dict[model_name])
             fit_time_marginal.append(fit_time_marginal_dict[model_name])
-            fit_time.append(self.get_model_attribute_full(model=model_name, attribute='fit_time'))
+            fit_time.append(fit_time_dict[model_name])
             pred_time_val_marginal.append(predict_time_marginal_dict[model_name])
-            pred_time_val.append(self.get_model_attribute_full(model=model_name, attribute='predict_time'))
+            pred_time_val.append(predict_time_dict[model_name])
             stack_level.append(self.get_model_level(model_name))
             can_infer.append(self.model_graph.nodes[model_name]['can_infer'])
 
@@ -1534,40 +1973,25 @@ class AbstractTrainer:
             # TODO: Add is_persisted() function to check which models are persisted in memory
             # TODO: package_dependencies, package_dependencies_full
 
-            info = self.get_info(include_model_info=True)
-            model_info = info['model_info']
-            custom_model_info = {}
-            for model_name in model_info:
-                custom_info = {}
-                bagged_info = model_info[model_name].get('bagged_info', {})
-                custom_info['num_models'] = bagged_info.get('num_child_models', 1)
-                custom_info['memory_size'] = bagged_info.get('max_memory_size', model_info[model_name]['memory_size'])
-                custom_info['memory_size_min'] = bagged_info.get('min_memory_size', model_info[model_name]['memory_size'])
-                custom_info['child_model_type'] = bagged_info.get('child_model_type', None)
-                custom_info['child_hyperparameters'] = bagged_info.get('child_hyperparameters', None)
-                custom_info['child_hyperparameters_fit'] = bagged_info.get('child_hyperparameters_fit', None)
-                custom_info['child_ag_args_fit'] = bagged_info.get('child_ag_args_fit', None)
-                custom_model_info[model_name] = custom_info
-
-            model_info_keys = ['num_features', 'model_type', 'hyperparameters', 'hyperparameters_fit', 'ag_args_fit', 'features']
-            model_info_sum_keys = []
-            for key in model_info_keys:
-                model_info_dict[key] = [model_info[model_name][key] for model_name in model_names]
-                if key in model_info_sum_keys:
-                    key_dict = {model_name: model_info[model_name][key] for model_name in model_names}
-                    model_info_dict[key + '_full'] = [self.get_model_attribute_full(model=model_name, attribute=key_dict) for model_name in model_names]
-
-            model_info_keys = ['num_models', 'memory_size', 'memory_size_min', 'child_model_type', 'child_hyperparameters', 'child_hyperparameters_fit', 'child_ag_args_fit']
+            custom_model_info = self._get_models_info_summary(models=model_names)
+            model_info_keys = ['num_features', 'model_type', 'hyperparameters', 'hyperparameters_fit', 'ag_args_fit', 'features',
+                               'num_models', 'memory_size', 'memory_size_min', 'child_model_type', 'child_hyperparameters', 'child_hyperparameters_fit', 'child_ag_args_fit']
             model_info_full_keys = {'memory_size': [('memory_size_w_ancestors', sum)], 'memory_size_min': [('memory_size_min_w_ancestors', max)], 'num_models': [('num_models_w_ancestors', sum)]}
             for key in model_info_keys:
                 model_info_dict[key] = [custom_model_info[model_name][key] for model_name in model_names]
                 if key in model_info_full_keys:
                     key_dict = {model_name: custom_model_info[model_name][key] for model_name in model_names}
                     for column_name, func in model_info_full_keys[key]:
-                        model_info_dict[column_name] = [self.get_model_attribute_full(model=model_name, attribute=key_dict, func=func) for model_name in model_names]
+                        key_full_dict = self.get_models_attribute_full(attribute=key_dict, models=model_names, func=func)
+                        model_info_dict[column_name] = [key_full_dict[model_name] for model_name in model_names]
 
-            ancestors = [list(nx.dag.ancestors(self.model_graph, model_name)) for model_name in model_names]
-            descendants = [list(nx.dag.descendants(self.model_graph, model_name)) for model_name in model_names]
+            ancestors_dict = self._get_models_ancestors_dict()
+            descendants_dict = {model_name: [] for model_name in ancestors_dict}
+            for model_name, model_ancestors in ancestors_dict.items():
+                for ancestor in model_ancestors:
+                    descendants_dict[ancestor].append(model_name)
+            ancestors = [list(ancestors_dict[model_name]) for model_name in model_names]
+            descendants = [descendants_dict[model_name] for model_name in model_names]
 
             model_info_dict['num_ancestors'] = [len(ancestor_lst) for ancestor_lst in ancestors]
             model_info_dict['num_descendants'] = [len(descendant_lst) for descendant_lst in descendants]
@@ -1677,6 +2101,36 @@ class AbstractTrainer:
 
         return info
 
+    def _get_models_info_summary(self, models: List[str]) -> dict:
+        """
+        Returns a dictionary of model name -> the fields of the model's info shown by self.leaderboard(extra_info=True), and the number of bagging repeats used to estimate inference costs.
+        The summary of a model is stored in the model graph the first time it is requested, so model info is only loaded from disk once per model.
+        It is reset whenever the model is added to the graph again or saved again, such as by `reduce_memory_size`.
+        """
+        models_missing = [model for model in models if self.model_graph.nodes[model].get('info_summary', None) is None]
+        if models_missing:
+            model_info = self.get_models_info(models_missing)
+            for model in models_missing:
+                info = model_info[model]
+                bagged_info = info.get('bagged_info', {})
+                self.model_graph.nodes[model]['info_summary'] = dict(
+                    num_features=info['num_features'],
+                    model_type=info['model_type'],
+                    hyperparameters=info['hyperparameters'],
+                    hyperparameters_fit=info['hyperparameters_fit'],
+                    ag_args_fit=info['ag_args_fit'],
+                    features=info['features'],
+                    num_models=bagged_info.get('num_child_models', 1),
+                    num_repeats=max(bagged_info.get('_n_repeats', 1), 1),
+                    memory_size=bagged_info.get('max_memory_size', info['memory_size']),
+                    memory_size_min=bagged_info.get('min_memory_size', info['memory_size']),
+                    child_model_type=bagged_info.get('child_model_type', None),
+                    child_hyperparameters=bagged_info.get('child_hyperparameters', None),
+                    child_hyperparameters_fit=bagged_info.get('child_hyperparameters_fit', None),
+                    child_ag_args_fit=bagged_info.get('child_ag_args_fit', None),
+                )
+        return {model: self.model_graph.nodes[model]['info_summary'] for model in models}
+
     def get_models_info(self, models: List[str] = None) -> dict:
         if models is None:
             models = self.get_model_names()
@@ -1718,13 +2172,144 @@ class AbstractTrainer:
                 pass
         models = self.get_model_names()
         for model in models:
-            model = self.load_model(model)
+            model = self.load_model(model, use_cache=False)
             model.reduce_memory_size(remove_fit_stack=remove_fit_stack, remove_fit=remove_fit, remove_info=remove_info, requires_save=requires_save, reduce_children=reduce_children, **kwargs)
             if requires_save:
                 self.save_model(model, reduce_memory=False)
         if requires_save:
             self.save()
 
+    def optimize_for_deployment(self, model: str = None, refit_stackers=True, delete_from_disk=True, dry_run=True) -> dict:
+        """
+        Deletes all models which are not required to predict with `model` (the best model if None).
+        If `refit_stackers=True`, the stacker models required by `model` are first refit on only their useful base models, see self._refit_stackers_on_useful_inputs.
+        Returns a report of the kept model, the deleted models, and the validation inference time and disk size of the models before and after the optimization.
+        """
+        if model is None:
+            model = self.model_best if self.model_best is not None else self.get_model_best()
+        model_orig = model
+        models_orig = self.get_model_names()
+        disk_size_dict = {model_name: self._get_model_disk_size(model_name) for model_name in models_orig}
+
+        if refit_stackers:
+            model = self._refit_stackers_on_useful_inputs(model=model, dry_run=dry_run)
+
+        models_to_keep = self.get_minimum_model_set(model)
+        models_to_delete = [model_name for model_name in self.get_model_names() if model_name not in models_to_keep]
+        for model_name in models_to_keep:
+            if model_name not in disk_size_dict:
+                disk_size_dict[model_name] = self._get_model_disk_size(model_name)
+        pred_time_val_dict = self.get_models_attribute_full(attribute='predict_time', models=[model_orig, model])
+        report = dict(
+            model=model,
+            models_deleted=[model_name for model_name in models_to_delete if model_name in models_orig],
+            pred_time_val_before=pred_time_val_dict[model_orig],
+            pred_time_val_after=pred_time_val_dict[model],
+            disk_size_before=sum(disk_size_dict[model_name] for model_name in models_orig),
+            disk_size_after=sum(disk_size_dict[model_name] for model_name in models_to_keep),
+        )
+        logger.log(20, f'Optimizing for deployment of {model}: keeping {len(models_to_keep)} of {len(models_orig)} models.')
+        if report['pred_time_val_before'] is not None and report['pred_time_val_after'] is not None:
+            logger.log(20, f'\tValidation inference time: {round(report["pred_time_val_before"], 3)}s -> {round(report["pred_time_val_after"], 3)}s (of {model_orig} before)')
+        logger.log(20, f'\tDisk size: {round(report["disk_size_before"] / 1e6, 2)} MB -> {round(report["disk_size_after"] / 1e6, 2)} MB')
+
+        self.delete_models(models_to_keep=model, delete_from_disk=delete_from_disk, dry_run=dry_run)
+        if not dry_run:
+            self.model_best = model
+            self.save()
+        return report
+
+    def _get_model_disk_size(self, model_name: str) -> int:
+        """Returns the disk size of the model `model_name` in bytes from its directory, without loading it."""
+        return get_directory_size(self.get_model_attribute(model=model_name, attribute='path'))
+
+    def _refit_stackers_on_useful_inputs(self, model: str, dry_run=False) -> str:
+        """
+        Refits the stacker models required by `model` on only the base models which contribute to their predictions,
+        so that base models which are only used by a stacker but add nothing to it no longer need to be loaded and predicted with.
+
+        The useful base models of a stacker are those with non-zero weight in an Ensemble Selection fit on the out-of-fold predictions of its base models.
+        Stackers are refit as new models with the suffix '_Pruned', in topological order, so that models depending on a refit stacker are refit on the new version.
+        Returns the name of the refit version of `model` if its validation score is not worse than the score of `model`, otherwise returns `model`.
+        If `dry_run=True`, only logs the stackers that would be refit and returns `model`.
+        """
+        if not self.bagged_mode or not self.is_data_saved:
+            logger.log(20, 'Skipping the refit of stacker models, as it requires bagged models and cached training data.')
+            return model
+        X = self.load_X()
+        y = self.load_y()
+        w = None
+        if self.weight_evaluation:
+            _, w = extract_column(X, self.sample_weight)
+            w = w.values / w.mean()
+
+        model_refit_map = dict()  # original model name -> name of the version refit on the useful inputs
+        model_set = self.get_minimum_model_set(model)
+        for model_name in nx.topological_sort(self.model_graph.subgraph(model_set)):
+            base_models = self.get_base_model_names(model_name)
+            if not base_models:
+                continue
+            base_models_new = [model_refit_map.get(base_model, base_model) for base_model in base_models]
+            level = self.get_model_level(model_name)
+            stack_name = self.get_model_attribute(model=model_name, attribute='stack_name')
+            model_type = self.get_model_attribute(model=model_name, attribute='type')
+            if issubclass(model_type, WeightedEnsembleModel):
+                # Weighted ensembles only depend on base models with non-zero weight already, they are refit if one of their base models was refit
+                if base_models_new == base_models or dry_run:
+                    continue
+                X_stack_preds = self.get_inputs_to_stacker(X, base_models=base_models_new, fit=True, use_orig_features=False)
+                if w is not None:
+                    X_stack_preds[self.sample_weight] = w
+                models_trained = self.generate_weighted_ensemble(X=X_stack_preds, y=y, level=level, base_model_names=base_models_new, stack_name=stack_name, name_suffix='_Pruned', check_if_best=False)
+            else:
+                base_models_useful = self._get_useful_base_models(base_models=base_models_new, y=y, sample_weight=w)
+                if base_models_useful == base_models:
+                    continue
+                logger.log(20, f'{model_name} uses {len(base_models_useful)} of {len(base_models)} base models, refitting on: {base_models_useful}')
+                if dry_run:
+                    continue
+                model_pruned = self._get_pruned_stacker_template(model=self.load_model(model_name), base_model_names=base_models_useful)
+                models_trained = self.stack_new_level_core(X=X, y=y, models=[model_pruned], level=level, base_model_names=base_models_useful, stack_name=stack_name)
+            if models_trained:
+                model_refit_map[model_name] = models_trained[0]
+            else:
+                logger.warning(f'Warning: Failed to refit {model_name} on its useful base models, keeping {model}.')
+                return model
+
+        if model not in model_refit_map:
+            return model
+        model_new = model_refit_map[model]
+        score_val = self.get_model_attribute(model=model, attribute='val_score')
+        score_val_new = self.get_model_attribute(model=model_new, attribute='val_score')
+        if score_val_new >= score_val:
+            logger.log(20, f'Replacing {model} (score_val={score_val}) with {model_new} (score_val={score_val_new}).')
+            return model_new
+        logger.log(20, f'Keeping {model} (score_val={score_val}), as {model_new} has a worse validation score (score_val={score_val_new}).')
+        return model
+
+    def _get_useful_base_models(self, base_models: List[str], y, sample_weight=None) -> List[str]:
+        """Returns the base models with non-zero weight in an Ensemble Selection fit on their out-of-fold predictions."""
+        model_pred_proba_dict = self.get_model_pred_proba_dict(X=None, models=base_models, fit=True)
+        ensemble_selection = EnsembleSelection(ensemble_size=100, problem_type=self.problem_type, metric=self.eval_metric)
+        ensemble_selection.fit(predictions=[model_pred_proba_dict[base_model] for base_model in base_models], labels=y, sample_weight=sample_weight)
+        return [base_model for base_model, weight in zip(base_models, ensemble_selection.weights_) if weight > 0]
+
+    def _get_pruned_stacker_template(self, model: StackerEnsembleModel, base_model_names: List[str]) -> StackerEnsembleModel:
+        """Returns an unfit copy of the stacker `model` with the suffix '_Pruned', which uses `base_model_names` as its base models."""
+        model_base = copy.deepcopy(model._get_model_base())
+        model_base.feature_metadata = self.feature_metadata  # Stack features of the new base models are added during fit
+        init_args = model._get_init_args()
+        init_args.update(dict(
+            name=model.name + '_Pruned',
+            model_base=model_base,
+            features=None,
+            base_model_names=base_model_names,
+            base_models_dict={},
+            base_model_paths_dict=self.get_models_attribute_dict(attribute='path', models=base_model_names),
+            base_model_types_dict=self.get_models_attribute_dict(attribute='type', models=base_model_names),
+        ))
+        return model.__class__(**init_args)
+
     # TODO: Also enable deletion of models which didn't succeed in training (files may still be persisted)
     #  This includes the original HPO fold for stacking
     # Deletes specified models from trainer and from disk (if delete_from_disk=True).
@@ -2020,3 +2605,23 @@ class AbstractTrainer:
         self.bagged_mode = og_bagged_mode  # TODO: Confirm if safe to train future models after training models in both bagged and non-bagged modes
         self.verbosity = og_verbosity
         return distilled_model_names
+
+
+_parallel_fit_worker_state = dict()  # Data shared by all models trained in a worker process of AbstractTrainer._train_multi_fold_parallel
+
+
+def _init_parallel_fit_worker(trainer: AbstractTrainer, X, y, X_val, y_val, X_unlabeled, log_level):
+    logging.getLogger().setLevel(log_level)
+    _parallel_fit_worker_state.update(trainer=trainer, X=X, y=y, X_val=X_val, y_val=y_val, X_unlabeled=X_unlabeled)
+
+
+def _fit_and_save_parallel(model: AbstractModel, num_cpus: int, time_limit=None, fit_kwargs: dict = None):
+    """Fits and saves model in a worker process. Returns the name, path and type of the saved model, or None if training failed."""
+    state = _parallel_fit_worker_state
+    trainer = state['trainer']
+    set_num_cpus_budget(num_cpus)
+    X, X_val, model_fit_kwargs = trainer._get_model_fit_kwargs(X=state['X'], X_val=state['X_val'], model=model, time_limit=time_limit, **fit_kwargs)
+    model = trainer._fit_and_save(X, state['y'], model, X_val, state['y_val'], X_unlabeled=state['X_unlabeled'], **model_fit_kwargs)
+    if model is None:
+        return None
+    return model.name, model.path, type(model)
@@ -6,7 +6,7 @@ import pandas as pd
 from autogluon.core.utils import generate_train_test_split
 
 from .abstract_trainer import AbstractTrainer
-from .model_presets.presets import get_preset_models
+from .model_presets.presets import get_preset_models, DEFAULT_MODEL_FIT_COST, MODEL_TYPES
 from ..trainer.model_presets.presets_distill import get_preset_models_distillation
 
 logger = logging.getLogger(__name__)
@@ -27,6 +27,9 @@ class AutoTrainer(AbstractTrainer):
                                  num_classes=num_classes, hyperparameters=hyperparameters, invalid_model_names=invalid_model_names,
                                  feature_metadata=feature_metadata, silent=silent, **kwargs)
 
+    def _get_fit_cost_priors(self) -> dict:
+        return {MODEL_TYPES[key].__name__: cost for key, cost in DEFAULT_MODEL_FIT_COST.items()}
+
     def fit(self, X, y, hyperparameters, X_val=None, y_val=None, X_unlabeled=None, feature_prune=False, holdout_frac=0.1, num_stack_levels=0, core_kwargs: dict = None, time_limit=None, **kwargs):
         for key in kwargs:
             logger.warning(f'Warning: Unknown argument passed to `AutoTrainer.fit()`. Argument: {key}')
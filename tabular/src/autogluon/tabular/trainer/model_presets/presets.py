@@ -9,7 +9,7 @@ from autogluon.core.models import AbstractModel, GreedyWeightedEnsembleModel, St
 
 from .presets_custom import get_preset_custom
 from ..utils import process_hyperparameters
-from ...models import LGBModel, CatBoostModel, XGBoostModel, RFModel, XTModel, KNNModel, LinearModel,\
+from ...models import LGBModel, CatBoostModel, XGBoostModel, RFModel, XTModel, KNNModel, LinearModel, LinearSGDModel,\
     TabularNeuralNetModel, NNFastAiTabularModel, FastTextModel, TextPredictorModel
 from ...models.tab_transformer.tab_transformer_model import TabTransformerModel
 
@@ -26,6 +26,7 @@ DEFAULT_MODEL_PRIORITY = dict(
     NN=50,
     FASTAI=45,
     LR=40,
+    LR_SGD=35,
     FASTTEXT=0,
     AG_TEXT_NN=0,
     TRANSF=0,
@@ -51,6 +52,21 @@ DEFAULT_SOFTCLASS_PRIORITY = dict(
 
 DEFAULT_CUSTOM_MODEL_PRIORITY = 0
 
+# Expected fit + validation predict time in seconds per million cells (rows * columns) of training data with default hyperparameters on a single CPU.
+# Only the ratios between models matter: They are used to split time limits between models until the actual costs of the models have been observed.
+# The out-of-fold predictions of KNN grow with the square of the rows, its cost is set for tens of thousands of rows, at which KNN is ~4x cheaper than XT when bagged.
+DEFAULT_MODEL_FIT_COST = dict(
+    RF=100,
+    XT=70,
+    KNN=18,
+    GBM=60,
+    CAT=90,
+    XGB=80,
+    NN=400,
+    FASTAI=300,
+    LR=2.5,
+)
+
 MODEL_TYPES = dict(
     RF=RFModel,
     XT=XTModel,
@@ -60,6 +76,7 @@ MODEL_TYPES = dict(
     XGB=XGBoostModel,
     NN=TabularNeuralNetModel,
     LR=LinearModel,
+    LR_SGD=LinearSGDModel,
     FASTAI=NNFastAiTabularModel,
     TRANSF=TabTransformerModel,
     AG_TEXT_NN=TextPredictorModel,
@@ -76,6 +93,7 @@ DEFAULT_MODEL_NAMES = {
     XGBoostModel: 'XGBoost',
     TabularNeuralNetModel: 'NeuralNetMXNet',
     LinearModel: 'LinearModel',
+    LinearSGDModel: 'LinearModelSGD',
     NNFastAiTabularModel: 'NeuralNetFastAI',
     TabTransformerModel: 'Transformer',
     TextPredictorModel: 'TextNeuralNetwork',
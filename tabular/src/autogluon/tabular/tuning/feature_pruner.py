@@ -1,56 +1,107 @@
-# import warnings
-# warnings.filterwarnings('ignore')
-import copy, logging
+import logging
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 
+from autogluon.core.utils import get_num_cpus_budget
+
 logger = logging.getLogger(__name__)
 
 
-# TODO: currently is buggy
 class FeaturePruner:
-    def __init__(self, model_base, threshold_baseline=0.004, is_fit=False):
+    """
+    Greedy backward feature elimination for a single model.
+
+    Each round fits the model once on the current feature subset, computes permutation importance once on the validation data,
+    and then evaluates several candidate removals (dropping the least important features) in parallel with cheap proxy models.
+    The largest removal whose proxy validation score stays within `threshold_baseline` of the proxy score of the current subset is accepted,
+    and the next round starts from it. Pruning stops once no candidate is accepted or the holdout score stopped improving for `early_stopping_rounds` rounds.
+
+    The results of every fit are cached per feature subset (the score of each proxy model, the scores and permutation importance of each fully fit model),
+    so neither a proxy model nor a full model is fit twice on the same subset, including when `tune` is called again to continue pruning.
+    The score, fit time and inference time of each fully fit subset are recorded and can be retrieved via `get_tradeoff_curve`
+    to pick a subset that trades accuracy for faster inference.
+
+    Parameters
+    ----------
+    model_base : AbstractModel
+        Model to prune features for. Copies of it are fit on the feature subsets, `model_base` itself is only used directly if `is_fit=True`.
+    threshold_baseline : float, default = 0.004
+        Maximum drop in proxy validation score (in terms of `model_base.eval_metric`, higher is better) allowed for a candidate removal to be accepted.
+    is_fit : bool, default = False
+        Whether `model_base` was already fit on all features of the data passed to `tune`. If True, the first round reuses it instead of fitting a copy.
+    proxy_hyperparameters : dict, default = None
+        Hyperparameters overriding those of `model_base` for the proxy models, such as a lower number of boosting rounds (ex: `{'num_boost_round': 50}` for LightGBM).
+    proxy_subsample_size : int, default = 10000
+        Maximum number of training rows used to fit the proxy models. If None, all rows are used.
+    fi_subsample_size : int, default = 5000
+        Maximum number of validation rows used to compute permutation importance. If None, all rows are used.
+    num_candidates : int, default = 4
+        Number of candidate removals evaluated per round. Candidates drop increasingly large fractions of the least important features.
+    num_parallel : int, default = None
+        Number of proxy models fit in parallel. The CPU budget (refer to `autogluon.core.utils.set_num_cpus_budget`) is split evenly among them.
+        If None, equal to `num_candidates + 1`, capped to the CPU budget.
+    """
+    def __init__(self, model_base, threshold_baseline=0.004, is_fit=False, proxy_hyperparameters=None, proxy_subsample_size=10000,
+                 fi_subsample_size=5000, num_candidates=4, num_parallel=None):
         self.model_base = model_base
         self.threshold_baseline = threshold_baseline
         self.is_fit = is_fit
+        self.proxy_hyperparameters = proxy_hyperparameters
+        self.proxy_subsample_size = proxy_subsample_size
+        self.fi_subsample_size = fi_subsample_size
+        self.num_candidates = num_candidates
+        self.num_parallel = num_parallel
 
-        self.best_score = 0
+        self.best_score = None
         self.best_iteration = 0
         self.features_in_iter = []
         self.score_in_iter = []
         self.valid_feature_counts = []
         self.gain_dfs = []
         self.banned_features_in_iter = []
-        self.thresholds = []
-        self.threshold = self.threshold_baseline
         self.cur_iteration = 0
         self.tuned = False
         self.early_stopping_rounds = 2
 
+        self._model_cache = dict()  # frozenset(features) -> info dict of the fully fit model, holds the model until its importance is computed
+        self._importance_cache = dict()  # frozenset(features) -> permutation importance of the fully fit model
+        self._proxy_score_cache = dict()  # frozenset(features) -> validation score of the proxy model
+
+    @property
+    def best_features(self) -> list:
+        """Feature subset with the best holdout score, available after `tune` was called."""
+        return list(self.features_in_iter[self.best_iteration])
+
+    def get_tradeoff_curve(self) -> pd.DataFrame:
+        """
+        Returns a DataFrame with one row per fully fit feature subset, sorted by number of features (descending),
+        with columns ['num_features', 'score_val', 'score_holdout', 'fit_time', 'pred_time_val', 'features'].
+        `pred_time_val` is the time in seconds taken to predict the validation data, and is the column to consider for faster inference.
+        """
+        columns = ['num_features', 'score_val', 'score_holdout', 'fit_time', 'pred_time_val', 'features']
+        rows = [{key: info[key] for key in columns} for info in self._model_cache.values()]
+        return pd.DataFrame(rows, columns=columns).sort_values(by='num_features', ascending=False).reset_index(drop=True)
+
     def evaluate(self):
-        untuned_score = self.score_in_iter[0]
-        logger.debug('untuned_score: %s' % untuned_score)
-        logger.debug('best_score: %s' % self.best_score)
-        logger.debug('best_iteration: %s' % self.best_iteration)
-
-        data_dict = {
-            'score': self.score_in_iter,
-            'feature_count': self.valid_feature_counts,
-            'threshold': self.thresholds,
-        }
-        logger.debug(self.gain_dfs[self.best_iteration])
-        z = pd.DataFrame(data=data_dict)
-        # logger.debug(z)
-        z_sorted = z.sort_values(by=['score'], ascending=False)
-        # logger.debug(z_sorted)
+        logger.log(15, f'Feature pruning of {self.model_base.name}: untuned score: {self.score_in_iter[0]}, best score: {self.best_score} (iteration {self.best_iteration}, {len(self.best_features)} features)')
+        logger.log(15, self.get_tradeoff_curve().drop(columns=['features']))
 
     # TODO: CV5 instead of holdout? Should be better
-    # TODO: Add holdout here, it is overfitting with Logistic Regression
-    def tune(self, X, y, X_val, y_val, X_holdout, y_holdout, total_runs=999):
-        objective_goal_is_negative = False  # Fixed to false if using sklearn scorers # self.model_base.problem_type == REGRESSION  # TODO: if objective function goal = lower (logloss, MAE, etc.)
-        logger.log(15, 'Feature-pruning '+str(self.model_base.name)+' for '+str(total_runs)+' runs...')
+    def tune(self, X, y, X_val, y_val, X_holdout, y_holdout, total_runs=999, time_limit=None):
+        """
+        Prunes features of `model_base` for at most `total_runs` rounds or until `time_limit` seconds have passed.
+        Proxy models and permutation importance are evaluated on (X_val, y_val), while the best feature subset is chosen by the score on (X_holdout, y_holdout).
+        Can be called again to continue pruning from the last round.
+        """
+        time_start = time.time()
+        logger.log(15, f'Feature-pruning {self.model_base.name} for {total_runs} runs...')
 
         if len(self.features_in_iter) == 0:
-            valid_features = X.columns.values
+            valid_features = list(X.columns)
         else:
             valid_features = self.features_in_iter[-1]
 
@@ -58,108 +109,145 @@ class FeaturePruner:
         iter_start = self.cur_iteration
         for iteration in range(self.cur_iteration, total_runs):
             self.cur_iteration = iteration
-            logger.debug('iteration: %s ' % iteration)
-            X_subset = X[valid_features].copy()
-            X_val_subset = X_val[valid_features].copy()
-            self.thresholds.append(self.threshold)
             self.valid_feature_counts.append(len(valid_features))
             self.features_in_iter.append(valid_features)
 
-            if self.is_fit and (iteration == iter_start):
-                model_iter = self.model_base
-            else:
-                model_iter = copy.deepcopy(self.model_base)
-                model_iter.fit(X=X_subset, y=y, X_val=X_val_subset, y_val=y_val)
-
-            banned_features = []
-
-            feature_importance = None
-            if hasattr(model_iter.model, 'feature_importances_'):
-                feature_importance = model_iter.model.feature_importances_
-            elif hasattr(model_iter.model, 'feature_importance'):
-                feature_importance = model_iter.model.feature_importance()
-
-            if feature_importance is not None:
-                a = pd.Series(data=feature_importance, index=X_subset.columns)
-                unused_features = a[a == 0]
+            reuse_model_base = self.is_fit and (iteration == iter_start) and (iteration == 0)
+            model_info = self._fit_full(valid_features, X=X, y=y, X_val=X_val, y_val=y_val, X_holdout=X_holdout, y_holdout=y_holdout, reuse_model_base=reuse_model_base)
+            cur_score = model_info['score_holdout']
+            logger.log(15, f'Iter {iteration}  Features: {len(valid_features)}  Score: {cur_score}  Score Val: {model_info["score_val"]}')
 
-                logger.log(15, 'Unused features after pruning: '+ str(list(unused_features.index)))
-                features_to_use = [feature for feature in valid_features if feature not in unused_features.index]
-                banned_features += list(unused_features.index)
-            else:
-                features_to_use = list(valid_features)
-
-            cur_score_val = model_iter.score(X=X_val_subset, y=y_val)
-            cur_score = model_iter.score(X=X_holdout[valid_features], y=y_holdout)
-
-            logger.log(15, 'Iter '+str(iteration)+'  Score: '+str(cur_score))
-            logger.log(15, 'Iter '+str(iteration)+ '  Score Val: '+str(cur_score_val))
-            if objective_goal_is_negative:
-                cur_score = -cur_score
-
-            if self.best_score == 0 or cur_score > self.best_score:
-                logger.log(15, "New best score found!")
-                logger.log(15, str(cur_score)+ ' > '+str(self.best_score))
+            if self.best_score is None or cur_score > self.best_score:
+                logger.log(15, f'New best score found! {cur_score} > {self.best_score}')
                 self.best_score = cur_score
                 self.best_iteration = iteration
                 iter_since_best = 0
             else:
                 iter_since_best += 1
-
             self.score_in_iter.append(cur_score)
 
             if iter_since_best >= self.early_stopping_rounds:
-                logger.log(15, "Early stopping on iter %s" % iteration)
-                logger.log(15, "Best Iteration: %s" % self.best_iteration)
-                self.tuned = True
+                logger.log(15, f'Early stopping on iter {iteration}, best iteration: {self.best_iteration}')
+                break
+            if len(valid_features) <= 1:
+                logger.log(15, 'No more features to remove, Feature pruning complete')
+                break
+            if time_limit is not None and (time.time() - time_start) > time_limit:
+                logger.log(15, f'Time limit reached on iter {iteration}, best iteration: {self.best_iteration}')
                 break
 
-            gain_df = model_iter.compute_feature_importance(X=X_val_subset, y=y_val, features=features_to_use)
-            if not objective_goal_is_negative:
-                gain_df = -gain_df
-
+            # One permutation importance pass per round, shared by all candidate removals
+            gain_df = self._get_feature_importance(valid_features, X_val=X_val, y_val=y_val)
             self.gain_dfs.append(gain_df)
 
-            # TODO: Save gain_df, banned_features
-
-            self.threshold = self.adjust_threshold(gain_df, self.threshold)
-
-            banned_df = gain_df.loc[gain_df >= self.threshold].index
-            banned_features += list(banned_df)
-
-            logger.log(15, "Banned features: "+str(banned_features))
+            banned_features = self._select_features_to_remove(gain_df=gain_df, features=valid_features, X=X, y=y, X_val=X_val, y_val=y_val)
+            logger.log(15, f'Banned features: {banned_features}')
             self.banned_features_in_iter.append(banned_features)
-            valid_features = [feature for feature in valid_features if feature not in banned_features]
-
-            if len(valid_features) == 0:
-                logger.log(15, 'No more features to remove, Feature pruning complete')
-                logger.log(15, "score_in_iter: "+str(self.score_in_iter))
-                self.tuned = True
+            if not banned_features:
+                logger.log(15, 'No candidate removal kept the validation score, Feature pruning complete')
                 break
+            valid_features = [feature for feature in valid_features if feature not in banned_features]
         self.tuned = True
 
-    @staticmethod
-    def adjust_threshold(gain_df, threshold):
-        if gain_df.shape[0] == 0:
-            raise BaseException('ran out of features to prune!')
-        banned_df = gain_df.loc[gain_df >= threshold].index
-        banned_features = list(banned_df)
-
-        if len(banned_features) == 0:
-            if threshold < -100000000:  # FIXME: Hacked for regression
-                raise BaseException('threshold already max!')
-            elif threshold > 0.000001:
-                threshold_new = threshold / 2
-            elif threshold > 0:
-                threshold_new = 0
-            elif threshold == 0:
-                threshold_new = -0.00000001
-            elif (threshold < 0) and (threshold > -0.0001):
-                threshold_new = threshold * 2
-            else:
-                threshold_new = gain_df.max()
-
-            logger.log(10, 'Adjusting threshold to %s' % threshold_new)
-            return FeaturePruner.adjust_threshold(gain_df=gain_df, threshold=threshold_new)
+    def _get_candidate_removals(self, gain_df: pd.Series, features: list) -> list:
+        """Returns candidate lists of features to remove, dropping increasingly large fractions of the least important features."""
+        importance = gain_df.reindex(features).fillna(0).sort_values(ascending=True)
+        num_features = len(features)
+        candidates = []
+        num_nonpositive = int((importance <= 0).sum())
+        if 0 < num_nonpositive < num_features:
+            candidates.append(num_nonpositive)
+        for i in range(1, self.num_candidates + 1):
+            frac_remove = 0.5 * i / self.num_candidates  # Never remove more than half of the features in one round
+            candidates.append(max(1, math.floor(num_features * frac_remove)))
+        candidates = sorted(set(num_remove for num_remove in candidates if num_remove < num_features))
+        return [list(importance.index[:num_remove]) for num_remove in candidates]
+
+    def _select_features_to_remove(self, gain_df, features, X, y, X_val, y_val) -> list:
+        """Evaluates candidate removals with proxy models and returns the largest removal within `threshold_baseline` of the current proxy score."""
+        candidate_removals = self._get_candidate_removals(gain_df=gain_df, features=features)
+        feature_subsets = [features] + [[feature for feature in features if feature not in removal] for removal in candidate_removals]
+        subsets_to_fit = [subset for subset in feature_subsets if frozenset(subset) not in self._proxy_score_cache]
+
+        if self.proxy_subsample_size is not None and len(X) > self.proxy_subsample_size:
+            X_proxy = X.sample(n=self.proxy_subsample_size, random_state=0)
+            y_proxy = y.loc[X_proxy.index]
+        else:
+            X_proxy, y_proxy = X, y
+        num_cpus = get_num_cpus_budget()
+        num_parallel = self.num_parallel if self.num_parallel is not None else min(len(subsets_to_fit), num_cpus)
+        num_parallel = max(1, min(num_parallel, len(subsets_to_fit)))
+        num_cpus_per_model = max(1, num_cpus // num_parallel)
+
+        def _fit_proxy(i_subset):
+            i, subset = i_subset
+            model = self._get_model(features=subset, name_suffix=f'_FP_proxy_{self.cur_iteration}_{i}', hyperparameters=self.proxy_hyperparameters)
+            model.fit(X=X_proxy[subset], y=y_proxy, X_val=X_val[subset], y_val=y_val, num_cpus=num_cpus_per_model)
+            return model.score(X=X_val[subset], y=y_val)
+
+        if num_parallel > 1:
+            with ThreadPoolExecutor(max_workers=num_parallel) as executor:
+                scores = list(executor.map(_fit_proxy, enumerate(subsets_to_fit)))
+        else:
+            scores = [_fit_proxy(i_subset) for i_subset in enumerate(subsets_to_fit)]
+        for subset, score in zip(subsets_to_fit, scores):
+            self._proxy_score_cache[frozenset(subset)] = score
+
+        score_baseline = self._proxy_score_cache[frozenset(features)]
+        banned_features = []
+        for removal, subset in zip(candidate_removals, feature_subsets[1:]):
+            score = self._proxy_score_cache[frozenset(subset)]
+            logger.log(15, f'\tRemoving {len(removal)} features: proxy score {score} (baseline {score_baseline})')
+            if score >= score_baseline - self.threshold_baseline and len(removal) > len(banned_features):
+                banned_features = removal
+        return banned_features
+
+    def _fit_full(self, features, X, y, X_val, y_val, X_holdout, y_holdout, reuse_model_base=False) -> dict:
+        """Returns the info dict of the model fully fit on `features`, fitting it only if the subset was not fit before."""
+        key = frozenset(features)
+        if key in self._model_cache:
+            return self._model_cache[key]
+        if reuse_model_base:
+            model = self.model_base
+            fit_time = model.fit_time
         else:
-            return threshold
+            model = self._get_model(features=features, name_suffix=f'_FP_{self.cur_iteration}')
+            time_fit_start = time.time()
+            model.fit(X=X[features], y=y, X_val=X_val[features], y_val=y_val)
+            fit_time = time.time() - time_fit_start
+        time_pred_start = time.time()
+        score_val = model.score(X=X_val[features], y=y_val)
+        pred_time_val = time.time() - time_pred_start
+        score_holdout = model.score(X=X_holdout[features], y=y_holdout)
+        model_info = dict(
+            model=model,
+            features=list(features),
+            num_features=len(features),
+            score_val=score_val,
+            score_holdout=score_holdout,
+            fit_time=fit_time,
+            pred_time_val=pred_time_val,
+        )
+        self._model_cache[key] = model_info
+        return model_info
+
+    def _get_feature_importance(self, features, X_val, y_val) -> pd.Series:
+        """Returns the permutation importance of the fully fit model of `features`, computed once per subset after which the model is released."""
+        key = frozenset(features)
+        if key not in self._importance_cache:
+            model = self._model_cache[key].pop('model')
+            self._importance_cache[key] = model.compute_feature_importance(X=X_val[features], y=y_val, features=features,
+                                                                           subsample_size=self.fi_subsample_size, silent=True)['importance']
+        return self._importance_cache[key]
+
+    def _get_model(self, features: list, name_suffix: str, hyperparameters: dict = None):
+        """Returns an unfit copy of `model_base` restricted to `features`."""
+        model = self.model_base.convert_to_template()
+        model.features = None
+        if model.feature_metadata is not None:
+            model.feature_metadata = model.feature_metadata.keep_features([feature for feature in features if feature in model.feature_metadata.get_features()])
+        if hyperparameters:
+            model.params.update(hyperparameters)
+        model.name = model.name + name_suffix
+        model.set_contexts(model.path_root + model.name + os.path.sep)
+        return model
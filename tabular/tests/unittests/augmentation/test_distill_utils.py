@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from autogluon.core.features.feature_metadata import FeatureMetadata
+from autogluon.tabular.augmentation.distill_utils import munge_augment, spunge_augment
+
+
+def _get_data(num_rows=200):
+    random_state = np.random.RandomState(0)
+    return pd.DataFrame({
+        'float': random_state.normal(size=num_rows),
+        'int': random_state.randint(0, 10, size=num_rows),
+        'cat': pd.Categorical(random_state.choice(['a', 'b', 'c'], size=num_rows), categories=['a', 'b', 'c', 'd']),
+    })
+
+
+@pytest.mark.parametrize('augment_func', [spunge_augment, munge_augment])
+def test_augment(augment_func):
+    X = _get_data()
+    np.random.seed(0)
+    # chunk_size smaller than the number of samples to also cover the concatenation of several chunks
+    X_aug = augment_func(X, feature_metadata=FeatureMetadata.from_df(X), num_augmented_samples=500, chunk_size=128)
+
+    assert X_aug.shape == (500, 3)
+    assert list(X_aug.index) == list(range(500))
+    assert X_aug['float'].dtype == np.float64
+    assert X_aug['int'].dtype == np.float64  # noise is added to numeric features
+    assert X_aug['cat'].dtype == X['cat'].dtype
+    assert set(X_aug['cat'].unique()) <= set(X['cat'].unique())
+    for feature in ['float', 'int']:
+        assert not X_aug[feature].isna().any()
+        feature_range = X[feature].max() - X[feature].min()
+        assert X_aug[feature].min() >= X[feature].min() - 0.5 * feature_range
+        assert X_aug[feature].max() <= X[feature].max() + 0.5 * feature_range
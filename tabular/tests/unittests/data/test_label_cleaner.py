@@ -211,3 +211,23 @@ def test_label_softclass():
     # Raise exception
     with pytest.raises(NotImplementedError):
         LabelCleaner.construct(problem_type=problem_type, y=input_labels, y_uncleaned=None)
+
+
+def test_label_cleaner_inverse_transform_as_numpy():
+    # Given
+    input_labels = pd.Series(['l1', 'l2', 'l3', 'l2'])
+    input_labels_transformed_numpy = np.array([0, 1, 2, 1])
+    input_labels_transformed_invalid = np.array([0, 3, -1])
+    expected_output_labels_invalid_inverse = np.array(['l1', np.nan, np.nan], dtype=object)
+
+    # When
+    label_cleaner = LabelCleaner.construct(problem_type=MULTICLASS, y=input_labels)
+    output_labels_inverse = label_cleaner.inverse_transform(input_labels_transformed_numpy, as_pandas=False)
+    output_labels_invalid_inverse = label_cleaner.inverse_transform(input_labels_transformed_invalid, as_pandas=False)
+
+    # Then
+    assert isinstance(output_labels_inverse, np.ndarray)
+    assert np.array_equal(input_labels.to_numpy(), output_labels_inverse)
+    assert isinstance(output_labels_invalid_inverse, np.ndarray)
+    assert pd.Series(expected_output_labels_invalid_inverse).equals(pd.Series(output_labels_invalid_inverse))
+    assert input_labels.equals(label_cleaner.inverse_transform(input_labels_transformed_numpy))
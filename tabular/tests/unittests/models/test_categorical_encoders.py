@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from autogluon.tabular.models.tabular_nn.categorical_encoders import OneHotMergeRaresHandleUnknownEncoder, OrdinalMergeRaresHandleUnknownEncoder
+
+
+def _get_data():
+    # Category counts without ties: a=5, b=4, c=3, d=2, e=1 and p=7, q=5, r=3
+    X = pd.DataFrame({
+        'f1': ['a'] * 5 + ['b'] * 4 + ['c'] * 3 + ['d'] * 2 + ['e'],
+        'f2': ['p'] * 7 + ['q'] * 5 + ['r'] * 3,
+    })
+    X = X.sample(frac=1, random_state=0).reset_index(drop=True)
+    X_test = pd.DataFrame({'f1': ['a', 'e', 'unseen', 'd'], 'f2': ['r', 'unseen', 'p', 'q']})
+    return X, X_test
+
+
+def _get_encoder(encoder_cls, **kwargs):
+    if encoder_cls == OneHotMergeRaresHandleUnknownEncoder:
+        kwargs['sparse'] = False
+    return encoder_cls(**kwargs)
+
+
+@pytest.mark.parametrize('encoder_cls,max_levels', [
+    (OneHotMergeRaresHandleUnknownEncoder, None),
+    (OneHotMergeRaresHandleUnknownEncoder, 2),
+    (OneHotMergeRaresHandleUnknownEncoder, 3),
+    (OrdinalMergeRaresHandleUnknownEncoder, 2),
+    (OrdinalMergeRaresHandleUnknownEncoder, 3),
+])
+def test_categorical_encoder_auto_matches_categories_list(encoder_cls, max_levels):
+    X, X_test = _get_data()
+    categories = [sorted(X[feature].unique()) for feature in X.columns]
+    encoder_auto = _get_encoder(encoder_cls, max_levels=max_levels).fit(X)
+    encoder_list = _get_encoder(encoder_cls, max_levels=max_levels, categories=categories).fit(X)
+    for X_transform in [X, X_test]:
+        np.testing.assert_array_equal(encoder_auto.transform(X_transform), encoder_list.transform(X_transform))
+    # Features of category dtype are encoded from their codes, unused categories are ignored
+    X_category = X.astype(pd.CategoricalDtype(['a', 'b', 'c', 'd', 'e', 'p', 'q', 'r', 'unused']))
+    encoder_category = _get_encoder(encoder_cls, max_levels=max_levels).fit(X_category)
+    np.testing.assert_array_equal(encoder_category.transform(X_test), encoder_list.transform(X_test))
+
+
+def test_categorical_encoder_nan():
+    X = pd.DataFrame({'f1': ['a', 'b', np.nan, 'a', np.nan, np.nan]})
+    X_test = pd.DataFrame({'f1': [np.nan, 'b', 'unseen']})
+    # Missing values are a category of their own, placed after the other categories
+    encoder = OneHotMergeRaresHandleUnknownEncoder(sparse=False).fit(X)
+    np.testing.assert_array_equal(encoder.transform(X_test), [[0, 0, 1], [0, 1, 0], [0, 0, 0]])
+    encoder = OrdinalMergeRaresHandleUnknownEncoder(max_levels=3).fit(X)
+    np.testing.assert_array_equal(encoder.transform(X_test), [[2], [1], [3]])
+    # With max_levels, missing values are kept or merged into the infrequent level by their count
+    encoder = OrdinalMergeRaresHandleUnknownEncoder(max_levels=1).fit(X)
+    np.testing.assert_array_equal(encoder.transform(X_test), [[0], [1], [1]])
+
+
+def test_categorical_encoder_max_levels_ties():
+    # b, c and d are tied: the frequent categories among ties are the first in category order
+    X = pd.DataFrame({'f1': ['d', 'c', 'b', 'a', 'a', 'a', 'b', 'c', 'd']})
+    X_test = pd.DataFrame({'f1': ['a', 'b', 'c', 'd', 'unseen']})
+    encoder = OneHotMergeRaresHandleUnknownEncoder(sparse=False, max_levels=2).fit(X)
+    np.testing.assert_array_equal(encoder.transform(X_test), [[1, 0, 0], [0, 1, 0], [0, 0, 1], [0, 0, 1], [0, 0, 0]])
+    encoder = OrdinalMergeRaresHandleUnknownEncoder(max_levels=2).fit(X)
+    np.testing.assert_array_equal(encoder.transform(X_test), [[0], [1], [2], [2], [2]])
@@ -1,3 +1,7 @@
+import os
+import shutil
+import uuid
+
 
 from autogluon.tabular.models.lr.lr_model import LinearModel
 
@@ -24,3 +28,55 @@ def test_linear_regression(fit_helper):
     )
     dataset_name = 'ames'
     fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args)
+
+
+def test_linear_partial_fit_binary(fit_helper):
+    fit_args = dict(
+        hyperparameters={LinearModel: {'partial_fit.chunk_size': 500}},
+    )
+    dataset_name = 'adult'
+    fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args)
+
+
+def test_linear_partial_fit_early_stopping(fit_helper, dataset_loader_helper):
+    dataset_name = 'adult'
+    train_data, test_data, dataset_info = dataset_loader_helper.load_dataset(name=dataset_name)
+    save_path = os.path.join('./datasets/', dataset_name, f'AutogluonOutput_{uuid.uuid4()}')
+    fit_args = dict(
+        hyperparameters={LinearModel: {'partial_fit.chunk_size': 500, 'partial_fit.epochs': 100, 'partial_fit.early_stopping_rounds': 1}},
+    )
+    predictor = fit_helper.fit_dataset(train_data=train_data, init_args=dict(label=dataset_info['label'], path=save_path), fit_args=fit_args, sample_size=1000)
+    try:
+        model = predictor._trainer.load_model('LinearModel')
+        # The validation data is used to stop early, and the epochs of the best epoch are used when refitting
+        assert model.params_trained['partial_fit.epochs'] < 100
+        assert 'max_epochs' not in model.params_trained
+    finally:
+        shutil.rmtree(save_path, ignore_errors=True)
+
+
+class _LinearModelNegated(LinearModel):
+    """ Negates the numeric features in `_preprocess_nonadaptive`, which the scaling of LinearModel fully absorbs. """
+    def _preprocess_nonadaptive(self, X, **kwargs):
+        X = super()._preprocess_nonadaptive(X, **kwargs)
+        numeric_features = X.select_dtypes(include='number').columns
+        X = X.copy()
+        X[numeric_features] = -X[numeric_features]
+        return X
+
+
+def test_linear_partial_fit_preprocess_nonadaptive(fit_helper, dataset_loader_helper):
+    dataset_name = 'adult'
+    train_data, test_data, dataset_info = dataset_loader_helper.load_dataset(name=dataset_name)
+    save_path = os.path.join('./datasets/', dataset_name, f'AutogluonOutput_{uuid.uuid4()}')
+    hyperparameters = {'partial_fit.chunk_size': 500}
+    fit_args = dict(
+        hyperparameters={LinearModel: hyperparameters, _LinearModelNegated: hyperparameters},
+    )
+    predictor = fit_helper.fit_dataset(train_data=train_data, init_args=dict(label=dataset_info['label'], path=save_path), fit_args=fit_args, sample_size=1000)
+    try:
+        scores = predictor.leaderboard(test_data, silent=True).set_index('model')['score_test']
+        # Training chunks must be preprocessed like the data at inference, else the negated model scores far worse
+        assert abs(scores['_LinearModelNegated'] - scores['LinearModel']) < 0.02
+    finally:
+        shutil.rmtree(save_path, ignore_errors=True)
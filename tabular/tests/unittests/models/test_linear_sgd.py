@@ -0,0 +1,35 @@
+
+from autogluon.tabular.models.lr.lr_sgd_model import LinearSGDModel
+
+
+def test_linear_sgd_binary(fit_helper):
+    fit_args = dict(
+        hyperparameters={LinearSGDModel: {}},
+    )
+    dataset_name = 'adult'
+    fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args)
+
+
+def test_linear_sgd_multiclass(fit_helper):
+    fit_args = dict(
+        hyperparameters={LinearSGDModel: {}},
+    )
+    dataset_name = 'covertype'
+    fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args)
+
+
+def test_linear_sgd_regression(fit_helper):
+    fit_args = dict(
+        hyperparameters={LinearSGDModel: {}},
+    )
+    dataset_name = 'ames'
+    fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args)
+
+
+def test_linear_sgd_parallel_binary(fit_helper):
+    fit_args = dict(
+        hyperparameters={LinearSGDModel: {'chunk_size': 200, 'num_workers': 2}},
+        ag_args_fit={'num_cpus': 2},
+    )
+    dataset_name = 'adult'
+    fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args)
@@ -1,5 +1,12 @@
 
+import os
+import shutil
+import uuid
+
+import numpy as np
+
 from autogluon.tabular.models.rf.rf_model import RFModel
+from autogluon.tabular.models.rf.rf_rapids_model import RFRapidsModel
 
 
 # TODO: Consider adding post-test dataset cleanup (not for each test, since they reuse the datasets)
@@ -25,3 +32,46 @@ def test_rf_regression(fit_helper):
     )
     dataset_name = 'ames'
     fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args)
+
+
+class _RFModelFoldVariant(RFModel):
+    # Preprocesses the data of each fold model separately, as models without fold-invariant preprocessing do
+    _fold_invariant_preprocess = False
+
+
+class _RFRapidsModelSklearn(RFRapidsModel):
+    # Runs the `_fit` of RFRapidsModel, which is overridden in a fold-invariant subclass, without requiring cuML
+    def _get_model_type(self):
+        return RFModel._get_model_type(self)
+
+
+class _RFRapidsModelSklearnFoldVariant(_RFRapidsModelSklearn):
+    _fold_invariant_preprocess = False
+
+
+def _fit_bagged_oof(fit_helper, dataset_loader_helper, model_cls, dataset_name):
+    train_data, _, dataset_info = dataset_loader_helper.load_dataset(name=dataset_name)
+    save_path = os.path.join('./datasets/', dataset_name, f'AutogluonOutput_{uuid.uuid4()}')
+    predictor = fit_helper.fit_dataset(
+        train_data=train_data,
+        init_args=dict(label=dataset_info['label'], path=save_path),
+        fit_args=dict(hyperparameters={model_cls: {'n_estimators': 20}}, num_bag_folds=3),
+        sample_size=500,
+    )
+    oof_pred_proba = predictor.get_oof_pred_proba(model=predictor.get_model_names()[0])
+    shutil.rmtree(save_path, ignore_errors=True)
+    return oof_pred_proba
+
+
+def test_rf_bagged_fold_invariant_preprocess(fit_helper, dataset_loader_helper):
+    # Fold models fit on slices of the data preprocessed once must be identical to fold models which preprocess their own data
+    for dataset_name in ['adult', 'ames']:
+        oof_pred_proba_shared = _fit_bagged_oof(fit_helper, dataset_loader_helper, RFModel, dataset_name)
+        oof_pred_proba_per_fold = _fit_bagged_oof(fit_helper, dataset_loader_helper, _RFModelFoldVariant, dataset_name)
+        assert np.allclose(oof_pred_proba_shared, oof_pred_proba_per_fold)
+
+
+def test_rf_bagged_fold_invariant_subclass_overriding_fit(fit_helper, dataset_loader_helper):
+    oof_pred_proba_shared = _fit_bagged_oof(fit_helper, dataset_loader_helper, _RFRapidsModelSklearn, 'adult')
+    oof_pred_proba_per_fold = _fit_bagged_oof(fit_helper, dataset_loader_helper, _RFRapidsModelSklearnFoldVariant, 'adult')
+    assert np.allclose(oof_pred_proba_shared, oof_pred_proba_per_fold)
@@ -1,4 +1,8 @@
+import shutil
 
+import numpy as np
+
+from autogluon.core.constants import REGRESSION
 from autogluon.tabular.models.tabular_nn.tabular_nn_model import TabularNeuralNetModel
 
 
@@ -24,3 +28,37 @@ def test_tabular_nn_regression(fit_helper):
     )
     dataset_name = 'ames'
     fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args)
+
+
+def _assert_predict_matches_dataloader(fit_helper, dataset_loader_helper, dataset_name):
+    """ Asserts that predicting directly from the processed array matches predicting via a TabularNNDataset and its DataLoader. """
+    fit_args = dict(
+        hyperparameters={TabularNeuralNetModel: {'num_epochs': 2}},
+    )
+    predictor = fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args, refit_full=False, delete_directory=False)
+    try:
+        _, test_data, _ = dataset_loader_helper.load_dataset(name=dataset_name)
+        X = predictor.transform_features(test_data.head(500))
+        model = predictor._trainer.load_model(predictor.get_model_names()[0])
+        X = model.preprocess(X)
+        predict_proba_options = [True] if model.problem_type == REGRESSION else [True, False]
+        for predict_proba in predict_proba_options:
+            y_pred = model._predict_tabular_data(new_data=X, process=True, predict_proba=predict_proba)
+            dataset = model.process_test_data(df=X, batch_size=model.batch_size, num_dataloading_workers=1)
+            y_pred_dataloader = model._predict_tabular_data(new_data=dataset, process=False, predict_proba=predict_proba)
+            assert y_pred.shape == y_pred_dataloader.shape
+            np.testing.assert_allclose(y_pred, y_pred_dataloader, rtol=1e-5, atol=1e-6)
+    finally:
+        shutil.rmtree(predictor.path, ignore_errors=True)
+
+
+def test_tabular_nn_predict_matches_dataloader_binary(fit_helper, dataset_loader_helper):
+    _assert_predict_matches_dataloader(fit_helper, dataset_loader_helper, dataset_name='adult')
+
+
+def test_tabular_nn_predict_matches_dataloader_multiclass(fit_helper, dataset_loader_helper):
+    _assert_predict_matches_dataloader(fit_helper, dataset_loader_helper, dataset_name='covertype')
+
+
+def test_tabular_nn_predict_matches_dataloader_regression(fit_helper, dataset_loader_helper):
+    _assert_predict_matches_dataloader(fit_helper, dataset_loader_helper, dataset_name='ames')
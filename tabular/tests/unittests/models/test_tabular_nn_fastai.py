@@ -1,3 +1,6 @@
+import shutil
+
+import numpy as np
 
 from autogluon.tabular.models.fastainn.tabular_nn_fastai import NNFastAiTabularModel
 
@@ -24,3 +27,49 @@ def test_tabular_nn_fastai_regression(fit_helper):
     )
     dataset_name = 'ames'
     fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args)
+
+
+def _fit_and_get_model(fit_helper, dataset_name, hyperparameters):
+    fit_args = dict(
+        hyperparameters={NNFastAiTabularModel: hyperparameters},
+    )
+    predictor = fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args, refit_full=False, delete_directory=False)
+    return predictor, predictor._trainer.load_model(predictor.get_model_names()[0])
+
+
+def _assert_predict_matches_get_preds(fit_helper, dataset_loader_helper, dataset_name):
+    """ Asserts that calling the torch module directly matches predicting with fastai's Learner.get_preds. """
+    from fastai.basic_data import DatasetType
+    from fastai.tabular import TabularList
+    from fastai.utils.mod_display import progress_disabled_ctx
+    predictor, model = _fit_and_get_model(fit_helper, dataset_name=dataset_name, hyperparameters={'epochs': 2})
+    try:
+        _, test_data, _ = dataset_loader_helper.load_dataset(name=dataset_name)
+        X = model.preprocess(predictor.transform_features(test_data.head(500)))
+        y_pred = model._predict_tensors(X)
+        model.model.data.add_test(TabularList.from_df(X, cat_names=model.cat_columns.copy(), cont_names=model.cont_columns.copy(), procs=model.procs))
+        with progress_disabled_ctx(model.model) as learner:
+            y_pred_learner, _ = learner.get_preds(ds_type=DatasetType.Test)
+        np.testing.assert_allclose(y_pred, y_pred_learner.numpy(), rtol=1e-4, atol=1e-6)
+        assert model._predict_tensors(X.head(0)).shape == (0, y_pred.shape[1])
+    finally:
+        shutil.rmtree(predictor.path, ignore_errors=True)
+
+
+def test_tabular_nn_fastai_predict_matches_get_preds_binary(fit_helper, dataset_loader_helper):
+    _assert_predict_matches_get_preds(fit_helper, dataset_loader_helper, dataset_name='adult')
+
+
+def test_tabular_nn_fastai_predict_matches_get_preds_regression(fit_helper, dataset_loader_helper):
+    _assert_predict_matches_get_preds(fit_helper, dataset_loader_helper, dataset_name='ames')
+
+
+def test_tabular_nn_fastai_smoothing_predict_proba(fit_helper, dataset_loader_helper):
+    predictor, model = _fit_and_get_model(fit_helper, dataset_name='covertype', hyperparameters={'epochs': 2, 'smoothing': 0.1})
+    try:
+        _, test_data, _ = dataset_loader_helper.load_dataset(name='covertype')
+        y_pred_proba = model.predict_proba(predictor.transform_features(test_data.head(500)))
+        assert (y_pred_proba >= 0).all()
+        np.testing.assert_allclose(y_pred_proba.sum(axis=1), 1, rtol=1e-5)
+    finally:
+        shutil.rmtree(predictor.path, ignore_errors=True)
@@ -0,0 +1,11 @@
+import subprocess
+import sys
+
+# Heavy dependencies which are only needed for specific features and must not be loaded by `import autogluon.tabular`
+DEFERRED_MODULES = ['boto3', 'distributed', 'autograd', 'requests', 'mxnet', 'torch', 'fastai', 'lightgbm', 'catboost', 'xgboost', 'faiss']
+
+
+def test_import_does_not_load_deferred_modules():
+    code = f'import sys; import autogluon.tabular; print([m for m in {DEFERRED_MODULES} if m in sys.modules])'
+    result = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    assert result.stdout.strip() == '[]'
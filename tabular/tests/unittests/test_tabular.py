@@ -30,6 +30,7 @@ import pytest
 
 import autogluon.core as ag
 from autogluon.core.constants import BINARY, MULTICLASS, REGRESSION
+from autogluon.core.utils import set_num_cpus_budget
 from autogluon.tabular import TabularDataset, TabularPredictor
 
 
@@ -89,6 +90,12 @@ def test_advanced_functionality():
     assert set(predictor.get_model_names()) == set(leaderboard_extra['model'])
     assert set(leaderboard_extra.columns).issuperset(set(leaderboard.columns))
     assert len(leaderboard) == len(leaderboard_extra)
+    # Models saved again must not keep the info cached by leaderboard(extra_info=True), as their sizes change
+    predictor.save_space(remove_data=False, remove_fit_stack=False)
+    assert all(predictor._trainer.model_graph.nodes[model]['info_summary'] is None for model in predictor.get_model_names())
+    leaderboard_extra = predictor.leaderboard(extra_info=True).set_index('model')
+    for model, info in predictor._trainer.get_models_info(predictor.get_model_names()).items():
+        assert leaderboard_extra.loc[model, 'memory_size'] == info.get('bagged_info', {}).get('max_memory_size', info['memory_size'])
     num_models = len(predictor.get_model_names())
     feature_importances = predictor.feature_importance(data=test_data)
     original_features = set(train_data.columns)
@@ -123,6 +130,10 @@ def test_advanced_functionality():
     leaderboard_loaded = predictor_loaded.leaderboard(data=test_data)
     assert len(leaderboard) == len(leaderboard_loaded)
     assert predictor_loaded.get_model_names_persisted() == []  # Assert that models were not still persisted after loading predictor
+    predictor_prefetched = TabularPredictor.load(predictor.path, prefetch_models=True)
+    assert predictor_prefetched.predict(test_data).equals(predictor_loaded.predict(test_data))
+    load_time_info = predictor_prefetched.get_load_time_info(wait_for_prefetch=True)
+    assert set(load_time_info['models_prefetched']) == set(predictor_prefetched._trainer.get_minimum_model_set(predictor_prefetched._trainer.model_best))
 
     assert(predictor.get_model_full_dict() == dict())
     predictor.refit_full()
@@ -133,6 +144,10 @@ def test_advanced_functionality():
     predictor.refit_full()  # Confirm that refit_models aren't further refit.
     assert(len(predictor.get_model_full_dict()) == num_models)
     assert(len(predictor.get_model_names()) == num_models * 2)
+    report = predictor.optimize_for_deployment()  # Test that dry-run doesn't delete models
+    assert(len(predictor.get_model_names()) == num_models * 2)
+    assert report['disk_size_after'] <= report['disk_size_before']
+    assert set(report['models_deleted']).isdisjoint(predictor._trainer.get_minimum_model_set(report['model']))
     predictor.delete_models(models_to_keep=[])  # Test that dry-run doesn't delete models
     assert(len(predictor.get_model_names()) == num_models * 2)
     predictor.predict(data=test_data)
@@ -518,6 +533,104 @@ def test_sample_weight():
 
 
 
+def test_num_parallel_models(dataset_loader_helper):
+    train_data, test_data, dataset_info = dataset_loader_helper.load_dataset(name='adult')
+    train_data = train_data.sample(n=500, random_state=0)
+    fit_args = dict(
+        hyperparameters={'GBM': {'num_boost_round': 30}, 'RF': {'n_estimators': 20}, 'KNN': {}},
+        num_bag_folds=2,
+        num_stack_levels=1,
+    )
+    set_num_cpus_budget(2)
+    try:
+        leaderboards = []
+        for num_parallel_models in [1, 2]:
+            savedir = f'./datasets/AdultIncomeBinaryClassification/AutogluonOutput_parallel_{num_parallel_models}/'
+            shutil.rmtree(savedir, ignore_errors=True)
+            predictor = TabularPredictor(label=dataset_info['label'], path=savedir).fit(train_data, num_parallel_models=num_parallel_models, **fit_args)
+            predictor.refit_full(num_parallel_models=num_parallel_models)
+            leaderboards.append(predictor.leaderboard(test_data.head(100), silent=True).set_index('model')[['score_test', 'score_val']].sort_index())
+            shutil.rmtree(savedir, ignore_errors=True)
+    finally:
+        set_num_cpus_budget(None)
+    assert len(leaderboards[1]) == 16
+    pd.testing.assert_frame_equal(leaderboards[0], leaderboards[1])
+
+
+def test_fit_extra_trainer_without_time_budget_planner(dataset_loader_helper):
+    train_data, test_data, dataset_info = dataset_loader_helper.load_dataset(name='adult')
+    train_data = train_data.head(500)
+    savedir = './datasets/AdultIncomeBinaryClassification/AutogluonOutput_fit_extra_planner/'
+    shutil.rmtree(savedir, ignore_errors=True)
+    predictor = TabularPredictor(label=dataset_info['label'], path=savedir).fit(train_data, hyperparameters={'RF': {'n_estimators': 10}})
+    # Trainers saved by older versions do not have a time budget planner
+    del predictor._trainer._time_budget_planner
+    predictor._trainer.save()
+    predictor = TabularPredictor.load(savedir)
+    predictor.fit_extra(hyperparameters={'XT': {'n_estimators': 10}}, time_limit=60)
+    assert 'ExtraTrees' in predictor.get_model_names()
+    predictor.predict(test_data.head(100), model='ExtraTrees')
+    shutil.rmtree(savedir, ignore_errors=True)
+
+def test_tight_time_limit_repeated_bagging(dataset_loader_helper, monkeypatch):
+    train_data, test_data, dataset_info = dataset_loader_helper.load_dataset(name='adult')
+    train_data = train_data.head(1000)
+    savedir = './datasets/AdultIncomeBinaryClassification/AutogluonOutput_tight_time_limit/'
+    shutil.rmtree(savedir, ignore_errors=True)
+    hyperparameters = {'RF': {'n_estimators': 20}, 'KNN': {}, 'LR': {}}
+    predictor = TabularPredictor(label=dataset_info['label'], path=savedir).fit(train_data, num_bag_folds=2, num_bag_sets=20, hyperparameters=hyperparameters, time_limit=20)
+    model_names = predictor.get_model_names()
+    for model_name in ['RandomForest_BAG_L1', 'KNeighbors_BAG_L1', 'LinearModel_BAG_L1', 'WeightedEnsemble_L2']:
+        assert model_name in model_names
+
+    # A model which fails to fit a further repeat is kept with the repeats it has already fit
+    trainer = predictor._trainer
+    n_repeats = trainer.load_model('LinearModel_BAG_L1')._n_repeats
+    monkeypatch.setattr(trainer, '_train_single_full', lambda **kwargs: [])
+    models_valid = trainer._train_multi_repeats(X=trainer.load_X(), y=trainer.load_y(), models=['LinearModel_BAG_L1'], k_fold=2,
+                                                n_repeats=n_repeats + 2, n_repeat_start=n_repeats)
+    assert models_valid == ['LinearModel_BAG_L1']
+    assert trainer.load_model('LinearModel_BAG_L1')._n_repeats == n_repeats
+    predictor.predict(test_data.head(100), model='LinearModel_BAG_L1')
+    shutil.rmtree(savedir, ignore_errors=True)
+
+
+def test_optimize_for_deployment(dataset_loader_helper):
+    train_data, test_data, dataset_info = dataset_loader_helper.load_dataset(name='adult')
+    train_data = train_data.head(500)
+    test_data = test_data.head(100)
+    savedir = './datasets/AdultIncomeBinaryClassification/AutogluonOutput_optimize_for_deployment/'
+    shutil.rmtree(savedir, ignore_errors=True)
+    hyperparameters = {'RF': {'n_estimators': 20}, 'XT': {'n_estimators': 20}, 'KNN': [{'weights': 'uniform'}, {'weights': 'distance'}], 'LR': {}}
+    predictor = TabularPredictor(label=dataset_info['label'], path=savedir).fit(train_data, num_bag_folds=2, num_stack_levels=1, hyperparameters=hyperparameters)
+    trainer = predictor._trainer
+
+    # Refits the stackers on the base models with non-zero weight
+    trainer._refit_stackers_on_useful_inputs(model='WeightedEnsemble_L3')
+    stackers_pruned = [model for model in predictor.get_model_names() if model.endswith('_Pruned') and model != 'WeightedEnsemble_L3_Pruned']
+    assert stackers_pruned
+    for stacker in stackers_pruned:
+        assert set(trainer.get_base_model_names(stacker)) < set(trainer.get_base_model_names(stacker[:-len('_Pruned')]))
+        predictor.predict(test_data, model=stacker)
+
+    models_before = predictor.get_model_names()
+    model_paths = trainer.get_models_attribute_dict(attribute='path', models=models_before)
+    report = predictor.optimize_for_deployment(model='WeightedEnsemble_L3_Pruned', refit_stackers=False, dry_run=False)
+    models_to_keep = trainer.get_minimum_model_set('WeightedEnsemble_L3_Pruned')
+    assert report['model'] == 'WeightedEnsemble_L3_Pruned'
+    assert set(report['models_deleted']) == set(models_before) - set(models_to_keep)
+    assert set(predictor.get_model_names()) == set(models_to_keep)
+    for model in report['models_deleted']:
+        assert not os.path.exists(model_paths[model])
+    assert report['disk_size_after'] < report['disk_size_before']
+    assert predictor.get_model_best() == 'WeightedEnsemble_L3_Pruned'
+    y_pred = predictor.predict(test_data)
+
+    predictor_loaded = TabularPredictor.load(predictor.path)
+    assert set(predictor_loaded.get_model_names()) == set(models_to_keep)
+    assert predictor_loaded.predict(test_data).equals(y_pred)
+    shutil.rmtree(savedir, ignore_errors=True)
+
 @pytest.mark.skip(reason="Ignored for now, since stacking is disabled without bagging.")
 def test_tabular_stack1():
     ############ Benchmark options you can set: ########################
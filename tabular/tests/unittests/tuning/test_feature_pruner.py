@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+from autogluon.core.constants import BINARY
+from autogluon.core.metrics import accuracy
+from autogluon.tabular.models.rf.rf_model import RFModel
+from autogluon.tabular.tuning.feature_pruner import FeaturePruner
+
+
+class _RFModelFitLog(RFModel):
+    """ Records the name and feature subset of every fit. """
+    fit_log = []
+
+    def _fit(self, X, y, **kwargs):
+        self.fit_log.append((self.name, frozenset(X.columns)))
+        return super()._fit(X, y, **kwargs)
+
+
+def _get_data(num_rows=900, num_noise_features=6):
+    random_state = np.random.RandomState(0)
+    X = pd.DataFrame(random_state.normal(size=(num_rows, 2 + num_noise_features)),
+                     columns=['a', 'b'] + [f'noise_{i}' for i in range(num_noise_features)])
+    y = pd.Series((X['a'] + X['b'] > 0).astype(int))
+    splits = np.array_split(np.arange(num_rows), 3)
+    return [(X.iloc[split], y.iloc[split]) for split in splits]
+
+
+def _get_pruner(tmp_path, **kwargs):
+    _RFModelFitLog.fit_log = []
+    model_base = _RFModelFitLog(path=str(tmp_path) + '/', name='RF', problem_type=BINARY, eval_metric=accuracy, hyperparameters={'n_estimators': 20})
+    return FeaturePruner(model_base=model_base, **kwargs)
+
+
+def _get_full_fits():
+    return [features for name, features in _RFModelFitLog.fit_log if '_FP_proxy_' not in name]
+
+
+def test_feature_pruner_removes_noise_features(tmp_path):
+    (X, y), (X_val, y_val), (X_holdout, y_holdout) = _get_data()
+    pruner = _get_pruner(tmp_path, threshold_baseline=0.02)
+    pruner.tune(X=X, y=y, X_val=X_val, y_val=y_val, X_holdout=X_holdout, y_holdout=y_holdout)
+
+    assert pruner.tuned
+    assert {'a', 'b'}.issubset(pruner.best_features)
+    assert len(pruner.best_features) < len(X.columns)
+    # Every round continues from the accepted removal of the previous round, so the subsets only shrink
+    for features, features_next, banned_features in zip(pruner.features_in_iter, pruner.features_in_iter[1:], pruner.banned_features_in_iter):
+        assert features_next == [feature for feature in features if feature not in banned_features]
+        assert len(features_next) < len(features)
+    assert len(pruner.get_tradeoff_curve()) == len(set(frozenset(features) for features in pruner.features_in_iter))
+
+
+def test_feature_pruner_stops_without_accepted_removal(tmp_path):
+    (X, y), (X_val, y_val), (X_holdout, y_holdout) = _get_data()
+    # Requires every removal to improve the proxy score by 1, which is impossible for accuracy
+    pruner = _get_pruner(tmp_path, threshold_baseline=-1)
+    pruner.tune(X=X, y=y, X_val=X_val, y_val=y_val, X_holdout=X_holdout, y_holdout=y_holdout)
+
+    assert pruner.banned_features_in_iter == [[]]
+    assert pruner.features_in_iter == [list(X.columns)]
+    assert pruner.best_features == list(X.columns)
+
+
+def test_feature_pruner_early_stopping(tmp_path):
+    (X, y), (X_val, y_val), (X_holdout, y_holdout) = _get_data(num_noise_features=14)
+    # Accepts any removal, so pruning only stops once the holdout score stopped improving
+    pruner = _get_pruner(tmp_path, threshold_baseline=1)
+    pruner.early_stopping_rounds = 1
+    pruner.tune(X=X, y=y, X_val=X_val, y_val=y_val, X_holdout=X_holdout, y_holdout=y_holdout)
+
+    assert len(pruner.score_in_iter) == 2
+    assert pruner.score_in_iter[1] < pruner.score_in_iter[0]
+    assert len(pruner.features_in_iter[-1]) > 1
+    assert pruner.best_iteration == 0
+    assert pruner.best_features == list(X.columns)
+
+
+def test_feature_pruner_fits_each_subset_once(tmp_path):
+    (X, y), (X_val, y_val), (X_holdout, y_holdout) = _get_data()
+    pruner = _get_pruner(tmp_path, threshold_baseline=0.02)
+    pruner.tune(X=X, y=y, X_val=X_val, y_val=y_val, X_holdout=X_holdout, y_holdout=y_holdout, total_runs=2)
+    # Continues pruning from the last round
+    pruner.tune(X=X, y=y, X_val=X_val, y_val=y_val, X_holdout=X_holdout, y_holdout=y_holdout, total_runs=4)
+
+    full_fits = _get_full_fits()
+    assert len(full_fits) == len(set(full_fits))
+    proxy_fits = [features for name, features in _RFModelFitLog.fit_log if '_FP_proxy_' in name]
+    assert len(proxy_fits) == len(set(proxy_fits))